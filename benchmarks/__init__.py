@@ -0,0 +1 @@
+"""Performance benchmarks for the CS336 helper (run with ``python -m benchmarks.conversions``)."""
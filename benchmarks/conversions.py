@@ -0,0 +1,308 @@
+"""Benchmarks for the floating-point conversion hot paths.
+
+Usage::
+
+    python -m benchmarks.conversions run                  # append a run to the history
+    python -m benchmarks.conversions run --sizes 1e3 1e8  # larger batches
+    python -m benchmarks.conversions compare              # last run vs. the one before
+    python -m benchmarks.conversions compare --baseline 0 --threshold 0.05
+
+``run`` times the scalar converters (``float_to_bin``,
+``float_to_bin_and_decimal`` and ``format_bits``) per dtype, the array path
+(``float_to_bin_and_decimal_batch`` plus ``bit_strings`` rendering) per dtype
+and batch size, a cold import of the converters in a fresh interpreter, a full script run of
+the Floating-Point Explorer page, and that page's first run in a fresh
+interpreter with and without the start-up warm-up. Every measurement is the
+best of several repeats, reported in seconds per call. Runs are appended to
+a JSON history file together with the commit, Python and NumPy versions.
+
+``compare`` lines up two runs of the history and exits with status 1 when a
+benchmark got slower than ``--threshold`` (a ratio, 0.10 = 10 %), so it can
+gate a CI job or a local tuning loop.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+DEFAULT_HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.json")
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_THRESHOLD = 0.10
+DTYPES = ("float16", "bfloat16", "float32")
+PAGE = os.path.join(ROOT, "pages", "LEC_2_Floating_Point_Explorer.py")
+
+# Scalar inputs cycled through by the scalar benchmarks: ordinary values,
+# values that round, a subnormal and the special values.
+SCALAR_VALUES = (0.1, -3.14159, 1e-7, 65504.0, 1e5, 1.0, -0.0, float("inf"), float("nan"))
+
+_IMPORT_PROBE = """
+import json, time
+start = time.perf_counter()
+from cs336_helper.floating_point.convert import float_to_bin, float_to_bin_and_decimal, format_bits
+print(json.dumps(time.perf_counter() - start))
+"""
+
+# First page run in a fresh interpreter, optionally after the warm-up that
+# serve.py performs before the server accepts sessions.
+_STARTUP_PROBE = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+if sys.argv[1] == "warm":
+    from cs336_helper.floating_point.warmup import warm_up
+    warm_up()
+start = time.perf_counter()
+app = AppTest.from_file(sys.argv[2], default_timeout=60).run()
+if app.exception:
+    raise SystemExit(app.exception[0].message)
+print(json.dumps(time.perf_counter() - start))
+"""
+
+
+def measure(func, repeat=5, min_time=0.05):
+    """Best time per call of ``func()`` in seconds.
+
+    Each of the ``repeat`` samples loops ``func`` until ``min_time`` has
+    passed, so sub-microsecond calls are not dominated by timer overhead.
+    """
+    func()  # warm caches and lazy imports outside the measurement
+    best = float("inf")
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            func()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / calls)
+    return best
+
+
+def _scalar_benchmarks(dtypes, repeat):
+    from cs336_helper.floating_point.convert import float_to_bin, float_to_bin_and_decimal, format_bits
+
+    results = {}
+    for dtype in dtypes:
+        def bin_only(dtype=dtype):
+            for value in SCALAR_VALUES:
+                float_to_bin(value, dtype)
+
+        def bin_and_decimal(dtype=dtype):
+            for value in SCALAR_VALUES:
+                float_to_bin_and_decimal(value, dtype)
+
+        bits = [float_to_bin(value, dtype)[0] for value in SCALAR_VALUES]
+
+        def grouping(bits=bits):
+            for b in bits:
+                format_bits(b)
+
+        for name, func in [("float_to_bin", bin_only), ("float_to_bin_and_decimal", bin_and_decimal),
+                           ("format_bits", grouping)]:
+            results[f"scalar/{name}/{dtype}"] = measure(func, repeat) / len(SCALAR_VALUES)
+    return results
+
+
+def _batch_benchmarks(dtypes, sizes, repeat):
+    import numpy as np
+    from cs336_helper.floating_point.batch import bit_strings, float_to_bin_and_decimal_batch
+
+    results = {}
+    rng = np.random.default_rng(0)
+    for size in sizes:
+        values = (rng.standard_normal(size) * 10.0 ** rng.uniform(-8, 8, size)).astype(np.float32)
+        for dtype in dtypes:
+            fields = float_to_bin_and_decimal_batch(values, dtype)
+            width = fields.sign_len + fields.exp_len + fields.mant_len
+            results[f"batch/float_to_bin_and_decimal/{dtype}/{size}"] = measure(
+                lambda: float_to_bin_and_decimal_batch(values, dtype), repeat)
+            results[f"batch/bit_strings/{dtype}/{size}"] = measure(lambda: bit_strings(fields.bits, width), repeat)
+            del fields
+    return results
+
+
+def _import_benchmark(repeat):
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _IMPORT_PROBE], cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout
+        samples.append(json.loads(output))
+    return {"import/convert": min(samples)}
+
+
+def _page_benchmark(repeat):
+    from streamlit.testing.v1 import AppTest
+
+    def rerun():
+        app = AppTest.from_file(PAGE, default_timeout=60).run()
+        if app.exception:
+            raise RuntimeError(f"{PAGE} raised: {app.exception[0].message}")
+
+    start = time.perf_counter()
+    rerun()
+    cold = time.perf_counter() - start
+    return {"page/explorer/first_run": cold, "page/explorer/rerun": measure(rerun, repeat, min_time=0)}
+
+
+def startup_benchmark(repeat=3):
+    """Best first-run time of the explorer in a fresh interpreter, cold and after :func:`.warm_up`."""
+    results = {}
+    for mode in ("cold", "warm"):
+        samples = []
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, "-c", _STARTUP_PROBE, mode, PAGE], cwd=ROOT, capture_output=True, text=True, check=True,
+            ).stdout
+            samples.append(json.loads(output))
+        results[f"startup/explorer/{mode}"] = min(samples)
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, dtypes=DTYPES, repeat=5, page=True, imports=True):
+    """Run the suite and return one history entry (a JSON-serialisable dict)."""
+    import numpy as np
+
+    results = {}
+    with np.errstate(over="ignore"):  # 1e5 overflows float16 on purpose
+        results.update(_scalar_benchmarks(dtypes, repeat))
+    results.update(_batch_benchmarks(dtypes, sizes, repeat))
+    if imports:
+        results.update(_import_benchmark(repeat))
+    if page:
+        results.update(_page_benchmark(repeat))
+        results.update(startup_benchmark(repeat))
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def append_history(path, entry):
+    history = load_history(path)
+    history.append(entry)
+    with open(path, "w") as f:
+        json.dump(history, f, indent=1)
+        f.write("\n")
+    return history
+
+
+def compare_runs(baseline, candidate, threshold=DEFAULT_THRESHOLD):
+    """Compare two history entries benchmark by benchmark.
+
+    Returns ``(name, baseline_seconds, candidate_seconds, ratio, status)``
+    rows sorted by name, where ``ratio`` is candidate / baseline and
+    ``status`` is ``"regression"``, ``"improvement"`` or ``"ok"``.
+    Benchmarks missing from either run are skipped.
+    """
+    rows = []
+    for name in sorted(set(baseline["results"]) & set(candidate["results"])):
+        old, new = baseline["results"][name], candidate["results"][name]
+        ratio = new / old if old > 0 else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append((name, old, new, ratio, status))
+    return rows
+
+
+def _format_seconds(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.1f} ns"
+
+
+def _describe(entry):
+    return f"{entry['timestamp']} ({entry.get('commit') or 'no commit'})"
+
+
+def _print_results(entry):
+    for name, seconds in sorted(entry["results"].items()):
+        print(f"{name:<50} {_format_seconds(seconds)}")
+
+
+def _print_comparison(rows, baseline, candidate):
+    print(f"baseline:  {_describe(baseline)}")
+    print(f"candidate: {_describe(candidate)}")
+    for name, old, new, ratio, status in rows:
+        flag = "" if status == "ok" else f"  <-- {status}"
+        print(f"{name:<50} {_format_seconds(old)} -> {_format_seconds(new)}  x{ratio:5.2f}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the floating-point conversion hot paths.")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON history file (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the suite and append the results to the history")
+    run.add_argument("--sizes", nargs="+", type=float, default=DEFAULT_SIZES,
+                     help="batch sizes, e.g. 1e3 1e8 (default: 1e3 to 1e6)")
+    run.add_argument("--dtypes", nargs="+", default=DTYPES)
+    run.add_argument("--repeat", type=int, default=5, help="best-of repeats per benchmark")
+    run.add_argument("--no-page", action="store_true", help="skip the Streamlit page rerun")
+    run.add_argument("--no-import", action="store_true", help="skip the fresh-interpreter import timing")
+    run.add_argument("--no-save", action="store_true", help="print the results without recording them")
+
+    compare = commands.add_parser("compare", help="compare two runs from the history")
+    compare.add_argument("--baseline", type=int, default=-2, help="history index of the baseline run")
+    compare.add_argument("--candidate", type=int, default=-1, help="history index of the candidate run")
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                         help="slowdown ratio flagged as a regression (default: %(default)s)")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        entry = run_benchmarks(
+            sizes=[int(size) for size in args.sizes], dtypes=args.dtypes, repeat=args.repeat,
+            page=not args.no_page, imports=not args.no_import,
+        )
+        _print_results(entry)
+        if not args.no_save:
+            append_history(args.history, entry)
+        return 0
+
+    history = load_history(args.history)
+    try:
+        baseline, candidate = history[args.baseline], history[args.candidate]
+    except IndexError:
+        parser.error(f"{args.history} has {len(history)} run(s); need the baseline and candidate indices to exist")
+    rows = compare_runs(baseline, candidate, args.threshold)
+    _print_comparison(rows, baseline, candidate)
+    return 1 if any(row[4] == "regression" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
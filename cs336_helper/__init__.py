@@ -0,0 +1 @@
+"""Reusable, UI-independent helpers behind the Stanford CS336 Helper pages."""
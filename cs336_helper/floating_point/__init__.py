@@ -0,0 +1,82 @@
+"""Numeric core of the IEEE 754 Floating-Point Explorer.
+
+Everything here works without Streamlit, so it can be imported by batch jobs
+and tests as well as by the pages. Submodules (and NumPy with them) are only
+imported when one of their names is first accessed, which keeps
+``import cs336_helper.floating_point`` nearly free.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    "format_bits": "convert",
+    "float_to_bin": "convert",
+    "float_to_bin_and_decimal": "convert",
+    "LAYOUTS": "batch",
+    "BatchFields": "batch",
+    "bit_strings": "batch",
+    "float_to_bin_and_decimal_batch": "batch",
+    "ROUNDING_MODES": "bfloat16",
+    "float32_to_bfloat16": "bfloat16",
+    "bfloat16_to_float32": "bfloat16",
+    "PrecisionStats": "analyzer",
+    "analyze_array": "analyzer",
+    "analyze_file": "analyzer",
+    "open_tensor_file": "analyzer",
+    "parallel_analyze": "parallel",
+    "CLASSES": "tables",
+    "LookupTable": "tables",
+    "lookup_table": "tables",
+    "decode_payloads": "tables",
+    "classify_payloads": "tables",
+    "FloatFormat": "formats",
+    "register_format": "formats",
+    "get_format": "formats",
+    "available_formats": "formats",
+    "encode": "formats",
+    "decode": "formats",
+    "classify": "formats",
+    "error_sweep": "sweep",
+    "comparison_row": "cache",
+    "special_value_rows": "cache",
+    "configure_cache": "cache",
+    "cache_info": "cache",
+    "Simulation": "arith",
+    "simulate_sum": "arith",
+    "simulate_dot": "arith",
+    "simulate_matmul": "arith",
+    "BitFieldView": "bitview",
+    "group_bit_strings": "bitview",
+    "ComparisonTable": "comparison",
+    "comparison_table": "comparison",
+    "parse_values": "comparison",
+    "convert_stream": "service",
+    "make_server": "service",
+    "FileProfile": "profiler",
+    "read_index": "profiler",
+    "file_fingerprint": "profiler",
+    "profile_file": "profiler",
+    "profile_rows": "profiler",
+    "prometheus_text": "timing",
+    "make_metrics_server": "timing",
+    "warm_up": "warmup",
+    "Neighbors": "neighbors",
+    "ulp_distance": "neighbors",
+    "rounding_distance": "neighbors",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,184 @@
+"""Streaming precision statistics for tensors stored on disk.
+
+A weight file is opened with ``np.memmap`` (or ``np.load(mmap_mode="r")`` for
+``.npy``) and walked in fixed-size chunks. Each chunk goes through
+:func:`float_to_bin_and_decimal_batch` for every target format and is folded
+into a :class:`PrecisionStats` accumulator, so peak memory depends on the
+chunk size only, never on the size of the file.
+"""
+
+import math
+
+import numpy as np
+
+from .batch import LAYOUTS, float_to_bin_and_decimal_batch
+from .bfloat16 import bfloat16_to_float32
+
+TARGETS = ("float16", "bfloat16", "float32")
+
+# Raw dtypes a weight file can be stored in. bfloat16 files hold uint16 payloads.
+RAW_DTYPES = ("float32", "float16", "bfloat16", "float64")
+
+# Elements per chunk: about 50 MB of temporaries at the peak.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def _add_exact(partials, x):
+    # Shewchuk's algorithm (as used by math.fsum): keep a list of
+    # non-overlapping partial sums that represent the running total exactly.
+    # Merging accumulators then gives the same total in any order.
+    i = 0
+    for y in partials:
+        if abs(x) < abs(y):
+            x, y = y, x
+        hi = x + y
+        lo = y - (hi - x)
+        if lo:
+            partials[i] = lo
+            i += 1
+        x = hi
+    partials[i:] = [x]
+
+
+class FormatStats:
+    """Counters for casting a stream of values to one target format."""
+
+    def __init__(self, dtype):
+        self.dtype = dtype
+        exp_len = LAYOUTS[dtype][1]
+        self.exponent_hist = np.zeros(1 << exp_len, dtype=np.int64)
+        self.subnormal = 0
+        self.overflow = 0
+        self.underflow = 0
+        self.inexact = 0
+        self.max_rel_error = 0.0
+        self.rel_error_count = 0
+        self._rel_error_partials = []
+
+    @property
+    def mean_rel_error(self):
+        if not self.rel_error_count:
+            return 0.0
+        return math.fsum(self._rel_error_partials) / self.rel_error_count
+
+    def update(self, source, fields):
+        """Fold one chunk of float64 ``source`` values and their batch ``fields`` in."""
+        max_exp = (1 << fields.exp_len) - 1
+        self.exponent_hist += np.bincount(fields.exponent.ravel(), minlength=max_exp + 1)
+        self.subnormal += int(np.count_nonzero((fields.exponent == 0) & (fields.mantissa != 0)))
+
+        stored = fields.decimal.astype(np.float64)
+        target_inf = (fields.exponent == max_exp) & (fields.mantissa == 0)
+        finite_nonzero = np.isfinite(source) & (source != 0)
+        self.overflow += int(np.count_nonzero(finite_nonzero & target_inf))
+        self.underflow += int(np.count_nonzero(finite_nonzero & (stored == 0)))
+
+        measured = finite_nonzero & ~target_inf
+        self.inexact += int(np.count_nonzero(measured & (stored != source)))
+        count = int(np.count_nonzero(measured))
+        if count:
+            # Work on the whole chunk in place and reduce with ``where=``:
+            # cheaper than gathering the measured elements into copies.
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rel_error = np.subtract(source, stored)
+                np.abs(rel_error, out=rel_error)
+                rel_error /= np.abs(source)
+            self.max_rel_error = max(self.max_rel_error, float(np.max(rel_error, where=measured, initial=0.0)))
+            self.rel_error_count += count
+            _add_exact(self._rel_error_partials, float(np.sum(rel_error, where=measured)))
+
+    def merge(self, other):
+        """Add the counters of ``other`` (same dtype) into this accumulator."""
+        self.exponent_hist += other.exponent_hist
+        self.subnormal += other.subnormal
+        self.overflow += other.overflow
+        self.underflow += other.underflow
+        self.inexact += other.inexact
+        self.max_rel_error = max(self.max_rel_error, other.max_rel_error)
+        self.rel_error_count += other.rel_error_count
+        for partial in other._rel_error_partials:
+            _add_exact(self._rel_error_partials, partial)
+        return self
+
+    def summary(self):
+        return {
+            "Type": self.dtype,
+            "Subnormal": self.subnormal,
+            "Overflow": self.overflow,
+            "Underflow": self.underflow,
+            "Inexact": self.inexact,
+            "Max rel. error": self.max_rel_error,
+            "Mean rel. error": self.mean_rel_error,
+        }
+
+
+class PrecisionStats:
+    """Precision statistics accumulated over every chunk of a tensor."""
+
+    def __init__(self, targets=TARGETS):
+        self.count = 0
+        self.nan = 0
+        self.formats = {dtype: FormatStats(dtype) for dtype in targets}
+
+    def update(self, chunk):
+        """Fold one chunk of floating-point values into the statistics."""
+        chunk = np.asarray(chunk).ravel()
+        source = chunk.astype(np.float64)
+        self.count += int(chunk.size)
+        self.nan += int(np.count_nonzero(np.isnan(source)))
+        for dtype, stats in self.formats.items():
+            stats.update(source, float_to_bin_and_decimal_batch(chunk, dtype))
+        return self
+
+    def merge(self, other):
+        """Add the statistics of ``other`` into this accumulator."""
+        self.count += other.count
+        self.nan += other.nan
+        for dtype, stats in self.formats.items():
+            stats.merge(other.formats[dtype])
+        return self
+
+    def summary(self):
+        return [stats.summary() for stats in self.formats.values()]
+
+
+def open_tensor_file(path, dtype="float32", offset=0):
+    """Memory-map a weight file without reading it.
+
+    ``.npy`` files carry their own dtype and shape; anything else is treated as
+    a flat raw buffer of ``dtype`` starting ``offset`` bytes into the file.
+    bfloat16 data is mapped as its ``uint16`` payloads.
+    """
+    if str(path).endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    if dtype not in RAW_DTYPES:
+        raise ValueError(f"Unsupported raw dtype {dtype!r}; expected one of {RAW_DTYPES}")
+    storage = np.uint16 if dtype == "bfloat16" else np.dtype(dtype)
+    return np.memmap(path, dtype=storage, mode="r", offset=offset)
+
+
+def iter_chunks(array, chunk_size=DEFAULT_CHUNK_SIZE, start=0, stop=None):
+    """Yield consecutive slices of the flattened ``array`` as in-memory copies.
+
+    A ``uint16`` array is taken to hold bfloat16 payloads and is decoded.
+    """
+    flat = array.reshape(-1, order="A")
+    stop = flat.size if stop is None else min(stop, flat.size)
+    for begin in range(start, stop, chunk_size):
+        chunk = np.array(flat[begin:min(begin + chunk_size, stop)])
+        if chunk.dtype == np.uint16:
+            chunk = bfloat16_to_float32(chunk)
+        yield chunk
+
+
+def analyze_array(array, chunk_size=DEFAULT_CHUNK_SIZE, targets=TARGETS):
+    """Accumulate :class:`PrecisionStats` over ``array`` one chunk at a time."""
+    stats = PrecisionStats(targets)
+    for chunk in iter_chunks(array, chunk_size):
+        stats.update(chunk)
+    return stats
+
+
+def analyze_file(path, dtype="float32", offset=0, chunk_size=DEFAULT_CHUNK_SIZE, targets=TARGETS):
+    """Memory-map ``path`` and stream it through :func:`analyze_array`."""
+    return analyze_array(open_tensor_file(path, dtype, offset), chunk_size, targets)
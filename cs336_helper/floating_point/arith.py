@@ -0,0 +1,230 @@
+"""Simulated low-precision arithmetic: sums, dot products and matmuls.
+
+Inputs are rounded to an input format (float16, bfloat16, float32 or
+float64), and every addition and multiplication then rounds its result to
+the accumulator format, one operation at a time, in the chosen reduction
+order:
+
+* ``"sequential"``: a running sum from the first term to the last.
+* ``"pairwise"``: a balanced binary tree of additions.
+* ``"kahan"``: a running sum with Kahan compensation, the compensation
+  itself also kept in the accumulator format.
+* ``"blocked"``: sequential sums over blocks of ``block_size`` terms, then a
+  sequential sum of the block results (the split-K pattern of GPU kernels).
+
+Values are carried as float32 (or float64 for a float64 accumulator) and
+rounded after each operation with the same kernels the explorer uses:
+NumPy's float16 cast and :func:`.float32_to_bfloat16`. Products are formed
+in float64, which is exact for 16- and 32-bit inputs. float64 values
+headed for bfloat16 are first rounded to float32 *to odd*: truncated, with
+the last bit set when anything was cut off. That keeps the final rounding
+single, because float32 has more than two extra bits.
+
+Sums of two 16-bit values are computed in float32, and products of float64
+inputs in float64, and then rounded to the accumulator. The intermediate
+format has at least ``2p + 2`` bits for a ``p``-bit accumulator, so that
+second rounding matches a single rounding of the exact value. Simulated
+operations are therefore correctly rounded for every dtype combination
+here, but the results are not bit-for-bit those of any particular
+hardware.
+
+The reductions loop over the reduced axis only. Each step handles all output
+elements at once, so a matmul costs ``K`` array operations over ``M x N``
+values.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .bfloat16 import bfloat16_to_float32, float32_to_bfloat16
+
+DTYPES = ("float16", "bfloat16", "float32", "float64")
+REDUCTIONS = ("sequential", "pairwise", "kahan", "blocked")
+DEFAULT_BLOCK_SIZE = 32
+
+# Upper bound on the number of products materialised at once by simulate_matmul.
+MATMUL_TILE_ELEMENTS = 1 << 22
+
+
+class Simulation(namedtuple("Simulation", ["result", "reference", "input_reference", "abs_error", "rel_error"])):
+    """Outcome of a simulated computation, all arrays float64.
+
+    ``reference`` is the float64 result on the original inputs and
+    ``input_reference`` the float64 result on the inputs after rounding to the
+    input format. Their difference is the error caused by storing the inputs
+    in that format. The remaining error, between ``result`` and
+    ``input_reference``, comes from the low-precision accumulation.
+    ``abs_error`` and ``rel_error`` compare ``result`` against ``reference``.
+    """
+
+    __slots__ = ()
+
+    @property
+    def max_rel_error(self):
+        return float(np.nanmax(self.rel_error)) if self.rel_error.size else 0.0
+
+    @property
+    def mean_rel_error(self):
+        return float(np.nanmean(self.rel_error)) if self.rel_error.size else 0.0
+
+
+def _to_float32_odd(values):
+    # Round to float32 toward zero, then set the last bit if the result is inexact.
+    values = np.asarray(values, dtype=np.float64)
+    nearest = values.astype(np.float32)
+    bits = nearest.view(np.uint32)
+    inexact = (nearest != values) & ~np.isnan(values)
+    rounded_away = inexact & (np.abs(nearest.astype(np.float64)) > np.abs(values))
+    bits = np.where(rounded_away, bits - np.uint32(1), bits) | inexact.astype(np.uint32)
+    return bits.view(np.float32)
+
+
+def round_to(values, dtype):
+    """Round ``values`` to ``dtype`` (nearest, ties to even), with a single rounding.
+
+    The result is float64 for ``"float64"`` and float32 otherwise, so it can
+    be fed straight back into NumPy arithmetic.
+    """
+    values = np.asarray(values)
+    with np.errstate(over="ignore", invalid="ignore"):
+        if dtype == "float16":
+            return values.astype(np.float16).astype(np.float32)
+        if dtype == "bfloat16":
+            if values.dtype != np.float32:
+                values = _to_float32_odd(values)
+            return bfloat16_to_float32(float32_to_bfloat16(values))
+        if dtype == "float32":
+            return values.astype(np.float32)
+        if dtype == "float64":
+            return values.astype(np.float64)
+    raise ValueError(f"Unsupported dtype {dtype!r}; expected one of {DTYPES}")
+
+
+def _check_args(input_dtype, accumulator, order, block_size):
+    if input_dtype not in DTYPES:
+        raise ValueError(f"Unsupported input dtype {input_dtype!r}; expected one of {DTYPES}")
+    if accumulator not in DTYPES:
+        raise ValueError(f"Unsupported accumulator {accumulator!r}; expected one of {DTYPES}")
+    if order not in REDUCTIONS:
+        raise ValueError(f"Unknown reduction order {order!r}; expected one of {REDUCTIONS}")
+    if block_size < 1:
+        raise ValueError("block_size must be at least 1")
+
+
+def _sequential(terms, rnd):
+    total = terms[0]
+    for term in terms[1:]:
+        total = rnd(total + term)
+    return total
+
+
+def _pairwise(terms, rnd):
+    # Add neighbouring pairs level by level; an odd term out moves up unchanged.
+    while len(terms) > 1:
+        paired = rnd(terms[0:len(terms) - 1:2] + terms[1::2])
+        terms = np.concatenate([paired, terms[-1:]]) if len(terms) % 2 else paired
+    return terms[0]
+
+
+def _kahan(terms, rnd):
+    total = terms[0]
+    compensation = np.zeros_like(total)
+    for term in terms[1:]:
+        y = rnd(term - compensation)
+        t = rnd(total + y)
+        compensation = rnd(rnd(t - total) - y)
+        total = t
+    return total
+
+
+def _blocked(terms, rnd, block_size):
+    # Every block runs its sequential sum at the same time, one position per step.
+    n = len(terms)
+    full = n - n % block_size
+    partials = []
+    if full:
+        blocks = terms[:full].reshape((full // block_size, block_size) + terms.shape[1:])
+        partials.extend(_sequential(np.moveaxis(blocks, 1, 0), rnd))
+    if full < n:
+        partials.append(_sequential(terms[full:], rnd))
+    return _sequential(partials, rnd)
+
+
+def _reduce(terms, accumulator, order, block_size):
+    # ``terms`` holds the reduced axis first and is already rounded to the accumulator.
+    if len(terms) == 0:
+        return np.zeros(terms.shape[1:])
+
+    def rnd(values):
+        return round_to(values, accumulator)
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        if order == "sequential":
+            return _sequential(terms, rnd)
+        if order == "pairwise":
+            return _pairwise(terms, rnd)
+        if order == "kahan":
+            return _kahan(terms, rnd)
+        return _blocked(terms, rnd, block_size)
+
+
+def _simulation(result, reference, input_reference):
+    result = np.asarray(result, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        abs_error = np.abs(result - reference)
+        rel_error = abs_error / np.abs(reference)
+    rel_error = np.where(abs_error == 0, 0.0, rel_error)
+    return Simulation(result, reference, input_reference, abs_error, rel_error)
+
+
+def simulate_sum(values, input_dtype="bfloat16", accumulator="float32", order="sequential",
+                 block_size=DEFAULT_BLOCK_SIZE, axis=-1):
+    """Sum ``values`` along ``axis`` in simulated low precision."""
+    _check_args(input_dtype, accumulator, order, block_size)
+    exact = np.moveaxis(np.asarray(values, dtype=np.float64), axis, 0)
+    inputs = round_to(exact, input_dtype)
+    result = _reduce(round_to(inputs, accumulator), accumulator, order, block_size)
+    return _simulation(result, exact.sum(axis=0), inputs.astype(np.float64).sum(axis=0))
+
+
+def simulate_dot(x, y, input_dtype="bfloat16", accumulator="float32", order="sequential",
+                 block_size=DEFAULT_BLOCK_SIZE):
+    """Dot products of ``x`` and ``y`` over their last axis in simulated low precision.
+
+    ``x`` and ``y`` broadcast against each other, so a stack of vectors
+    yields one dot product per row. Each product is rounded to the
+    accumulator before it is added.
+    """
+    _check_args(input_dtype, accumulator, order, block_size)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    qx, qy = round_to(x, input_dtype), round_to(y, input_dtype)
+    terms = round_to(np.moveaxis(qx.astype(np.float64) * qy, -1, 0), accumulator)
+    result = _reduce(terms, accumulator, order, block_size)
+    reference = (x * y).sum(axis=-1)
+    input_reference = (qx.astype(np.float64) * qy.astype(np.float64)).sum(axis=-1)
+    return _simulation(result, reference, input_reference)
+
+
+def simulate_matmul(a, b, input_dtype="bfloat16", accumulator="float32", order="sequential",
+                    block_size=DEFAULT_BLOCK_SIZE):
+    """``a @ b`` for 2-D ``a`` (M x K) and ``b`` (K x N) in simulated low precision.
+
+    Output rows are processed in tiles so that at most
+    :data:`MATMUL_TILE_ELEMENTS` rounded products are held at once.
+    """
+    _check_args(input_dtype, accumulator, order, block_size)
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    if a.ndim != 2 or b.ndim != 2 or a.shape[1] != b.shape[0]:
+        raise ValueError(f"Cannot multiply shapes {a.shape} and {b.shape}")
+    qa, qb = round_to(a, input_dtype), round_to(b, input_dtype)
+    (m, k), n = a.shape, b.shape[1]
+    result = np.empty((m, n))
+    rows = max(1, MATMUL_TILE_ELEMENTS // max(k * n, 1))
+    for start in range(0, m, rows):
+        # products[k, i, j] = a[i, k] * b[k, j]
+        products = qa[start:start + rows].T[:, :, None].astype(np.float64) * qb[:, None, :]
+        result[start:start + rows] = _reduce(round_to(products, accumulator), accumulator, order, block_size)
+    return _simulation(result, a @ b, qa.astype(np.float64) @ qb.astype(np.float64))
@@ -0,0 +1,102 @@
+"""Vectorized counterpart of the explorer's scalar ``float_to_bin_and_decimal``.
+
+The scalar function handles one Python number per call and goes through
+``tobytes``/``frombuffer`` and string formatting for every value. The batch
+entry point below does the same decomposition for a whole array at once using
+integer views, so the per-element cost is a handful of NumPy ufunc passes.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .bfloat16 import bfloat16_to_float32, float32_to_bfloat16
+
+# dtype -> (sign bits, exponent bits, mantissa bits), same order as the
+# lengths returned by the scalar converters.
+LAYOUTS = {
+    "float16": (1, 5, 10),
+    "bfloat16": (1, 8, 7),
+    "float32": (1, 8, 23),
+}
+
+BatchFields = namedtuple(
+    "BatchFields",
+    ["bits", "sign", "exponent", "mantissa", "decimal", "sign_len", "exp_len", "mant_len"],
+)
+BatchFields.__doc__ = """Array-backed result of :func:`float_to_bin_and_decimal_batch`.
+
+``bits`` holds the raw bit patterns (``uint16`` or ``uint32``), ``sign``,
+``exponent`` and ``mantissa`` the integer value of each field, and ``decimal``
+the value actually stored by the format. All arrays share the input's shape.
+"""
+
+
+def float_to_bin_and_decimal_batch(values, dtype):
+    """Decompose every element of ``values`` into its ``dtype`` bit fields.
+
+    ``values`` may be anything ``np.asarray`` accepts, of any shape. The result
+    matches :func:`float_to_bin_and_decimal` element by element: ``bits`` is
+    the integer form of its bit string and ``decimal`` equals its decoded value.
+    When ``values`` already has the target dtype, ``bits`` and ``decimal`` are
+    views of it rather than copies. Other formats from the registry in
+    :mod:`.formats` go through its generic encoder and decode to float64.
+    """
+    if dtype not in LAYOUTS:
+        return _generic_batch(values, dtype)
+    sign_len, exp_len, mant_len = LAYOUTS[dtype]
+    values = np.asarray(values)
+
+    # Overflow to infinity is the expected outcome for out-of-range inputs.
+    with np.errstate(over="ignore", invalid="ignore"):
+        if dtype == "float16":
+            decimal = values.astype(np.float16, copy=False)
+            bits = decimal.view(np.uint16)
+        elif dtype == "bfloat16":
+            bits = float32_to_bfloat16(values)
+            decimal = bfloat16_to_float32(bits)
+        else:
+            decimal = values.astype(np.float32, copy=False)
+            bits = decimal.view(np.uint32)
+
+    width = sign_len + exp_len + mant_len
+    sign = bits >> (width - 1)
+    exponent = (bits >> mant_len) & ((1 << exp_len) - 1)
+    mantissa = bits & ((1 << mant_len) - 1)
+    return BatchFields(bits, sign, exponent, mantissa, decimal, sign_len, exp_len, mant_len)
+
+
+def _generic_batch(values, dtype):
+    from .formats import _REGISTRY, decode, encode
+
+    fmt = _REGISTRY.get(dtype)
+    if fmt is None:
+        raise ValueError(f"Unsupported dtype {dtype!r}; expected one of {sorted(_REGISTRY)}")
+    bits = encode(values, fmt)
+    return BatchFields(
+        bits,
+        bits >> (fmt.width - 1),
+        (bits >> fmt.mant_bits) & ((1 << fmt.exp_bits) - 1),
+        bits & ((1 << fmt.mant_bits) - 1),
+        decode(bits, fmt),
+        1,
+        fmt.exp_bits,
+        fmt.mant_bits,
+    )
+
+
+def bit_strings(bits, width):
+    """Render integer bit patterns as ``width``-character ``'0'``/``'1'`` strings.
+
+    Works on whole arrays without a per-element Python loop: the digits are
+    written into a ``uint8`` matrix that is then viewed as fixed-width bytes.
+    """
+    digits = _bit_digits(bits, width)
+    return digits.view(f"S{width}")[..., 0].astype(f"U{width}")
+
+
+def _bit_digits(bits, width):
+    # ASCII '0'/'1' for each bit, most significant first, in a trailing axis.
+    shifts = np.arange(width - 1, -1, -1, dtype=np.uint64)
+    bits = np.asarray(bits).astype(np.uint64)
+    return (((bits[..., None] >> shifts) & np.uint64(1)) + np.uint64(ord("0"))).astype(np.uint8)
@@ -0,0 +1,105 @@
+"""Array kernel for float32 <-> bfloat16 casts.
+
+bfloat16 is the upper half of a float32, so a cast is a rounding step on the
+uint32 view followed by a 16-bit shift. The kernel walks its input in
+cache-sized chunks and reuses one scratch buffer, so converting a multi-GB
+tensor with nearest or truncate rounding allocates nothing beyond the
+(optional) output array. Stochastic rounding also draws two bytes of random
+bits per value, one chunk at a time.
+"""
+
+import numpy as np
+
+ROUNDING_MODES = ("nearest", "truncate", "stochastic")
+
+# Elements per chunk: 256K float32 values keep the scratch buffers in L2.
+CHUNK_SIZE = 1 << 18
+
+_ABS_MASK = np.uint32(0x7FFFFFFF)
+_INF_BITS = np.uint32(0x7F800000)
+_QUIET_BIT = np.uint32(0x0040)
+
+
+def _check_out(out, shape, dtype):
+    if not isinstance(out, np.ndarray) or out.dtype != dtype:
+        raise ValueError(f"out must be a {np.dtype(dtype).name} ndarray")
+    if out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}")
+    if not out.flags.c_contiguous:
+        raise ValueError("out must be C-contiguous")
+    return out
+
+
+def _round_chunk(src, dst, rounding, rng, scratch):
+    if rounding == "nearest":
+        # Round to nearest, ties to even: add 0x7FFF plus the lowest kept bit,
+        # so the carry reaches the upper half only past the halfway point, or
+        # exactly at it when the kept part is odd.
+        np.right_shift(src, 16, out=dst)
+        np.bitwise_and(dst, 1, out=dst)
+        dst += np.uint32(0x7FFF)
+        dst += src
+        dst >>= 16
+    elif rounding == "truncate":
+        np.right_shift(src, 16, out=dst)
+    else:
+        # Stochastic rounding: a uniform 16-bit offset carries into the kept
+        # half with probability proportional to the discarded fraction. Each
+        # raw 64-bit draw supplies four offsets, which is several times
+        # faster than drawing bounded integers one by one.
+        noise = rng.bit_generator.random_raw((src.size + 3) // 4).view(np.uint16)[:src.size]
+        np.add(src, noise, out=dst)
+        dst >>= 16
+
+    # Rounding can carry a NaN payload into the exponent (turning it into Inf
+    # or wrapping the sign), and truncation can drop every payload bit. Keep
+    # the sign and upper payload bits and force the quiet bit instead.
+    np.bitwise_and(src, _ABS_MASK, out=scratch)
+    nan = scratch > _INF_BITS
+    if nan.any():
+        dst[nan] = (src[nan] >> 16) | _QUIET_BIT
+
+
+def float32_to_bfloat16(values, rounding="nearest", rng=None, out=None):
+    """Round ``values`` to bfloat16 and return the 16-bit payloads as ``uint16``.
+
+    ``rounding`` is one of ``"nearest"`` (round to nearest, ties to even),
+    ``"truncate"`` (round toward zero) or ``"stochastic"``. Stochastic rounding
+    draws from ``np.random.default_rng(rng)``, so pass a seed or a Generator
+    for reproducible results. ``out`` may be a preallocated C-contiguous
+    ``uint16`` array of the input's shape. Inputs that are not float32 are
+    converted to float32 first, as the explorer does.
+    """
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Unknown rounding mode {rounding!r}; expected one of {ROUNDING_MODES}")
+    values = np.asarray(values)
+    if values.dtype != np.float32 or not values.flags.c_contiguous:
+        with np.errstate(over="ignore", invalid="ignore"):
+            values = np.ascontiguousarray(values, dtype=np.float32).reshape(values.shape)
+    if out is None:
+        out = np.empty(values.shape, dtype=np.uint16)
+    else:
+        _check_out(out, values.shape, np.uint16)
+    generator = np.random.default_rng(rng) if rounding == "stochastic" else None
+
+    src = values.reshape(-1).view(np.uint32)
+    dst = out.reshape(-1)
+    buffer = np.empty(min(CHUNK_SIZE, src.size), dtype=np.uint32)
+    scratch = np.empty_like(buffer)
+    for start in range(0, src.size, CHUNK_SIZE):
+        chunk = src[start:start + CHUNK_SIZE]
+        n = chunk.size
+        _round_chunk(chunk, buffer[:n], rounding, generator, scratch[:n])
+        np.copyto(dst[start:start + n], buffer[:n], casting="unsafe")
+    return out
+
+
+def bfloat16_to_float32(payload, out=None):
+    """Decode ``uint16`` bfloat16 payloads to float32 by shifting them back up."""
+    payload = np.asarray(payload, dtype=np.uint16)
+    if out is None:
+        out = np.empty(payload.shape, dtype=np.float32)
+    else:
+        _check_out(out, payload.shape, np.float32)
+    np.left_shift(payload, 16, out=out.view(np.uint32), dtype=np.uint32)
+    return out
@@ -0,0 +1,110 @@
+"""Bit fields of many encodings without building a string per value.
+
+A :class:`BitFieldView` keeps the raw encodings in one integer array, which
+is a view of the caller's buffer whenever the values already have the
+target dtype. Sign, exponent and mantissa are integer arrays derived from it
+with shifts and masks. Bit strings are only produced by :meth:`render` and
+:meth:`rows`, vectorized and for just the elements asked for, so a table of
+a million values costs string building for the page on screen only.
+"""
+
+import numpy as np
+
+from .batch import _bit_digits, float_to_bin_and_decimal_batch
+
+_SPACE = ord(" ")
+
+FIELDS = ("bits", "sign", "exponent", "mantissa")
+
+
+def _grouped(digits, group):
+    # Same layout as format_bits: a space after every ``group`` digits, counted from the left.
+    width = digits.shape[-1]
+    if not group or group >= width:
+        return digits
+    positions = np.arange(width) + np.arange(width) // group
+    out = np.full(digits.shape[:-1] + (width + (width - 1) // group,), _SPACE, dtype=np.uint8)
+    out[..., positions] = digits
+    return out
+
+
+def group_bit_strings(bits, width, group=4):
+    """Vectorized :func:`format_bits` of integer encodings: ``width`` digits in groups of ``group``."""
+    digits = _grouped(_bit_digits(bits, width), group)
+    size = digits.shape[-1]
+    return np.ascontiguousarray(digits).view(f"S{size}")[..., 0].astype(f"U{size}")
+
+
+class BitFieldView:
+    """Sign/exponent/mantissa view over an array of encodings.
+
+    ``bits`` holds the encodings (any unsigned integer dtype and shape),
+    ``exp_bits`` and ``mant_bits`` the field widths. ``decimal`` optionally
+    carries the decoded values alongside. Indexing returns another view
+    over the same buffers.
+    """
+
+    def __init__(self, bits, exp_bits, mant_bits, dtype=None, decimal=None):
+        self.bits = np.asarray(bits)
+        self.exp_bits = exp_bits
+        self.mant_bits = mant_bits
+        self.dtype = dtype
+        self.decimal = None if decimal is None else np.asarray(decimal)
+
+    @classmethod
+    def from_values(cls, values, dtype):
+        """Round ``values`` to ``dtype`` (any registered format) and view the result."""
+        fields = float_to_bin_and_decimal_batch(values, dtype)
+        return cls(fields.bits, fields.exp_len, fields.mant_len, dtype, fields.decimal)
+
+    @property
+    def width(self):
+        return 1 + self.exp_bits + self.mant_bits
+
+    @property
+    def shape(self):
+        return self.bits.shape
+
+    def __len__(self):
+        return len(self.bits)
+
+    def __getitem__(self, key):
+        decimal = None if self.decimal is None else self.decimal[key]
+        return BitFieldView(self.bits[key], self.exp_bits, self.mant_bits, self.dtype, decimal)
+
+    def __repr__(self):
+        return f"BitFieldView(dtype={self.dtype!r}, shape={self.shape})"
+
+    @property
+    def sign(self):
+        return self.bits >> (self.width - 1)
+
+    @property
+    def exponent(self):
+        return (self.bits >> self.mant_bits) & ((1 << self.exp_bits) - 1)
+
+    @property
+    def mantissa(self):
+        return self.bits & ((1 << self.mant_bits) - 1)
+
+    def render(self, field="bits", group=4):
+        """Bit strings of one of :data:`FIELDS` for every element, grouped like :func:`format_bits`."""
+        if field == "bits":
+            return group_bit_strings(self.bits, self.width, group)
+        if field == "sign":
+            return group_bit_strings(self.sign, 1, group)
+        if field == "exponent":
+            return group_bit_strings(self.exponent, self.exp_bits, group)
+        if field == "mantissa":
+            return group_bit_strings(self.mantissa, self.mant_bits, group)
+        raise ValueError(f"Unknown field {field!r}; expected one of {FIELDS}")
+
+    def rows(self, start=0, stop=None, group=4):
+        """``(sign, exponent, mantissa, bits)`` string tuples for flat elements ``start:stop``.
+
+        Only those elements are rendered, however large the view is.
+        """
+        page = self.bits.reshape(-1)[start:stop]
+        view = BitFieldView(page, self.exp_bits, self.mant_bits, self.dtype)
+        columns = [view.render(field, group).tolist() for field in ("sign", "exponent", "mantissa", "bits")]
+        return list(zip(*columns))
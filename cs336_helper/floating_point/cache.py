@@ -0,0 +1,120 @@
+"""Process-wide memoization of the rows shown by the explorer page.
+
+Streamlit reruns the whole page on every widget change, and each rerun used
+to convert and format the same handful of values again. Rows are cached
+here instead, in module state that every session served by the process
+shares. Comparison rows sit in a bounded LRU cache keyed on the exact bits of
+the input value and the dtype, so ``-0.0`` and ``0.0`` (or different NaN
+payloads) never share an entry; the special-values table never changes and
+is built once per process.
+
+The LRU bound defaults to ``CS336_CONVERSION_CACHE_SIZE`` from the
+environment (4096 entries) and can be changed with :func:`configure_cache`.
+"""
+
+import functools
+import math
+import os
+import struct
+
+from .bitview import BitFieldView
+from .timing import stage
+
+DEFAULT_CACHE_SIZE = int(os.environ.get("CS336_CONVERSION_CACHE_SIZE", "4096"))
+
+COMPARISON_COLUMNS = ("Type", "Decimal", "Sign", "Exponent", "Mantissa", "Raw bits")
+SPECIAL_COLUMNS = ("Case",) + COMPARISON_COLUMNS
+
+# Significant digits shown per dtype; float32 needs 27 for an exact decimal.
+DECIMAL_DIGITS = {"float32": 27, "float16": 13, "bfloat16": 11}
+
+SPECIAL_CASES = {
+    "Positive Zero": (0.0, "All exponent bits = 0, all mantissa bits = 0"),
+    "Negative Zero": (-0.0, "Sign = 1, all exponent bits = 0, all mantissa bits = 0"),
+    "Positive Infinity": (float('inf'), "All exponent bits = 1, all mantissa bits = 0"),
+    "Negative Infinity": (float('-inf'), "Sign = 1, all exponent bits = 1, all mantissa bits = 0"),
+    "NaN (Not a Number)": (float('nan'), "All exponent bits = 1, any mantissa bits ≠ 0"),
+}
+
+
+def _value_bits(value):
+    return struct.unpack('<Q', struct.pack('<d', float(value)))[0]
+
+
+def _value_from_bits(value_bits):
+    return struct.unpack('<d', struct.pack('<Q', value_bits))[0]
+
+
+def _build_comparison_row(value_bits, dtype):
+    try:
+        with stage("conversion"):
+            view = BitFieldView.from_values([_value_from_bits(value_bits)], dtype)
+    except ValueError:
+        return (dtype, "Error", "-", "-", "-", "-")
+    with stage("formatting"):
+        dec_value = float(view.decimal[0])
+        digits = DECIMAL_DIGITS.get(dtype)
+        decimal_str = f"{dec_value:.{digits}g}" if digits else f"{dec_value}"
+        return (dtype, decimal_str) + view.rows()[0]
+
+
+_cached_comparison_row = functools.lru_cache(maxsize=DEFAULT_CACHE_SIZE)(_build_comparison_row)
+
+
+def configure_cache(maxsize):
+    """Replace the comparison-row cache with an empty one bounded to ``maxsize`` entries."""
+    global _cached_comparison_row
+    _cached_comparison_row = functools.lru_cache(maxsize=maxsize)(_build_comparison_row)
+
+
+def cache_info():
+    """Hit/miss statistics of the comparison-row cache (``functools`` ``CacheInfo``)."""
+    return _cached_comparison_row.cache_info()
+
+
+def comparison_row(value, dtype):
+    """Row of the "Binary Representation Comparison" table for ``value`` in ``dtype``."""
+    return dict(zip(COMPARISON_COLUMNS, _cached_comparison_row(_value_bits(value), dtype)))
+
+
+def _special_decimal(dec_value):
+    if math.isnan(dec_value):
+        return "NaN"
+    if math.isinf(dec_value):
+        return "+∞" if dec_value > 0 else "-∞"
+    if dec_value == 0.0:
+        # Distinguish positive and negative zero
+        return "+0.0" if math.copysign(1.0, dec_value) == 1.0 else "-0.0"
+    return f"{dec_value:.17g}"
+
+
+@functools.lru_cache(maxsize=None)
+def _special_rows(dtypes):
+    with stage("special values"):
+        return _build_special_rows(dtypes)
+
+
+def _build_special_rows(dtypes):
+    values = [value for value, _ in SPECIAL_CASES.values()]
+    rendered = {}
+    for dtype in dtypes:
+        try:
+            view = BitFieldView.from_values(values, dtype)
+        except ValueError:
+            # Some special values might not be supported in all formats
+            continue
+        rendered[dtype] = [(_special_decimal(float(dec_value)),) + row
+                           for dec_value, row in zip(view.decimal.tolist(), view.rows())]
+    rows = []
+    for i, case_name in enumerate(SPECIAL_CASES):
+        for dtype in dtypes:
+            if dtype in rendered:
+                rows.append((case_name, dtype) + rendered[dtype][i])
+            else:
+                rows.append((case_name, dtype, "Unsupported", "-", "-", "-", "-"))
+    return tuple(rows)
+
+
+def special_value_rows(dtypes=("float32",)):
+    """Rows of the "Special Values Representation" table, built once per process."""
+    return [dict(zip(SPECIAL_COLUMNS, row)) for row in _special_rows(tuple(dtypes))]
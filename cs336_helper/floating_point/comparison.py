@@ -0,0 +1,199 @@
+"""Server-side paging for the comparison table of many values.
+
+:func:`comparison_table` converts every input value to every selected
+format at once. The result holds integer encodings and float errors only, no
+strings. One row is kept per (value, format) pair. Sorting and filtering
+work on those arrays, and :meth:`ComparisonTable.page` formats only the
+rows of the page being shown. Thousands of pasted values therefore cost a
+few array passes per rerun, not thousands of Python strings.
+
+Tables are cached per (values, formats) in a small process-wide LRU, like
+the single-value rows in :mod:`.cache`, so paging and re-sorting do not
+convert the values again.
+"""
+
+import functools
+import io
+import math
+
+import numpy as np
+
+from .bitview import BitFieldView
+from .cache import COMPARISON_COLUMNS, DECIMAL_DIGITS
+from .formats import INF, NAN, ZERO, classify, get_format
+from .timing import stage
+
+# Row categories a table can be filtered by. The first five are
+# :data:`.formats.CLASSES` of the stored encoding. "overflow" and
+# "underflow" flag finite, non-zero inputs that became Inf/NaN or zero.
+CATEGORIES = ("zero", "subnormal", "normal", "inf", "nan", "overflow", "underflow")
+
+SORT_KEYS = ("input order", "value", "abs error", "rel error", "exponent")
+
+PAGE_COLUMNS = ("#", "Input") + COMPARISON_COLUMNS + ("Rel. error",)
+
+# Distinct (values, formats) tables kept per process.
+TABLE_CACHE_SIZE = 8
+
+
+def parse_values(data):
+    """Parse pasted text or an uploaded file (``str`` or ``bytes``) into a float64 array.
+
+    ``.npy`` content is recognised by its magic prefix and must hold real
+    numbers; anything else is read as numbers separated by whitespace, commas
+    or semicolons.
+    """
+    if isinstance(data, bytes):
+        if data.startswith(b"\x93NUMPY"):
+            array = np.load(io.BytesIO(data), allow_pickle=False)
+            # Structured arrays do not convert; complex ones would lose their imaginary part.
+            if array.dtype.kind not in "fiu":
+                raise ValueError(f"Expected an array of real numbers, got dtype {array.dtype}")
+            return array.astype(np.float64).ravel()
+        data = data.decode()
+    tokens = data.replace(",", " ").replace(";", " ").split()
+    try:
+        return np.array(tokens, dtype=np.float64)
+    except ValueError:
+        bad = next(token for token in tokens if not _is_number(token))
+        raise ValueError(f"Not a number: {bad!r}") from None
+
+
+def _is_number(token):
+    try:
+        float(token)
+    except ValueError:
+        return False
+    return True
+
+
+class ComparisonTable:
+    """Every value converted to every format, one row per (value, format) pair.
+
+    The flat row arrays (``index``, ``format_index``, ``bits``, ``decimal``,
+    ``abs_error``, ``rel_error``, ``exponent``, ``kind``, ``overflow`` and
+    ``underflow``) are ordered value by value, with the formats in the
+    order given within each value.
+    """
+
+    def __init__(self, values, dtypes):
+        with stage("conversion"):
+            self._convert(values, dtypes)
+
+    def _convert(self, values, dtypes):
+        self.values = np.asarray(values, dtype=np.float64).ravel()
+        self.dtypes = tuple(dtypes)
+        self.formats = [get_format(dtype) for dtype in self.dtypes]
+        n, k = len(self.values), len(self.dtypes)
+        self.index = np.repeat(np.arange(n), k)
+        self.format_index = np.tile(np.arange(k), n)
+
+        bits = np.empty((n, k), dtype=np.uint32)
+        decimal = np.empty((n, k))
+        exponent = np.empty((n, k), dtype=np.int32)
+        kind = np.empty((n, k), dtype=np.uint8)
+        for j, fmt in enumerate(self.formats):
+            view = BitFieldView.from_values(self.values, fmt.name)
+            bits[:, j] = view.bits
+            decimal[:, j] = view.decimal
+            exponent[:, j] = np.maximum(view.exponent, 1).astype(np.int32) - fmt.bias
+            kind[:, j] = classify(view.bits, fmt)
+        self.bits = bits.ravel()
+        self.decimal = decimal.ravel()
+        self.exponent = exponent.ravel()
+        self.kind = kind.ravel()
+
+        source = self.values[self.index]
+        finite_nonzero = np.isfinite(source) & (source != 0)
+        self.overflow = finite_nonzero & ((self.kind == INF) | (self.kind == NAN))
+        self.underflow = finite_nonzero & (self.kind == ZERO)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.abs_error = np.abs(self.decimal - source)
+            self.rel_error = self.abs_error / np.abs(source)
+        self.rel_error[self.abs_error == 0] = 0.0
+
+    def __len__(self):
+        return len(self.bits)
+
+    def counts(self):
+        """Number of rows in each of :data:`CATEGORIES`."""
+        counts = {name: int(np.count_nonzero(self.kind == i)) for i, name in enumerate(CATEGORIES[:5])}
+        counts["overflow"] = int(np.count_nonzero(self.overflow))
+        counts["underflow"] = int(np.count_nonzero(self.underflow))
+        return counts
+
+    def select(self, categories=None, sort_by="input order", descending=False):
+        """Row numbers matching any of ``categories`` (all rows if empty), in display order.
+
+        Rows whose sort key is NaN (the error of a NaN input, say) go last.
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key {sort_by!r}; expected one of {SORT_KEYS}")
+        rows = np.arange(len(self))
+        if categories:
+            unknown = set(categories) - set(CATEGORIES)
+            if unknown:
+                raise ValueError(f"Unknown categories {sorted(unknown)}; expected some of {CATEGORIES}")
+            mask = np.isin(self.kind, [CATEGORIES.index(c) for c in categories if c in CATEGORIES[:5]])
+            if "overflow" in categories:
+                mask |= self.overflow
+            if "underflow" in categories:
+                mask |= self.underflow
+            rows = rows[mask]
+        if sort_by == "input order":
+            return rows[::-1] if descending else rows
+        key = {
+            "value": self.values[self.index],
+            "abs error": self.abs_error,
+            "rel error": self.rel_error,
+            "exponent": self.exponent,
+        }[sort_by][rows]
+        order = np.argsort(-key if descending else key, kind="stable")
+        nan = np.isnan(key[order]) if key.dtype.kind == "f" else np.zeros(len(order), dtype=bool)
+        return rows[np.concatenate([order[~nan], order[nan]])]
+
+    def page(self, number=0, size=50, categories=None, sort_by="input order", descending=False):
+        """Formatted rows of page ``number`` (0-based), plus the total number of matching rows."""
+        selected = self.select(categories, sort_by, descending)
+        return self.format_rows(selected[number * size:(number + 1) * size]), len(selected)
+
+    def format_rows(self, shown):
+        """Dicts with :data:`PAGE_COLUMNS` for the row numbers ``shown``; nothing else is formatted."""
+        with stage("formatting"):
+            return self._format_rows(shown)
+
+    def _format_rows(self, shown):
+        shown = np.asarray(shown, dtype=np.intp)
+        strings = {}
+        for j, fmt in enumerate(self.formats):
+            mine = shown[self.format_index[shown] == j]
+            if mine.size:
+                view = BitFieldView(self.bits[mine], fmt.exp_bits, fmt.mant_bits, fmt.name)
+                strings.update(zip(mine.tolist(), view.rows()))
+        rows = []
+        for row in shown.tolist():
+            dtype = self.dtypes[self.format_index[row]]
+            digits = DECIMAL_DIGITS.get(dtype, 17)
+            i = int(self.index[row])
+            rows.append(dict(zip(PAGE_COLUMNS, (
+                i,
+                f"{self.values[i]:.17g}",
+                dtype,
+                f"{self.decimal[row]:.{digits}g}",
+            ) + strings[row] + (_format_error(self.rel_error[row]),))))
+        return rows
+
+
+def _format_error(rel_error):
+    return "-" if math.isnan(rel_error) or math.isinf(rel_error) else f"{rel_error:.3g}"
+
+
+@functools.lru_cache(maxsize=TABLE_CACHE_SIZE)
+def _cached_table(value_bytes, dtypes):
+    return ComparisonTable(np.frombuffer(value_bytes, dtype=np.float64), dtypes)
+
+
+def comparison_table(values, dtypes):
+    """The :class:`ComparisonTable` of ``values`` in ``dtypes``, cached per process."""
+    values = np.ascontiguousarray(values, dtype=np.float64).ravel()
+    return _cached_table(values.tobytes(), tuple(dtypes))
@@ -0,0 +1,97 @@
+"""Scalar converters behind the Floating-Point Explorer page.
+
+These work on one Python number at a time and return the bit string together
+with the field lengths, which is what the page's tables display. NumPy and
+the array kernels are imported on first call, so importing this module is
+cheap enough for command-line tools and test collection.
+"""
+
+import struct
+
+
+def format_bits(bits, group=4):
+    # Insert space after every 'group' bits
+    return ' '.join([bits[i:i+group] for i in range(0, len(bits), group)])
+
+
+def float_to_bin(value, dtype):
+    if dtype == "float16":
+        import numpy as np
+        from .tables import lookup_table
+
+        # IEEE 754 half precision: 1 sign, 5 exponent, 10 mantissa bits
+        f = np.float16(value)
+        b = str(lookup_table("float16").bits[int(f.view(np.uint16))])
+        return b, 1, 5, 10
+    elif dtype == "bfloat16":
+        import numpy as np
+        from .bfloat16 import float32_to_bfloat16
+        from .tables import lookup_table
+
+        # bfloat16: 1 sign, 8 exponent, 7 mantissa bits
+        # Upper 16 bits of the float32 representation, rounded to nearest, ties to even
+        bfloat_int = int(float32_to_bfloat16(np.float32(value)))
+        b = str(lookup_table("bfloat16").bits[bfloat_int])
+        return b, 1, 8, 7
+    elif dtype == "float32":
+        # IEEE 754 single precision: 1 sign, 8 exponent, 23 mantissa bits
+        packed = struct.pack('>f', value)
+        as_int = struct.unpack('>I', packed)[0]
+        b = f"{as_int:032b}"
+        return b, 1, 8, 23
+    else:
+        fields = _generic_fields(value, dtype)
+        return fields[:4] if fields else (None, None, None, None)
+
+
+def float_to_bin_and_decimal(value, dtype):
+    import numpy as np
+    from .bfloat16 import float32_to_bfloat16
+    from .tables import lookup_table
+
+    if dtype == "float16":
+        f = np.float16(value)
+        # Every float16 encoding is precomputed: the payload indexes the table
+        payload = int(f.view(np.uint16))
+        table = lookup_table("float16")
+        return str(table.bits[payload]), 1, 5, 10, float(table.value[payload])
+    elif dtype == "bfloat16":
+        # bfloat16 (Brain Float 16): 1 sign bit, 8 exponent bits, 7 mantissa bits
+        # It's essentially the upper 16 bits of a float32 representation
+
+        # Step 1: Convert input to float32 to get the full 32-bit representation
+        f = np.float32(value)
+
+        # Step 2: Keep the upper 16 bits of the float32 bit pattern, applying the
+        # "Round to nearest, ties to even" rule to the 16 bits being dropped:
+        # - If the highest dropped bit is 1 and any other dropped bit is set, round up
+        # - If it's exactly a tie, round so the kept LSB is 0 (even)
+        # NaNs stay NaN (rounding must not carry the payload into the exponent)
+        bfloat_int = int(float32_to_bfloat16(f))
+
+        # Step 3: Look up the binary string and decimal value in the precomputed table
+        # The key insight: bfloat16 is just float32 with lower 16 bits set to zero
+        # So each decimal value was reconstructed by shifting the 16-bit value back up
+        table = lookup_table("bfloat16")
+        return str(table.bits[bfloat_int]), 1, 8, 7, float(table.value[bfloat_int])
+    elif dtype == "float32":
+        # Convert to float32 to get the exact representation stored
+        f = np.float32(value)
+        packed = struct.pack('>f', f)
+        as_int = struct.unpack('>I', packed)[0]
+        b = f"{as_int:032b}"
+        # Return the exact float32 value, not the original input
+        return b, 1, 8, 23, float(f)
+    else:
+        return _generic_fields(value, dtype) or (None, None, None, None, None)
+
+
+def _generic_fields(value, dtype):
+    # Any other format from the registry goes through the generic encoder.
+    from .formats import _REGISTRY, decode, encode
+
+    fmt = _REGISTRY.get(dtype)
+    if fmt is None:
+        return None
+    code = int(encode(value, fmt))
+    return f"{code:0{fmt.width}b}", 1, fmt.exp_bits, fmt.mant_bits, float(decode(code, fmt))
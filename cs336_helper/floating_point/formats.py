@@ -0,0 +1,263 @@
+"""Table-driven registry of binary floating-point formats.
+
+A format is fully described by its exponent and mantissa widths, its
+exponent bias and how it uses the all-ones exponent (its special-value
+policy). :func:`encode` and :func:`decode` work for any registered format on
+whole arrays, so new formats such as FP8 or custom ExMy layouts only need a
+:func:`register_format` call.
+
+Special-value policies:
+
+* ``"ieee"``: all-ones exponent encodes Inf (zero mantissa) and NaN
+  (float16, bfloat16, float32, FP8 E5M2).
+* ``"fn"``: finite values plus NaN only, which takes the single all-ones
+  magnitude; the rest of the top binade holds ordinary numbers (FP8 E4M3FN).
+* ``"finite"``: no Inf or NaN at all (FP4 E2M1).
+"""
+
+import functools
+from collections import namedtuple
+
+import numpy as np
+
+SPECIAL_POLICIES = ("ieee", "fn", "finite")
+
+# Values returned by classify().
+CLASSES = ("zero", "subnormal", "normal", "inf", "nan")
+ZERO, SUBNORMAL, NORMAL, INF, NAN = range(len(CLASSES))
+
+# Elements per chunk for the float64 working buffers of encode().
+CHUNK_SIZE = 1 << 16
+
+
+class FloatFormat(namedtuple("FloatFormat", ["name", "exp_bits", "mant_bits", "bias", "specials"])):
+    """A sign/exponent/mantissa layout with its bias and special-value policy."""
+
+    __slots__ = ()
+
+    @property
+    def width(self):
+        return 1 + self.exp_bits + self.mant_bits
+
+    @property
+    def code_dtype(self):
+        """Smallest unsigned integer dtype that holds an encoding."""
+        return np.dtype(np.uint8 if self.width <= 8 else np.uint16 if self.width <= 16 else np.uint32)
+
+    @property
+    def max_finite_code(self):
+        """Largest encoding (without the sign bit) of a finite value."""
+        if self.specials == "ieee":
+            return ((1 << self.exp_bits) - 1 << self.mant_bits) - 1
+        if self.specials == "fn":
+            return (1 << (self.exp_bits + self.mant_bits)) - 2
+        return (1 << (self.exp_bits + self.mant_bits)) - 1
+
+    @property
+    def inf_code(self):
+        return (1 << self.exp_bits) - 1 << self.mant_bits if self.specials == "ieee" else None
+
+    @property
+    def nan_code(self):
+        if self.specials == "ieee":
+            return self.inf_code | (1 << max(self.mant_bits - 1, 0))
+        if self.specials == "fn":
+            return (1 << (self.exp_bits + self.mant_bits)) - 1
+        return None
+
+    @property
+    def emin(self):
+        """Unbiased exponent of the smallest normal binade."""
+        return 1 - self.bias
+
+    @property
+    def max_finite(self):
+        return float(decode(self.max_finite_code, self))
+
+    @property
+    def min_normal(self):
+        return float(np.ldexp(1.0, self.emin))
+
+    @property
+    def min_subnormal(self):
+        return float(np.ldexp(1.0, self.emin - self.mant_bits))
+
+
+_REGISTRY = {}
+
+
+def register_format(name, exp_bits, mant_bits, bias=None, specials="ieee"):
+    """Add (or replace) a format in the registry and return it.
+
+    ``bias`` defaults to the IEEE convention ``2**(exp_bits - 1) - 1``.
+    """
+    if specials not in SPECIAL_POLICIES:
+        raise ValueError(f"Unknown special-value policy {specials!r}; expected one of {SPECIAL_POLICIES}")
+    if exp_bits < 1 or mant_bits < 0 or 1 + exp_bits + mant_bits > 32:
+        raise ValueError("A format needs at least one exponent bit and at most 32 bits in total")
+    if specials == "ieee" and mant_bits == 0:
+        raise ValueError("IEEE-style specials need at least one mantissa bit to tell NaN from Inf")
+    if bias is None:
+        bias = (1 << (exp_bits - 1)) - 1
+    fmt = FloatFormat(name, exp_bits, mant_bits, bias, specials)
+    _REGISTRY[name] = fmt
+    return fmt
+
+
+def get_format(name):
+    """Look up a registered format; raises ``KeyError`` for unknown names."""
+    if isinstance(name, FloatFormat):
+        return name
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        raise KeyError(f"Unknown format {name!r}; registered formats: {sorted(_REGISTRY)}") from None
+
+
+def available_formats():
+    """Names of all registered formats, in registration order."""
+    return list(_REGISTRY)
+
+
+register_format("float16", 5, 10)
+register_format("bfloat16", 8, 7)
+register_format("float32", 8, 23)
+register_format("tfloat32", 8, 10)
+register_format("float8_e4m3fn", 4, 3, specials="fn")
+register_format("float8_e5m2", 5, 2)
+register_format("float4_e2m1fn", 2, 1, specials="finite")
+
+
+def _encode_chunk(x, fmt, saturate, out):
+    negative = np.signbit(x)
+    magnitude = np.abs(x)
+    nan = np.isnan(x)
+    # magnitude = m * 2**e with m in [0.5, 1); clamp to the subnormal binade,
+    # which is also where zero (frexp exponent 0) belongs.
+    _, e = np.frexp(magnitude)
+    e[magnitude == 0] = fmt.emin
+    exponent = np.maximum(e - 1, fmt.emin)
+    # Integer significand including the implicit bit, rounded to nearest even.
+    # Scaling by a power of two is exact, so rint is the only rounding step.
+    significand = np.rint(np.ldexp(magnitude, fmt.mant_bits - exponent))
+    # Normal codes are (biased exponent << mant_bits) | fraction, which equals
+    # (exponent - emin) * 2**mant_bits + significand; a significand that
+    # rounded up to the next power of two carries into the exponent for free.
+    code = (exponent - fmt.emin) * float(1 << fmt.mant_bits) + significand
+
+    overflow = ~nan & ~(code <= fmt.max_finite_code)
+    if fmt.specials == "ieee" and not saturate:
+        overflow_code = fmt.inf_code
+    elif fmt.specials == "fn" and not saturate:
+        overflow_code = fmt.nan_code
+    else:
+        overflow_code = fmt.max_finite_code
+    code[overflow] = overflow_code
+    # Formats without a NaN encoding map NaN to +0.
+    code[nan] = fmt.nan_code if fmt.nan_code is not None else 0
+    if fmt.nan_code is None:
+        negative &= ~nan
+
+    result = code.astype(np.uint64)
+    result |= negative.astype(np.uint64) << np.uint64(fmt.width - 1)
+    np.copyto(out, result, casting="unsafe")
+
+
+def encode(values, fmt, saturate=False):
+    """Round ``values`` to ``fmt`` (nearest, ties to even) and return the encodings.
+
+    Values beyond the largest finite number become Inf (``"ieee"``), NaN
+    (``"fn"``) or the largest finite number (``"finite"``, or any format with
+    ``saturate=True``). The result has the input's shape and the format's
+    :attr:`FloatFormat.code_dtype`.
+    """
+    fmt = get_format(fmt)
+    with np.errstate(over="ignore", invalid="ignore"):
+        values = np.asarray(values, dtype=np.float64)
+        out = np.empty(values.shape, dtype=fmt.code_dtype)
+        src = values.reshape(-1)
+        dst = out.reshape(-1)
+        for start in range(0, src.size, CHUNK_SIZE):
+            _encode_chunk(src[start:start + CHUNK_SIZE], fmt, saturate, dst[start:start + CHUNK_SIZE])
+    return out
+
+
+def _decode_codes(codes, fmt):
+    codes = codes.astype(np.int64)
+    negative = ((codes >> (fmt.width - 1)) & 1).astype(bool)
+    magnitude = codes & ((1 << (fmt.width - 1)) - 1)
+    exponent = magnitude >> fmt.mant_bits
+    fraction = magnitude & ((1 << fmt.mant_bits) - 1)
+    significand = np.where(exponent == 0, fraction, fraction + (1 << fmt.mant_bits))
+    scale = np.maximum(exponent, 1) - fmt.bias - fmt.mant_bits
+    values = np.ldexp(significand.astype(np.float64), scale.astype(np.int32))
+    if fmt.specials == "ieee":
+        top = exponent == (1 << fmt.exp_bits) - 1
+        values = np.where(top, np.where(fraction == 0, np.inf, np.nan), values)
+    elif fmt.specials == "fn":
+        values = np.where(magnitude == fmt.nan_code, np.nan, values)
+    return np.where(negative, -values, values)
+
+
+@functools.lru_cache(maxsize=None)
+def _decode_table(fmt):
+    # Formats of up to 16 bits decode with one gather from a cached table.
+    table = _decode_codes(np.arange(1 << fmt.width), fmt)
+    table.flags.writeable = False
+    return table
+
+
+def decode(codes, fmt, dtype=np.float64):
+    """Decode encodings of ``fmt`` to floating-point values of ``dtype``."""
+    fmt = get_format(fmt)
+    codes = np.asarray(codes)
+    if fmt.width <= 16:
+        values = _decode_table(fmt)[codes]
+    else:
+        values = _decode_codes(codes, fmt)
+    return values.astype(dtype, copy=False)
+
+
+def classify(codes, fmt):
+    """Return the :data:`CLASSES` index (``uint8``) of every encoding of ``fmt``.
+
+    The all-ones exponent follows the format's special-value policy: Inf
+    and NaN for ``"ieee"``, a single NaN magnitude for ``"fn"``, and ordinary
+    numbers for ``"finite"``.
+    """
+    fmt = get_format(fmt)
+    codes = np.asarray(codes).astype(np.int64)
+    magnitude = codes & ((1 << (fmt.width - 1)) - 1)
+    subnormal_range = magnitude < (1 << fmt.mant_bits)  # zero biased exponent
+    kind = np.full(codes.shape, NORMAL, dtype=np.uint8)
+    kind[subnormal_range] = SUBNORMAL
+    kind[magnitude == 0] = ZERO
+    if fmt.specials == "ieee":
+        kind[magnitude == fmt.inf_code] = INF
+        kind[magnitude > fmt.inf_code] = NAN
+    elif fmt.specials == "fn":
+        kind[magnitude == fmt.nan_code] = NAN
+    return kind
+
+
+def ulp(x, fmt):
+    """Spacing of ``fmt`` values at the magnitudes ``x`` (float64 array).
+
+    ``x`` need not be representable. Magnitudes below the smallest normal
+    number get the subnormal spacing. See :func:`code_ulp` for encodings.
+    """
+    fmt = get_format(fmt)
+    _, e = np.frexp(np.abs(np.asarray(x, dtype=np.float64)))
+    return np.ldexp(1.0, np.maximum(e - 1, fmt.emin) - fmt.mant_bits)
+
+
+def code_ulp(codes, fmt):
+    """Spacing of the binade of each encoding of ``fmt`` (float64); NaN for Inf and NaN.
+
+    Subnormals share the spacing of the smallest normal binade.
+    """
+    fmt = get_format(fmt)
+    codes = np.asarray(codes).astype(np.int64)
+    exponent = (codes >> fmt.mant_bits) & ((1 << fmt.exp_bits) - 1)
+    spacing = np.ldexp(1.0, (np.maximum(exponent, 1) - fmt.bias - fmt.mant_bits).astype(np.int32))
+    return np.where(classify(codes, fmt) >= INF, np.nan, spacing)
@@ -0,0 +1,37 @@
+"""Access to files on the server's disk from the pages.
+
+The tensor analyzer and the checkpoint profiler read files named by the
+user and start worker processes. That is fine on a developer's machine but
+not on a public deployment, so both are off unless ``CS336_ALLOW_LOCAL_FILES``
+is set to anything but ``""``/``"0"``. Even then, only files inside the data
+directory (``CS336_DATA_DIR``, by default the working directory) can be
+opened. Relative paths are taken from that directory.
+"""
+
+import os
+
+ALLOW_ENV = "CS336_ALLOW_LOCAL_FILES"
+DATA_DIR_ENV = "CS336_DATA_DIR"
+
+
+def local_files_allowed():
+    """Whether the pages may read files from the server's disk."""
+    return os.environ.get(ALLOW_ENV, "") not in ("", "0")
+
+
+def data_dir():
+    """Absolute path of the directory files may be read from, symlinks resolved."""
+    return os.path.realpath(os.environ.get(DATA_DIR_ENV) or os.getcwd())
+
+
+def resolve_data_path(path):
+    """``path`` resolved against :func:`data_dir`; ``ValueError`` if it points outside it.
+
+    Symlinks and ``..`` are resolved first, so neither can lead out of the
+    data directory.
+    """
+    root = data_dir()
+    resolved = os.path.realpath(os.path.join(root, os.fspath(path)))
+    if os.path.commonpath([root, resolved]) != root:
+        raise ValueError(f"{os.fspath(path)!r} is outside the data directory {root}")
+    return resolved
@@ -0,0 +1,202 @@
+"""Representable neighbours and ULP arithmetic on integer encodings.
+
+Ordered by value, the encodings of a sign-magnitude format are the
+magnitudes ``0, 1, 2, ...`` up to Inf, mirrored for negative numbers. The
+*ordinal* of an encoding is therefore its magnitude, negated when the sign
+bit is set. Both zeros map to 0, and consecutive ordinals are adjacent
+representable values. Moving ``n`` ULPs is then an integer addition, and
+the ULP distance between two values is the difference of their ordinals.
+Every query is O(1) per element and vectorized over whole arrays, with no
+search over floats.
+
+Values are rounded with :func:`.float_to_bin_and_decimal_batch`, so the
+encodings match what the explorer displays. NaN encodings have no place in
+the order: stepping leaves them unchanged, and distances involving them
+are NaN. Steps saturate at ±Inf, or at the largest finite value for
+formats without Inf.
+
+How many float16 ULPs apart are the float16 and bfloat16 roundings of ten
+million values::
+
+    rounding_distance(values, "float16", "bfloat16")
+"""
+
+import decimal
+from collections import namedtuple
+
+import numpy as np
+
+from .batch import float_to_bin_and_decimal_batch
+from .formats import NAN, classify, code_ulp, decode, get_format
+
+# Enough digits to hold the difference of any two float64 values exactly: it
+# can span from about 10**308 down to the last digit of 2**-1074, at 10**-1074.
+EXACT_DIGITS = 1500
+
+NEIGHBOR_COLUMNS = ("Type", "Previous", "Nearest", "Next", "ULP", "Distance to previous", "Distance to next")
+
+
+def _max_ordinal(fmt):
+    return fmt.inf_code if fmt.specials == "ieee" else fmt.max_finite_code
+
+
+def _ordinals(codes, fmt):
+    codes = np.asarray(codes).astype(np.int64)
+    sign_bit = 1 << (fmt.width - 1)
+    magnitude = codes & (sign_bit - 1)
+    ordinal = np.where(codes & sign_bit, -magnitude, magnitude)
+    return ordinal, classify(codes, fmt) == NAN
+
+
+def _codes(ordinal, fmt):
+    limit = _max_ordinal(fmt)
+    ordinal = np.clip(ordinal, -limit, limit)
+    return np.where(ordinal < 0, (1 << (fmt.width - 1)) - ordinal, ordinal).astype(fmt.code_dtype)
+
+
+def ordinals(codes, dtype):
+    """Signed position of each encoding of ``dtype`` in value order, as float64.
+
+    The ordinals are integers, exact in float64 for formats of up to 32
+    bits. NaN encodings give NaN.
+    """
+    ordinal, nan = _ordinals(codes, get_format(dtype))
+    result = ordinal.astype(np.float64)
+    result[nan] = np.nan
+    return result
+
+
+def step(codes, dtype, n=1):
+    """Encodings ``n`` representable values above ``codes`` (below for negative ``n``).
+
+    ``n`` may be an array that broadcasts against ``codes``. Results
+    saturate at the ends of the range; NaN encodings are returned unchanged.
+    """
+    fmt = get_format(dtype)
+    codes = np.asarray(codes)
+    ordinal, nan = _ordinals(codes, fmt)
+    return np.where(nan, codes, _codes(ordinal + np.asarray(n, dtype=np.int64), fmt)).astype(fmt.code_dtype)
+
+
+class Neighbors(namedtuple("Neighbors", ["dtype", "nearest", "below", "above"])):
+    """Encodings bracketing some values in ``dtype``.
+
+    ``nearest`` is the rounding the explorer shows. ``below`` and ``above``
+    are the closest representable values strictly below and above the input
+    when it is representable, and otherwise the two values it falls
+    between. One of them is then ``nearest``. Where no such value exists
+    (above the largest finite value of a format without Inf, say), they
+    saturate at the end of the range like :func:`step`.
+    """
+
+    __slots__ = ()
+
+    def values(self):
+        """``(below, nearest, above)`` decoded to float64."""
+        return tuple(decode(codes, self.dtype) for codes in (self.below, self.nearest, self.above))
+
+    @property
+    def ulp(self):
+        """Spacing at ``nearest`` (see :func:`.code_ulp`)."""
+        return code_ulp(self.nearest, self.dtype)
+
+
+def _round(values, dtype):
+    fields = float_to_bin_and_decimal_batch(values, dtype)
+    return fields.bits, np.asarray(fields.decimal, dtype=np.float64)
+
+
+def neighbors(values, dtype):
+    """The :class:`Neighbors` of every element of ``values`` in ``dtype``."""
+    fmt = get_format(dtype)
+    values = np.asarray(values, dtype=np.float64)
+    nearest, stored = _round(values, dtype)
+    below = np.where(stored >= values, step(nearest, dtype, -1), nearest)
+    above = np.where(stored <= values, step(nearest, dtype, 1), nearest)
+    if fmt.specials != "ieee":
+        # Without Inf, inputs beyond the range round to the largest finite
+        # value or to NaN; both neighbours are then that largest value.
+        beyond = np.abs(values) > fmt.max_finite
+        edge = _codes(np.where(values < 0, -1, 1) * _max_ordinal(fmt), fmt)
+        below = np.where(beyond, edge, below)
+        above = np.where(beyond, edge, above)
+    return Neighbors(dtype, nearest, below.astype(nearest.dtype), above.astype(nearest.dtype))
+
+
+def jump(values, dtype, n):
+    """Encodings ``n`` representable values away from ``values``.
+
+    ``n = 1`` is the next representable value above the input, ``n = -1``
+    the one below, and ``n = 0`` the rounding of the input itself.
+    """
+    found = neighbors(values, dtype)
+    n = np.asarray(n, dtype=np.int64)
+    up = step(found.above, dtype, np.maximum(n - 1, 0))
+    down = step(found.below, dtype, np.minimum(n + 1, 0))
+    return np.where(n > 0, up, np.where(n < 0, down, found.nearest)).astype(found.nearest.dtype)
+
+
+def ulp_distance(a, b, dtype):
+    """Signed number of ``dtype`` ULPs from ``a`` to ``b``, after rounding both to ``dtype``.
+
+    Returns float64 holding exact integers, or NaN where either side is NaN.
+    """
+    fmt = get_format(dtype)
+    ordinal_a, nan_a = _ordinals(_round(a, dtype)[0], fmt)
+    ordinal_b, nan_b = _ordinals(_round(b, dtype)[0], fmt)
+    distance = (ordinal_b - ordinal_a).astype(np.float64)
+    distance[nan_a | nan_b] = np.nan
+    return distance
+
+
+def rounding_distance(values, dtype_a, dtype_b, unit=None):
+    """ULPs of ``unit`` (default ``dtype_a``) from the ``dtype_a`` to the ``dtype_b`` rounding of ``values``.
+
+    Both roundings are rounded to ``unit`` first. Pick a ``unit`` that
+    holds both formats exactly (``"float32"`` for the 16-bit ones) to count
+    without that extra rounding.
+    """
+    _, rounded_a = _round(values, dtype_a)
+    _, rounded_b = _round(values, dtype_b)
+    return ulp_distance(rounded_a, rounded_b, dtype_a if unit is None else unit)
+
+
+def exact_difference(a, b):
+    """``b - a`` for two floats as an exact :class:`decimal.Decimal` (NaN when undefined)."""
+    with decimal.localcontext() as context:
+        context.prec = EXACT_DIGITS
+        context.traps[decimal.InvalidOperation] = False  # inf - inf gives NaN
+        return decimal.Decimal(float(b)) - decimal.Decimal(float(a))
+
+
+def _format_difference(difference):
+    if difference.is_nan():
+        return "-"
+    if difference.is_infinite():
+        return "∞"
+    # Formatting without a precision keeps every digit of the exact value.
+    return f"{difference:e}" if difference else "0"
+
+
+def neighbor_rows(value, dtypes):
+    """One row of :data:`NEIGHBOR_COLUMNS` per dtype for ``value``, with exact distances.
+
+    "Previous" and "Next" are ``"-"`` when no value of the type lies below
+    or above ``value``.
+    """
+    rows = []
+    for dtype in dtypes:
+        found = neighbors([value], dtype)
+        below, nearest, above = (float(v[0]) for v in found.values())
+        # Saturated neighbours do not bracket the value; NaN keeps its NaN neighbours.
+        has_below, has_above = not below >= value, not above <= value
+        rows.append(dict(zip(NEIGHBOR_COLUMNS, (
+            dtype,
+            repr(below) if has_below else "-",
+            repr(nearest),
+            repr(above) if has_above else "-",
+            repr(float(found.ulp[0])),
+            _format_difference(exact_difference(below, value)) if has_below else "-",
+            _format_difference(exact_difference(value, above)) if has_above else "-",
+        ))))
+    return rows
@@ -0,0 +1,110 @@
+"""Sharded, multi-process version of :func:`analyzer.analyze_array`.
+
+The input is split into contiguous shards whose boundaries fall on chunk
+boundaries, and each shard is scanned by a worker of a
+``ProcessPoolExecutor``. Workers never receive the data itself: files are
+re-opened with ``np.memmap`` in the worker, and in-memory arrays are copied
+once into a ``multiprocessing.shared_memory`` block that workers attach to by
+name. Only the small per-shard :class:`PrecisionStats` travel back, and they
+are merged in shard order, so the result is identical to a serial scan with
+the same ``chunk_size``.
+"""
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .analyzer import (
+    DEFAULT_CHUNK_SIZE,
+    TARGETS,
+    PrecisionStats,
+    analyze_array,
+    iter_chunks,
+    open_tensor_file,
+)
+
+# Shards per worker; more than one evens out stragglers.
+SHARDS_PER_WORKER = 4
+
+
+def _shard_bounds(size, chunk_size, shards):
+    chunks = -(-size // chunk_size)
+    per_shard = max(1, -(-chunks // shards))
+    step = per_shard * chunk_size
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def _open_source(source):
+    if source[0] == "memmap":
+        _, path, dtype, offset, shape, order = source
+        return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape, order=order), None
+    _, name, dtype, shape = source
+    shm = shared_memory.SharedMemory(name=name)
+    return np.ndarray(shape, dtype=dtype, buffer=shm.buf), shm
+
+
+def _scan_shard(source, start, stop, chunk_size, targets):
+    array, shm = _open_source(source)
+    try:
+        stats = PrecisionStats(targets)
+        for chunk in iter_chunks(array, chunk_size, start, stop):
+            stats.update(chunk)
+        return stats
+    finally:
+        # The view must be released before the shared block can be closed.
+        del array
+        if shm is not None:
+            shm.close()
+
+
+def _describe_memmap(array):
+    # Only a memmap that owns its mapping describes the whole file region;
+    # slices of it share the mapping but not its offset and shape.
+    if isinstance(array, np.memmap) and isinstance(array.base, mmap.mmap) and array.filename:
+        order = "F" if array.flags.f_contiguous and not array.flags.c_contiguous else "C"
+        return ("memmap", array.filename, array.dtype.str, array.offset, array.shape, order)
+    return None
+
+
+def parallel_analyze(source, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, dtype="float32",
+                     offset=0, targets=TARGETS, mp_context=None):
+    """Scan ``source`` for precision statistics using ``workers`` processes.
+
+    ``source`` is a path (opened as in :func:`analyzer.analyze_file` with
+    ``dtype`` and ``offset``) or an array. ``workers`` defaults to the number
+    of CPUs; with one worker the scan runs in the calling process.
+    ``mp_context`` is passed on to the ``ProcessPoolExecutor``; use a
+    ``"spawn"`` context when calling from a multi-threaded server.
+    """
+    workers = workers or os.cpu_count() or 1
+    if isinstance(source, (str, os.PathLike)):
+        source = open_tensor_file(source, dtype, offset)
+    elif not isinstance(source, np.memmap):
+        source = np.asarray(source)
+    bounds = _shard_bounds(source.size, chunk_size, workers * SHARDS_PER_WORKER)
+    if workers == 1 or len(bounds) <= 1:
+        return analyze_array(source, chunk_size, targets)
+
+    shm = None
+    try:
+        spec = _describe_memmap(source)
+        if spec is None:
+            shm = shared_memory.SharedMemory(create=True, size=source.nbytes)
+            np.copyto(np.ndarray(source.shape, dtype=source.dtype, buffer=shm.buf), source)
+            spec = ("shm", shm.name, source.dtype.str, source.shape)
+        with ProcessPoolExecutor(max_workers=min(workers, len(bounds)), mp_context=mp_context) as pool:
+            partials = pool.map(
+                _scan_shard,
+                *zip(*[(spec, start, stop, chunk_size, targets) for start, stop in bounds]),
+            )
+            total = PrecisionStats(targets)
+            for stats in partials:
+                total.merge(stats)
+            return total
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
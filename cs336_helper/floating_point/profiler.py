@@ -0,0 +1,278 @@
+"""Per-tensor dynamic-range profile of model checkpoints.
+
+:func:`read_index` lists the floating-point tensors of a ``.npz`` archive or a
+safetensors file from its header alone. :func:`open_tensor` then maps one
+tensor at a time. The safetensors layout is an 8-byte little-endian header
+length, a JSON header with each tensor's dtype, shape and byte range, then
+the raw data. Uncompressed ``.npz`` members are memory-mapped in place;
+compressed ones are inflated one tensor at a time. Each tensor is streamed
+through :class:`.PrecisionStats` in fixed-size chunks, optionally over
+several processes with :func:`.parallel_analyze`. That measures how much of
+it overflows or flushes in float16, lands in subnormals, or loses bits in
+bfloat16.
+
+Profiles are cached per process, keyed on a fingerprint of the file: its
+path, size, modification time and a hash of its first and last megabyte.
+Reopening an unchanged checkpoint is therefore free, while a rewritten one
+is profiled again.
+"""
+
+import collections
+import hashlib
+import json
+import os
+import struct
+import threading
+import zipfile
+from collections import namedtuple
+
+import numpy as np
+
+from .analyzer import DEFAULT_CHUNK_SIZE, PrecisionStats
+from .parallel import parallel_analyze
+
+PROFILE_TARGETS = ("float16", "bfloat16")
+
+# safetensors dtype -> (our dtype name, storage dtype). bfloat16 is kept as
+# uint16 payloads, which the analyzer decodes.
+SAFETENSORS_DTYPES = {
+    "F64": ("float64", "<f8"),
+    "F32": ("float32", "<f4"),
+    "F16": ("float16", "<f2"),
+    "BF16": ("bfloat16", "<u2"),
+}
+NUMPY_DTYPES = ("float16", "float32", "float64")
+
+# Bytes hashed at each end of the file for its fingerprint.
+FINGERPRINT_BYTES = 1 << 20
+
+# Distinct files whose profiles are kept per process.
+PROFILE_CACHE_SIZE = 16
+
+TensorEntry = namedtuple("TensorEntry", ["name", "dtype", "shape", "location"])
+TensorEntry.__doc__ = """One tensor of a checkpoint, as listed by :func:`read_index`.
+
+``location`` is where its data lives: ``("raw", byte offset, storage dtype,
+fortran_order)`` for data that can be memory-mapped, or ``("npz", member
+name)`` for a compressed ``.npz`` member.
+"""
+
+TensorProfile = namedtuple("TensorProfile", ["name", "dtype", "shape", "stats"])
+FileProfile = namedtuple("FileProfile", ["path", "fingerprint", "tensors", "skipped", "total"])
+FileProfile.__doc__ = """Profile of a whole checkpoint.
+
+``tensors`` holds a :class:`TensorProfile` per floating-point tensor,
+``skipped`` the names of tensors with other dtypes, and ``total`` the
+:class:`.PrecisionStats` of all tensors merged.
+"""
+
+
+def _is_safetensors(path):
+    return not zipfile.is_zipfile(path)
+
+
+def _safetensors_index(path):
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        prefix = f.read(8)
+        if len(prefix) < 8:
+            raise ValueError(f"{path} is neither a .npz archive nor a safetensors file")
+        (header_len,) = struct.unpack("<Q", prefix)
+        # Check the length before reading, so a bogus one cannot allocate memory.
+        if 8 + header_len > size:
+            raise ValueError(f"{path} is neither a .npz archive nor a safetensors file "
+                             f"(header length {header_len:,} exceeds the file size)")
+        try:
+            header = json.loads(f.read(header_len))
+        except ValueError:
+            raise ValueError(f"{path} does not have a valid safetensors JSON header") from None
+    if not isinstance(header, dict):
+        raise ValueError(f"{path} does not have a valid safetensors JSON header")
+    data_start = 8 + header_len
+    entries, skipped = [], []
+    for name, info in header.items():
+        if name == "__metadata__":
+            continue
+        try:
+            dtype_code, shape = info["dtype"], tuple(int(n) for n in info["shape"])
+            begin, end = (int(offset) for offset in info["data_offsets"])
+        except (TypeError, KeyError, ValueError):
+            raise ValueError(f"Invalid safetensors header entry for tensor {name!r}") from None
+        if not 0 <= begin <= end <= size - data_start or min(shape, default=0) < 0:
+            raise ValueError(f"Tensor {name!r} lies outside the file (bytes {begin:,}-{end:,})")
+        if dtype_code not in SAFETENSORS_DTYPES:
+            skipped.append(name)
+            continue
+        dtype, storage = SAFETENSORS_DTYPES[dtype_code]
+        if end - begin != int(np.prod(shape)) * np.dtype(storage).itemsize:
+            raise ValueError(f"Tensor {name!r} has {end - begin:,} bytes, which does not match "
+                             f"shape {shape} of {dtype}")
+        entries.append(TensorEntry(name, dtype, shape, ("raw", data_start + begin, storage, False)))
+    return entries, skipped
+
+
+def _read_npy_header(f):
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(f)
+    return np.lib.format.read_array_header_2_0(f)
+
+
+def _npz_index(path):
+    entries, skipped = [], []
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as raw:
+        for info in archive.infolist():
+            if not info.filename.endswith(".npy"):
+                continue
+            name = info.filename[:-len(".npy")]
+            if info.compress_type == zipfile.ZIP_STORED:
+                # The member's bytes follow its local header: 30 fixed bytes,
+                # then the file name and the extra field.
+                raw.seek(info.header_offset + 26)
+                name_len, extra_len = struct.unpack("<HH", raw.read(4))
+                raw.seek(info.header_offset + 30 + name_len + extra_len)
+                shape, fortran_order, dtype = _read_npy_header(raw)
+                location = ("raw", raw.tell(), dtype.str, fortran_order)
+            else:
+                with archive.open(info) as member:
+                    shape, fortran_order, dtype = _read_npy_header(member)
+                location = ("npz", info.filename)
+            if dtype.name not in NUMPY_DTYPES:
+                skipped.append(name)
+                continue
+            entries.append(TensorEntry(name, dtype.name, tuple(shape), location))
+    return entries, skipped
+
+
+def read_index(path):
+    """List the tensors of a ``.npz`` or safetensors file without reading their data.
+
+    Returns ``(entries, skipped)``: :class:`TensorEntry` tuples for the
+    floating-point tensors and the names of all other tensors.
+    """
+    if _is_safetensors(path):
+        return _safetensors_index(path)
+    return _npz_index(path)
+
+
+def open_tensor(path, entry):
+    """Memory-map (or, for compressed ``.npz`` members, load) the data of ``entry``."""
+    if entry.location[0] == "npz":
+        with zipfile.ZipFile(path) as archive, archive.open(entry.location[1]) as member:
+            return np.lib.format.read_array(member, allow_pickle=False)
+    _, offset, storage, fortran_order = entry.location
+    nbytes = int(np.prod(entry.shape)) * np.dtype(storage).itemsize
+    if offset + nbytes > os.path.getsize(path):
+        raise ValueError(f"Tensor {entry.name!r} lies outside the file {path}")
+    if nbytes == 0:
+        return np.empty(entry.shape, dtype=storage)
+    return np.memmap(path, dtype=storage, mode="r", offset=offset, shape=entry.shape,
+                     order="F" if fortran_order else "C")
+
+
+def file_fingerprint(path):
+    """``(path, size, mtime_ns, digest)`` identifying the current contents of ``path``.
+
+    The digest covers the first and last :data:`FINGERPRINT_BYTES` bytes,
+    which hold the header or the ``.npz`` directory of every checkpoint.
+    """
+    path = os.path.realpath(path)
+    stat = os.stat(path)
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        digest.update(f.read(FINGERPRINT_BYTES))
+        if stat.st_size > FINGERPRINT_BYTES:
+            f.seek(max(FINGERPRINT_BYTES, stat.st_size - FINGERPRINT_BYTES))
+            digest.update(f.read())
+    return (path, stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+
+
+# (fingerprint, chunk_size) -> FileProfile, least recently used first. Streamlit
+# serves sessions from several threads, hence the lock.
+_profiles = collections.OrderedDict()
+_profiles_lock = threading.Lock()
+
+
+def _lookup(key):
+    with _profiles_lock:
+        profile = _profiles.get(key)
+        if profile is not None:
+            _profiles.move_to_end(key)
+        return profile
+
+
+def cached_profile(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """The cached :class:`FileProfile` of ``path`` if its contents are unchanged, else ``None``."""
+    return _lookup((file_fingerprint(path), chunk_size))
+
+
+def profile_file(path, workers=1, chunk_size=DEFAULT_CHUNK_SIZE, mp_context=None):
+    """Profile every floating-point tensor of ``path`` and return a :class:`FileProfile`.
+
+    ``workers`` and ``mp_context`` are passed on to :func:`.parallel_analyze`
+    for each tensor. The result does not depend on ``workers``, so cached
+    profiles are shared across worker counts.
+    """
+    key = (file_fingerprint(path), chunk_size)
+    cached = _lookup(key)
+    if cached is not None:
+        return cached
+
+    entries, skipped = read_index(path)
+    tensors = []
+    total = PrecisionStats(PROFILE_TARGETS)
+    for entry in entries:
+        array = open_tensor(path, entry)
+        stats = parallel_analyze(array, workers, chunk_size, targets=PROFILE_TARGETS, mp_context=mp_context)
+        del array
+        total.merge(stats)
+        tensors.append(TensorProfile(entry.name, entry.dtype, entry.shape, stats))
+
+    profile = FileProfile(key[0][0], key[0], tensors, skipped, total)
+    with _profiles_lock:
+        _profiles[key] = profile
+        while len(_profiles) > PROFILE_CACHE_SIZE:
+            _profiles.popitem(last=False)
+    return profile
+
+
+def clear_profile_cache():
+    """Forget every cached profile."""
+    with _profiles_lock:
+        _profiles.clear()
+
+
+def exponent_range(stats):
+    """Smallest and largest unbiased exponent seen in bfloat16 (the float32 range), or ``None``."""
+    hist = stats.formats["bfloat16"].exponent_hist
+    used = np.flatnonzero(hist[1:-1]) + 1  # normal binades only
+    if used.size == 0:
+        return None
+    return int(used[0]) - 127, int(used[-1]) - 127
+
+
+def _percent(part, whole):
+    return f"{100.0 * part / whole:.3g}%" if whole else "-"
+
+
+def profile_rows(profile):
+    """One summary dict per tensor, plus a final row for the whole file."""
+    rows = []
+    for tensor in profile.tensors + [TensorProfile("(all tensors)", "", (), profile.total)]:
+        stats = tensor.stats
+        f16, bf16 = stats.formats["float16"], stats.formats["bfloat16"]
+        span = exponent_range(stats)
+        rows.append({
+            "Tensor": tensor.name,
+            "Dtype": tensor.dtype,
+            "Shape": "×".join(map(str, tensor.shape)) if tensor.shape else "",
+            "Elements": f"{stats.count:,}",
+            "Exponent range": f"2^{span[0]} … 2^{span[1]}" if span else "-",
+            "fp16 overflow": _percent(f16.overflow, stats.count),
+            "fp16 underflow": _percent(f16.underflow, stats.count),
+            "fp16 subnormal": _percent(f16.subnormal, stats.count),
+            "bf16 inexact": _percent(bf16.inexact, stats.count),
+            "bf16 max rel. error": f"{bf16.max_rel_error:.3g}",
+            "bf16 mean rel. error": f"{bf16.mean_rel_error:.3g}",
+        })
+    return rows
@@ -0,0 +1,366 @@
+"""Headless batch conversion: a streaming CLI and a small HTTP endpoint.
+
+Both read a stream of values, convert it chunk by chunk with
+:class:`.BitFieldView` and write one NDJSON line per value::
+
+    {"value": 0.1, "bfloat16": {"bits": "0011110111001101", "sign": 0,
+     "exponent": 123, "mantissa": 77, "decimal": 0.10009765625}}
+
+Input formats:
+
+* ``text``: numbers separated by whitespace or newlines (``nan``/``inf`` allowed).
+* ``ndjson``: one JSON number, numeric string or array of numbers per line.
+* ``f32`` / ``f64``: raw little-endian float32 / float64 buffers.
+
+Memory use is bounded by ``chunk_size`` values, whatever the stream length.
+Text is read in fixed-size blocks, so that holds even when every value is on
+one line. An NDJSON line is parsed whole, so one line holding a huge array
+still has to fit in memory.
+Non-finite decimals are written as the strings ``"nan"``, ``"inf"`` and
+``"-inf"``, so the output is strict JSON.
+
+Command line::
+
+    python -m cs336_helper.floating_point.service convert -t float16 bfloat16 < values.txt
+    python -m cs336_helper.floating_point.service convert -i f32 < weights.bin > bits.ndjson
+    python -m cs336_helper.floating_point.service serve --port 8000
+
+The server answers ``POST /convert?dtype=float16&dtype=bfloat16&format=f32``
+with the request body as input, streaming the response with chunked transfer
+encoding. It speaks HTTP/1.1 with keep-alive, so clients may pipeline
+requests on one connection, and handles each connection in its own thread.
+``GET /health`` returns ``ok``.
+"""
+
+import argparse
+import io
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from .bitview import BitFieldView
+from .formats import available_formats
+
+INPUT_FORMATS = ("text", "ndjson", "f32", "f64")
+DEFAULT_DTYPES = ("float16", "bfloat16", "float32")
+
+# Values converted per chunk; the working set is a few hundred bytes per value.
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Bytes of text input read at a time, and the longest number accepted.
+TEXT_BLOCK_SIZE = 1 << 16
+MAX_TOKEN_BYTES = 1024
+
+_BINARY_DTYPES = {"f32": np.dtype("<f4"), "f64": np.dtype("<f8")}
+
+
+def _check_request(dtypes, input_format):
+    if input_format not in INPUT_FORMATS:
+        raise ValueError(f"Unknown input format {input_format!r}; expected one of {INPUT_FORMATS}")
+    known = available_formats()
+    for dtype in dtypes:
+        if dtype not in known:
+            raise ValueError(f"Unsupported dtype {dtype!r}; expected one of {known}")
+
+
+def _parse_json_line(line):
+    item = json.loads(line)
+    items = item if isinstance(item, list) else [item]
+    values = []
+    for x in items:
+        # JSON null, booleans, objects and nested arrays are not numbers.
+        if isinstance(x, bool) or not isinstance(x, (int, float, str)):
+            raise ValueError(f"Not a number: {x!r}")
+        try:
+            values.append(float(x))
+        except (ValueError, OverflowError):  # int too large for a float
+            raise ValueError(f"Not a number: {x!r}") from None
+    return values
+
+
+def iter_value_chunks(stream, input_format="text", chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield float64 arrays of at most about ``chunk_size`` values from a binary ``stream``."""
+    if input_format in _BINARY_DTYPES:
+        dtype = _BINARY_DTYPES[input_format]
+        nbytes = chunk_size * dtype.itemsize
+        pending = b""
+        while True:
+            data = stream.read(nbytes - len(pending))
+            if not data:
+                break
+            pending += data
+            usable = len(pending) - len(pending) % dtype.itemsize
+            if usable:
+                yield np.frombuffer(pending[:usable], dtype=dtype).astype(np.float64)
+                pending = pending[usable:]
+        if pending:
+            raise ValueError(f"Input ends with {len(pending)} stray byte(s) of a {dtype.itemsize}-byte value")
+        return
+
+    source = _ndjson_values(stream) if input_format == "ndjson" else _text_values(stream)
+    values = []
+    for parsed in source:
+        values.extend(parsed)
+        while len(values) >= chunk_size:
+            yield np.array(values[:chunk_size], dtype=np.float64)
+            del values[:chunk_size]
+    if values:
+        yield np.array(values, dtype=np.float64)
+
+
+def _text_values(stream):
+    # Fixed-size blocks, so one enormous line does not have to fit in memory.
+    pending = b""
+    while True:
+        block = stream.read(TEXT_BLOCK_SIZE)
+        if not block:
+            break
+        tokens = (pending + block).split()
+        # A block that does not end in whitespace may cut its last number in two.
+        pending = tokens.pop() if tokens and not block[-1:].isspace() else b""
+        if len(pending) > MAX_TOKEN_BYTES:
+            raise ValueError(f"Not a number: {pending[:MAX_TOKEN_BYTES]!r}...")
+        yield [_parse_token(token) for token in tokens]
+    if pending:
+        yield [_parse_token(pending)]
+
+
+def _parse_token(token):
+    try:
+        return float(token)
+    except ValueError:
+        raise ValueError(f"Not a number: {token.decode(errors='replace')!r}") from None
+
+
+def _ndjson_values(stream):
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield _parse_json_line(line)
+
+
+def _json_numbers(values):
+    # repr() is the shortest round-tripping form; only non-finite values need patching.
+    numbers = list(map(repr, values.tolist()))
+    for i in np.flatnonzero(~np.isfinite(values)).tolist():
+        numbers[i] = f'"{numbers[i]}"'
+    return numbers
+
+
+def convert_chunk(values, dtypes=DEFAULT_DTYPES):
+    """Render one NDJSON line (without newline) per element of ``values``."""
+    columns = [_json_numbers(values)]
+    for dtype in dtypes:
+        view = BitFieldView.from_values(values, dtype)
+        columns.append([
+            f'"{dtype}":{{"bits":"{bits}","sign":{sign},"exponent":{exponent},"mantissa":{mantissa},'
+            f'"decimal":{decimal}}}'
+            for bits, sign, exponent, mantissa, decimal in zip(
+                view.render("bits", group=None).tolist(), view.sign.tolist(), view.exponent.tolist(),
+                view.mantissa.tolist(), _json_numbers(view.decimal.astype(np.float64)),
+            )
+        ])
+    return ['{"value":' + ",".join(row) + "}" for row in zip(*columns)]
+
+
+def convert_stream(instream, outstream, dtypes=DEFAULT_DTYPES, input_format="text",
+                   chunk_size=DEFAULT_CHUNK_SIZE):
+    """Convert every value of the binary ``instream`` and write NDJSON to the binary ``outstream``.
+
+    Returns the number of values converted.
+    """
+    _check_request(dtypes, input_format)
+    count = 0
+    for values in iter_value_chunks(instream, input_format, chunk_size):
+        lines = convert_chunk(values, dtypes)
+        outstream.write(("\n".join(lines) + "\n").encode())
+        count += len(lines)
+    return count
+
+
+def _content_length(value):
+    # Digits only: int() would also take "-5", "+5", " 5" or "1_000".
+    if value is None:
+        return 0
+    if not (value.isascii() and value.isdigit()):
+        raise ValueError(f"Invalid Content-Length {value!r}")
+    return int(value)
+
+
+class _BodyReader(io.RawIOBase):
+    # Request body with either a Content-Length or chunked transfer encoding.
+
+    def __init__(self, rfile, length=None, chunked=False):
+        self._rfile = rfile
+        self._remaining = length or 0
+        self._chunked = chunked
+        self._done = not chunked and not length
+        # Set once the body is malformed or truncated; it can then not be drained.
+        self.broken = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        try:
+            return self._readinto(buffer)
+        except ValueError:
+            self.broken = True
+            raise
+
+    def _readinto(self, buffer):
+        if self._done:
+            return 0
+        if self._remaining == 0:  # only reached for chunked bodies
+            size_line = self._rfile.readline().split(b";")[0]
+            try:
+                self._remaining = int(size_line, 16)
+            except ValueError:
+                raise ValueError(f"Malformed chunk size {size_line.strip()!r}") from None
+            if self._remaining == 0:
+                while self._rfile.readline() not in (b"\r\n", b"\n", b""):
+                    pass
+                self._done = True
+                return 0
+        data = self._rfile.read(min(len(buffer), self._remaining))
+        if not data:
+            raise ValueError("Request body ended early")
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        if self._remaining == 0:
+            if self._chunked:
+                self._rfile.readline()
+            else:
+                self._done = True
+        return len(data)
+
+
+class _ChunkedWriter:
+    def __init__(self, wfile):
+        self._wfile = wfile
+
+    def write(self, data):
+        if data:
+            self._wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def close(self):
+        self._wfile.write(b"0\r\n\r\n")
+
+
+class ConversionHandler(BaseHTTPRequestHandler):
+    """``POST /convert`` streams conversions back; ``GET /health`` is a liveness probe."""
+
+    protocol_version = "HTTP/1.1"
+    chunk_size = DEFAULT_CHUNK_SIZE
+
+    def _send_text(self, status, text):
+        body = text.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if urlsplit(self.path).path == "/health":
+            self._send_text(200, "ok\n")
+        else:
+            self._send_text(404, "not found\n")
+
+    def _discard(self, body, reader):
+        # Skip the unread body so the next request on this connection can be parsed.
+        if not reader.broken:
+            try:
+                body.read()
+                return
+            except ValueError:
+                pass
+        # The rest of the body cannot be framed, so the connection cannot be reused.
+        self.close_connection = True
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        chunked = "chunked" in self.headers.get("Transfer-Encoding", "").lower()
+        try:
+            length = 0 if chunked else _content_length(self.headers.get("Content-Length"))
+        except ValueError as exc:
+            # Without a length the body cannot be skipped, so the connection cannot be reused.
+            self.close_connection = True
+            self._send_text(400, f"{exc}\n")
+            return
+        reader = _BodyReader(self.rfile, length, chunked)
+        body = io.BufferedReader(reader)
+        if url.path != "/convert":
+            self._discard(body, reader)
+            self._send_text(404, "not found\n")
+            return
+        query = parse_qs(url.query)
+        dtypes = query.get("dtype") or list(DEFAULT_DTYPES)
+        input_format = query.get("format", ["text"])[-1]
+        try:
+            _check_request(dtypes, input_format)
+        except ValueError as exc:
+            self._discard(body, reader)
+            self._send_text(400, f"{exc}\n")
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        out = _ChunkedWriter(self.wfile)
+        try:
+            convert_stream(body, out, dtypes, input_format, self.chunk_size)
+        except ValueError as exc:
+            # Headers are already sent: report the error as a final NDJSON line.
+            out.write((json.dumps({"error": str(exc)}) + "\n").encode())
+            self._discard(body, reader)
+        out.close()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(host="127.0.0.1", port=8000):
+    """A :class:`ThreadingHTTPServer` serving :class:`ConversionHandler`; call ``serve_forever()``."""
+    return ThreadingHTTPServer((host, port), ConversionHandler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert streams of numbers to floating-point bit fields.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="read values from stdin, write NDJSON to stdout")
+    convert.add_argument("-t", "--dtypes", nargs="+", default=list(DEFAULT_DTYPES))
+    convert.add_argument("-i", "--input", choices=INPUT_FORMATS, default="text")
+    convert.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+
+    serve = commands.add_parser("serve", help="run the HTTP endpoint")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8000)
+
+    args = parser.parse_args(argv)
+    if args.command == "convert":
+        try:
+            convert_stream(sys.stdin.buffer, sys.stdout.buffer, args.dtypes, args.input, args.chunk_size)
+        except ValueError as exc:
+            parser.exit(1, f"error: {exc}\n")
+        sys.stdout.buffer.flush()
+        return 0
+
+    server = make_server(args.host, args.port)
+    print(f"Serving conversions on http://{args.host}:{server.server_port}/convert", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Rounding-error sweeps across the whole dynamic range of a format.
+
+:func:`error_sweep` evaluates the absolute and relative rounding error and
+the ULP size of a format at many magnitudes in one vectorized pass. Formats
+of up to 16 bits can be swept exhaustively: the sample points are then the
+midpoints between every pair of consecutive positive representable values,
+which is where the rounding error peaks. Results are cached per format and
+sample count for the lifetime of the process, so every user of the page is
+served the same arrays.
+"""
+
+import functools
+from collections import namedtuple
+
+import numpy as np
+
+from .batch import float_to_bin_and_decimal_batch
+from .formats import decode, get_format, ulp
+
+# Log-spaced sample count used when a format is too wide to enumerate.
+DEFAULT_SAMPLES = 1 << 16
+
+Sweep = namedtuple(
+    "Sweep",
+    ["dtype", "x", "rounded", "abs_error", "rel_error", "ulp",
+     "min_subnormal", "min_normal", "max_finite", "overflow_threshold"],
+)
+Sweep.__doc__ = """Rounding error of ``dtype`` sampled at positive magnitudes ``x``.
+
+``rounded`` is what the format stores for each ``x`` and ``ulp`` the spacing
+of representable values at that magnitude. The scalar fields mark the
+subnormal, normal and overflow boundaries; inputs at or above
+``overflow_threshold`` (half an ULP past ``max_finite``) may no longer round
+to a finite value.
+"""
+
+
+def _exhaustive_points(fmt):
+    values = decode(np.arange(1, fmt.max_finite_code + 1), fmt)
+    return (values[:-1] + values[1:]) / 2
+
+
+@functools.lru_cache(maxsize=None)
+def error_sweep(dtype, samples=None):
+    """Sweep ``dtype`` over its dynamic range and return a read-only :class:`Sweep`.
+
+    With ``samples=None`` formats of up to 16 bits are swept exhaustively and
+    wider ones at :data:`DEFAULT_SAMPLES` log-spaced points. A sample count
+    always selects log-spaced points from half the smallest subnormal to
+    twice the overflow threshold.
+    """
+    fmt = get_format(dtype)
+    max_finite = fmt.max_finite
+    overflow_threshold = max_finite + float(ulp(max_finite, fmt)) / 2
+    if samples is None and fmt.width <= 16:
+        x = _exhaustive_points(fmt)
+    else:
+        x = np.geomspace(fmt.min_subnormal / 2, overflow_threshold * 2, samples or DEFAULT_SAMPLES)
+
+    rounded = float_to_bin_and_decimal_batch(x, fmt.name).decimal.astype(np.float64)
+    with np.errstate(invalid="ignore"):
+        abs_error = np.abs(rounded - x)
+    abs_error[~np.isfinite(rounded)] = np.inf
+    result = Sweep(
+        dtype=fmt.name,
+        x=x,
+        rounded=rounded,
+        abs_error=abs_error,
+        rel_error=abs_error / x,
+        ulp=ulp(x, fmt),
+        min_subnormal=fmt.min_subnormal,
+        min_normal=fmt.min_normal,
+        max_finite=max_finite,
+        overflow_threshold=overflow_threshold,
+    )
+    for array in result[1:6]:
+        array.flags.writeable = False
+    return result
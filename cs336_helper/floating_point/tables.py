@@ -0,0 +1,78 @@
+"""Precomputed tables covering every float16 and bfloat16 encoding.
+
+A 16-bit format has only 65,536 bit patterns, so everything the explorer
+derives from a payload (decoded value, class, ULP and the bit strings of each
+field) can be computed once, vectorized, and then looked up by index. Tables
+are built lazily on first use and cached for the lifetime of the process;
+their arrays are read-only because every caller shares them.
+"""
+
+import functools
+from collections import namedtuple
+
+import numpy as np
+
+from .batch import LAYOUTS, _bit_digits
+from .bfloat16 import bfloat16_to_float32
+from .formats import CLASSES, classify, code_ulp
+
+TABLE_DTYPES = ("float16", "bfloat16")
+
+LookupTable = namedtuple(
+    "LookupTable",
+    ["dtype", "value", "kind", "ulp", "bits", "sign", "exponent", "mantissa"],
+)
+LookupTable.__doc__ = """All 65,536 encodings of a 16-bit format, indexed by payload.
+
+``value`` holds the decoded values (float16 for float16, float32 for
+bfloat16), ``kind`` an index into :data:`CLASSES`, ``ulp`` the float64 gap to
+the next representable magnitude (NaN for Inf and NaN), and ``bits``,
+``sign``, ``exponent`` and ``mantissa`` the bit strings of each field.
+"""
+
+
+def _strings(digits, start, stop):
+    width = stop - start
+    field = np.ascontiguousarray(digits[:, start:stop])
+    return field.view(f"S{width}")[:, 0].astype(f"U{width}")
+
+
+@functools.lru_cache(maxsize=None)
+def lookup_table(dtype):
+    """Return the cached :class:`LookupTable` for ``"float16"`` or ``"bfloat16"``."""
+    if dtype not in TABLE_DTYPES:
+        raise ValueError(f"No lookup table for {dtype!r}; expected one of {TABLE_DTYPES}")
+    sign_len, exp_len, mant_len = LAYOUTS[dtype]
+    payload = np.arange(1 << 16, dtype=np.uint32).astype(np.uint16)
+    if dtype == "float16":
+        value = payload.view(np.float16)
+    else:
+        value = bfloat16_to_float32(payload)
+
+    kind = classify(payload, dtype)
+    ulp = code_ulp(payload, dtype)
+
+    digits = _bit_digits(payload, 16)
+    table = LookupTable(
+        dtype=dtype,
+        value=value,
+        kind=kind,
+        ulp=ulp,
+        bits=_strings(digits, 0, 16),
+        sign=_strings(digits, 0, sign_len),
+        exponent=_strings(digits, sign_len, sign_len + exp_len),
+        mantissa=_strings(digits, sign_len + exp_len, 16),
+    )
+    for column in table[1:]:
+        column.flags.writeable = False
+    return table
+
+
+def decode_payloads(payload, dtype):
+    """Decode an array of 16-bit payloads with a single gather from the table."""
+    return lookup_table(dtype).value[np.asarray(payload, dtype=np.uint16)]
+
+
+def classify_payloads(payload, dtype):
+    """Return the :data:`CLASSES` index of every 16-bit payload."""
+    return lookup_table(dtype).kind[np.asarray(payload, dtype=np.uint16)]
@@ -0,0 +1,245 @@
+"""Per-stage wall-time instrumentation of the explorer.
+
+The explorer's work is split into a few named stages (:data:`STAGES`):
+converting values, formatting bit strings, building tables for
+``st.table`` and building the special-values table. Code wraps each stage
+in ``with stage("conversion"):``. Every stage adds its call count and wall
+time to process-wide totals and to the record of the current rerun, which
+a page opens with :func:`begin_run` and closes with :func:`end_run`.
+Streamlit runs each session's script in its own thread, so the current
+rerun is tracked per thread.
+
+Instrumentation is off unless ``CS336_TIMING`` is set to anything but
+``""``/``"0"`` in the environment, or :func:`enable` is called. While it is
+off, :func:`stage` returns one shared no-op context manager and records
+nothing, so instrumented code pays for a global lookup and a function call.
+
+The collected data is available as a dict (:func:`snapshot`), as Prometheus
+text (:func:`prometheus_text`) and over HTTP from :func:`make_metrics_server`:
+``GET /metrics`` and ``GET /metrics.json``. :func:`start_metrics_server`
+runs that server on a daemon thread, once per process. When
+``CS336_METRICS_PORT`` is set, ``serve.py`` starts it before Streamlit, and
+the explorer starts it if it is not running yet.
+"""
+
+import collections
+import contextlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+STAGES = ("conversion", "formatting", "table", "special values")
+
+# Completed reruns kept for the JSON export.
+RUN_HISTORY = 50
+
+_enabled = os.environ.get("CS336_TIMING", "") not in ("", "0")
+_NULL = contextlib.nullcontext()
+
+# stage -> [calls, seconds] since the process started (or :func:`reset`).
+_totals = {}
+# page -> [reruns, seconds]
+_reruns = {}
+_runs = collections.deque(maxlen=RUN_HISTORY)
+_lock = threading.Lock()
+_local = threading.local()
+
+_server = None
+_server_error = None
+
+
+def enabled():
+    """Whether stages are being timed."""
+    return _enabled
+
+
+def enable(flag=True):
+    """Turn timing on (or off with ``flag=False``) for the whole process."""
+    global _enabled
+    _enabled = bool(flag)
+
+
+def reset():
+    """Forget all totals and recorded reruns."""
+    with _lock:
+        _totals.clear()
+        _reruns.clear()
+        _runs.clear()
+    _local.run = None
+
+
+class _Stage:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+def _record(name, seconds):
+    with _lock:
+        total = _totals.setdefault(name, [0, 0.0])
+        total[0] += 1
+        total[1] += seconds
+    run = getattr(_local, "run", None)
+    if run is not None:
+        entry = run["stages"].setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+
+def stage(name):
+    """Context manager timing one call of stage ``name``; a shared no-op while disabled."""
+    if not _enabled:
+        return _NULL
+    return _Stage(name)
+
+
+def begin_run(page):
+    """Start recording a rerun of ``page`` in this thread, dropping any unfinished one."""
+    if not _enabled:
+        _local.run = None
+        return
+    _local.run = {"page": page, "started": time.time(), "start": time.perf_counter(), "stages": {}}
+
+
+def end_run():
+    """Finish the rerun started by :func:`begin_run` and return its record, or ``None``.
+
+    The record is a dict with ``page``, ``started`` (Unix time), ``seconds``
+    and ``stages`` (stage -> ``{"calls", "seconds"}``).
+    """
+    run = getattr(_local, "run", None)
+    _local.run = None
+    if run is None:
+        return None
+    seconds = time.perf_counter() - run["start"]
+    record = {
+        "page": run["page"],
+        "started": run["started"],
+        "seconds": seconds,
+        "stages": {name: {"calls": calls, "seconds": secs} for name, (calls, secs) in run["stages"].items()},
+    }
+    with _lock:
+        page = _reruns.setdefault(run["page"], [0, 0.0])
+        page[0] += 1
+        page[1] += seconds
+        _runs.append(record)
+    return record
+
+
+def run_rows(record):
+    """Table rows (stage, calls, ms, share of the rerun) for a record from :func:`end_run`."""
+    rows = []
+    for name, entry in sorted(record["stages"].items(), key=lambda item: -item[1]["seconds"]):
+        share = entry["seconds"] / record["seconds"] if record["seconds"] else 0.0
+        rows.append({"Stage": name, "Calls": entry["calls"], "Time (ms)": f"{entry['seconds'] * 1e3:.2f}",
+                     "Share of rerun": f"{share:.1%}"})
+    rows.append({"Stage": "(whole rerun)", "Calls": 1, "Time (ms)": f"{record['seconds'] * 1e3:.2f}",
+                 "Share of rerun": "100.0%"})
+    return rows
+
+
+def snapshot():
+    """Totals and recent reruns as a JSON-serialisable dict."""
+    with _lock:
+        return {
+            "enabled": _enabled,
+            "stages": {name: {"calls": calls, "seconds": seconds} for name, (calls, seconds) in _totals.items()},
+            "reruns": {page: {"count": count, "seconds": seconds} for page, (count, seconds) in _reruns.items()},
+            "recent": list(_runs),
+        }
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text():
+    """Totals in the Prometheus text exposition format."""
+    data = snapshot()
+    lines = []
+
+    def metric(name, kind, doc, label, samples):
+        lines.append(f"# HELP {name} {doc}")
+        lines.append(f"# TYPE {name} {kind}")
+        for key, value in samples:
+            lines.append(f'{name}{{{label}="{_label(key)}"}} {value!r}')
+
+    metric("cs336_stage_calls_total", "counter", "Calls of each instrumented stage.", "stage",
+           [(name, entry["calls"]) for name, entry in data["stages"].items()])
+    metric("cs336_stage_seconds_total", "counter", "Wall time spent in each instrumented stage.", "stage",
+           [(name, entry["seconds"]) for name, entry in data["stages"].items()])
+    metric("cs336_reruns_total", "counter", "Recorded page reruns.", "page",
+           [(page, entry["count"]) for page, entry in data["reruns"].items()])
+    metric("cs336_rerun_seconds_total", "counter", "Wall time of recorded page reruns.", "page",
+           [(page, entry["seconds"]) for page, entry in data["reruns"].items()])
+    return "\n".join(lines) + "\n"
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """``GET /metrics`` (Prometheus text) and ``GET /metrics.json``."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, content_type, text):
+        body = text.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/metrics":
+            self._send(200, "text/plain; version=0.0.4; charset=utf-8", prometheus_text())
+        elif path == "/metrics.json":
+            self._send(200, "application/json", json.dumps(snapshot()))
+        else:
+            self._send(404, "text/plain; charset=utf-8", "not found\n")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsServer(ThreadingHTTPServer):
+    # Rebind straight away after a restart, while the old socket is in TIME_WAIT.
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+def make_metrics_server(host="127.0.0.1", port=9100):
+    """A :class:`MetricsServer` serving :class:`MetricsHandler`; call ``serve_forever()``."""
+    return MetricsServer((host, port), MetricsHandler)
+
+
+def start_metrics_server(port, host="127.0.0.1"):
+    """Serve the metrics on a daemon thread, once per process; returns the server.
+
+    Only the first call tries to bind the port. If that fails (another
+    process holds it, say), it and every later call raise the same
+    ``OSError`` without retrying.
+    """
+    global _server, _server_error
+    with _lock:
+        if _server is None and _server_error is None:
+            try:
+                _server = make_metrics_server(host, port)
+            except OSError as exc:
+                _server_error = exc
+            else:
+                threading.Thread(target=_server.serve_forever, name="cs336-metrics", daemon=True).start()
+        if _server_error is not None:
+            raise _server_error
+        return _server
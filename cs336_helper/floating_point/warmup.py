@@ -0,0 +1,106 @@
+"""Process warm-up for the explorer pages.
+
+A new Streamlit process pays for importing NumPy, the converters and the
+libraries behind ``st.table``, and for building the lookup tables, the
+decode tables of the small formats, the special-values table and the
+default comparison rows, on the first rerun of its first session.
+:func:`warm_up` does all of that up front and leaves the results in the
+process-wide caches of :mod:`.tables`, :mod:`.formats` and :mod:`.cache`.
+Later sessions served by the same process then find them ready.
+``serve.py`` at the repository root calls it before starting the server.
+
+``python -m cs336_helper.floating_point.warmup`` runs the warm-up and
+prints the time of each step.
+"""
+
+import importlib
+import sys
+import time
+
+# Submodules imported by the pages.
+MODULES = ("analyzer", "batch", "bitview", "cache", "comparison", "formats", "localfiles", "neighbors", "parallel", "profiler", "timing")
+
+# Imported by Streamlit the first time a page calls ``st.table``, which turns
+# the rows into an Arrow table through pandas. Skipped when not installed.
+TABLE_MODULES = ("pandas", "pyarrow")
+
+# The explorer's default selection and input value.
+WARM_DTYPES = ("float16", "bfloat16", "float32")
+WARM_VALUE = 0.1
+
+_timings = None
+
+
+def _imports():
+    for module in MODULES:
+        importlib.import_module(f".{module}", __package__)
+
+
+def _table_modules():
+    for module in TABLE_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+
+
+def _lookup_tables():
+    from .tables import TABLE_DTYPES, lookup_table
+    for dtype in TABLE_DTYPES:
+        lookup_table(dtype)
+
+
+def _decode_tables():
+    from .formats import available_formats, decode
+    # Decoding formats of up to 16 bits builds and caches a table of all their values.
+    for name in available_formats():
+        decode([0], name)
+
+
+def _special_values():
+    from .cache import special_value_rows
+    special_value_rows()
+    special_value_rows(WARM_DTYPES)
+
+
+def _comparison_rows():
+    from .cache import comparison_row
+    for dtype in WARM_DTYPES:
+        comparison_row(WARM_VALUE, dtype)
+
+
+STEPS = (
+    ("imports", _imports),
+    ("table modules", _table_modules),
+    ("lookup tables", _lookup_tables),
+    ("decode tables", _decode_tables),
+    ("special values", _special_values),
+    ("comparison rows", _comparison_rows),
+)
+
+
+def warm_up():
+    """Fill the process-wide caches the explorer uses; returns ``{step: seconds}``.
+
+    Only the first call does any work. Later calls return the timings of that
+    first call.
+    """
+    global _timings
+    if _timings is None:
+        timings = {}
+        for name, step in STEPS:
+            start = time.perf_counter()
+            step()
+            timings[name] = time.perf_counter() - start
+        _timings = timings
+    return dict(_timings)
+
+
+def main():
+    for name, seconds in warm_up().items():
+        print(f"{name:<16} {seconds * 1e3:8.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
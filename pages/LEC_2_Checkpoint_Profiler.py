@@ -0,0 +1,69 @@
+import streamlit as st
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+from cs336_helper.floating_point.localfiles import ALLOW_ENV, data_dir, local_files_allowed, resolve_data_path
+from cs336_helper.floating_point.profiler import cached_profile, profile_file, profile_rows
+
+st.title("🧪 Checkpoint Precision Profiler")
+st.write("Will this model survive the switch to float16 or bfloat16? Profile every tensor of a checkpoint before you find out in training.")
+st.markdown("""
+Point the profiler at a `.npz` or `.safetensors` file in the server's data directory. Each tensor is memory-mapped on its own and streamed in chunks,
+so checkpoints much larger than the available RAM work too. For every tensor you get:
+
+- **fp16 overflow / underflow**: values beyond float16's largest finite number (65504) that become ∞, and non-zero values that flush to 0.
+- **fp16 subnormal**: values that land below float16's smallest normal number (2⁻¹⁴ ≈ 6.1e-5) and keep fewer significant bits.
+- **bf16 inexact / rel. error**: bfloat16 keeps the float32 range but only 8 significant bits; these columns show how many values lose bits and by how much.
+
+Results are cached per file (path, size, modification time and a hash of the file's header), so reopening an unchanged checkpoint is instant.
+""")
+st.markdown("---")
+
+if not local_files_allowed():
+	st.info(f"Reading files from the server's disk is turned off. Set `{ALLOW_ENV}=1` when running the app locally to use the profiler.")
+	st.stop()
+
+path = st.text_input(f"Path to a .npz or .safetensors file in {data_dir()}", key="profile_path")
+workers = st.number_input("Worker processes", min_value=1, max_value=os.cpu_count() or 1, value=1, step=1, key="profile_workers")
+
+profile = None
+if path:
+	try:
+		resolved = resolve_data_path(path)
+		profile = cached_profile(resolved)
+		if profile is None and st.button("Profile", key="profile_run"):
+			start = time.perf_counter()
+			with st.spinner("Profiling tensors..."):
+				profile = profile_file(resolved, int(workers), mp_context=multiprocessing.get_context("spawn"))
+			st.success(f"Profiled in {time.perf_counter() - start:.2f} s.")
+		elif profile is not None:
+			st.info("Loaded from cache: the file has not changed since it was last profiled.")
+	except (OSError, ValueError, KeyError) as exc:
+		st.error(f"Could not profile `{path}`: {exc}")
+		profile = None
+
+if profile is not None:
+	st.write(f"**{len(profile.tensors):,}** floating-point tensors, **{profile.total.count:,}** values, **{profile.total.nan:,}** NaN.")
+	if profile.skipped:
+		st.caption(f"Skipped {len(profile.skipped):,} non-floating-point tensors: {', '.join(profile.skipped[:10])}{' ...' if len(profile.skipped) > 10 else ''}")
+	st.table(profile_rows(profile))
+
+	names = ["(all tensors)"] + [tensor.name for tensor in profile.tensors]
+	chosen = st.selectbox("Exponent histogram of", names, key="profile_tensor")
+	stats = profile.total if chosen == names[0] else profile.tensors[names.index(chosen) - 1].stats
+	hist = stats.formats["bfloat16"].exponent_hist
+	used = np.flatnonzero(hist[1:-1]) + 1
+	if used.size:
+		span = np.arange(used[0], used[-1] + 1)
+		exponent = span - 127
+		# float16 normals cover 2^-14 .. 2^15; below that subnormals, then zero.
+		region = np.where(exponent > 15, "overflows float16", np.where(exponent < -24, "flushes to zero in float16",
+		                  np.where(exponent < -14, "float16 subnormal", "float16 normal")))
+		st.bar_chart({"exponent (log2 |x|)": exponent, "count": hist[span], "float16": region},
+		             x="exponent (log2 |x|)", y="count", color="float16")
+		st.caption("Exponents after rounding to bfloat16, which has the same range as float32. Zeros, subnormals, ∞ and NaN are not shown.")
+	else:
+		st.caption("No normal values to plot.")
@@ -1,74 +1,26 @@
-def float_to_bin_and_decimal(value, dtype):
-	import numpy as np
-	if dtype == "float16":
-		f = np.float16(value)
-		b = np.binary_repr(np.frombuffer(f.tobytes(), dtype=np.uint16)[0], width=16)
-		return b, 1, 5, 10, float(f)
-	elif dtype == "bfloat16":
-		# bfloat16 (Brain Float 16): 1 sign bit, 8 exponent bits, 7 mantissa bits
-		# It's essentially the upper 16 bits of a float32 representation
-		
-		# Step 1: Convert input to float32 to get the full 32-bit representation
-		f = np.float32(value)
-		
-		# Step 2: Extract the 32-bit integer representation
-		# np.frombuffer reads the float32 bytes as a uint32 integer
-		as_int = np.frombuffer(f.tobytes(), dtype=np.uint32)[0]
-		
-		# Step 3: Apply "Round to nearest, ties to even" rounding rule
-		# Extract the upper 16 bits and the bit that determines rounding
-		upper_16_bits = int((as_int >> 16) & 0xFFFF)  # Convert to Python int
-		lower_16_bits = int(as_int & 0xFFFF)         # Convert to Python int
-		
-		# The rounding bit is the most significant bit of the lower 16 bits (bit 15)
-		rounding_bit = (lower_16_bits >> 15) & 1
-		
-		# For "ties to even": if rounding bit is 1, we need to check:
-		# 1. If there are any bits set in the remaining 15 bits (not a tie)
-		# 2. If it's a tie, round to make the result even (LSB of upper 16 bits = 0)
-		if rounding_bit == 1:
-			# Check if this is a tie (only the rounding bit is set in lower 16 bits)
-			remaining_bits = lower_16_bits & 0x7FFF  # Lower 15 bits
-			is_tie = (remaining_bits == 0)
-			
-			if not is_tie:
-				# Not a tie, round up
-				upper_16_bits += 1
-			elif is_tie and (upper_16_bits & 1) == 1:
-				# It's a tie and current result is odd, round up to make it even
-				upper_16_bits += 1
-			# If it's a tie and current result is even, don't round (keep it even)
-		
-		# Handle overflow (though rare for typical values)
-		bfloat_int = upper_16_bits & 0xFFFF
-		
-		# Step 4: Generate binary representation string for display
-		b = np.binary_repr(bfloat_int, width=16)
-		
-		# Step 5: Reconstruct the decimal value from bfloat16
-		# The key insight: bfloat16 is just float32 with lower 16 bits set to zero
-		# So we reconstruct by shifting the 16-bit value back to upper position
-		reconstructed_int = bfloat_int << 16  # Shift left 16 positions, lower bits become 0
-		
-		# Step 6: Convert the reconstructed integer back to float32
-		# Use the same byte order as the original float32 representation
-		reconstructed_bytes = reconstructed_int.to_bytes(4, byteorder='little')
-		dec = float(np.frombuffer(reconstructed_bytes, dtype=np.float32)[0])
-		
-		return b, 1, 8, 7, dec
-	elif dtype == "float32":
-		# Convert to float32 to get the exact representation stored
-		f = np.float32(value)
-		packed = struct.pack('>f', f)
-		as_int = struct.unpack('>I', packed)[0]
-		b = f"{as_int:032b}"
-		# Return the exact float32 value, not the original input
-		return b, 1, 8, 23, float(f)
-	else:
-		return None, None, None, None, None
-
 import streamlit as st
-import struct
+import multiprocessing
+import os
+
+import numpy as np
+
+from cs336_helper.floating_point import timing
+from cs336_helper.floating_point.analyzer import RAW_DTYPES
+from cs336_helper.floating_point.batch import LAYOUTS
+from cs336_helper.floating_point.cache import comparison_row, special_value_rows
+from cs336_helper.floating_point.comparison import CATEGORIES, SORT_KEYS, comparison_table, parse_values
+from cs336_helper.floating_point.formats import available_formats, decode, get_format
+from cs336_helper.floating_point.localfiles import local_files_allowed, resolve_data_path
+from cs336_helper.floating_point.neighbors import jump, neighbor_rows
+from cs336_helper.floating_point.parallel import parallel_analyze
+
+# CS336_TIMING=1 turns on per-stage timings; CS336_METRICS_PORT also exports them over HTTP.
+if os.environ.get("CS336_METRICS_PORT"):
+	try:
+		timing.start_metrics_server(int(os.environ["CS336_METRICS_PORT"]))
+	except OSError as exc:
+		st.warning(f"Stage timings are not exported: port {os.environ['CS336_METRICS_PORT']} is unavailable ({exc}).")
+timing.begin_run("explorer")
 
 st.title("🔢 IEEE 754 Floating-Point Explorer")
 st.write("Interactive tool to explore floating-point representations, precision, and range across different formats: float16, bfloat16, and float32.")
@@ -77,99 +29,102 @@ Under the converter section, you can also find explanations about the IEEE 754 s
 """)
 st.markdown("---")
 
-def format_bits(bits, group=4):
-	# Insert space after every 'group' bits
-
-	return ' '.join([bits[i:i+group] for i in range(0, len(bits), group)])
-
-def float_to_bin(value, dtype):
-	if dtype == "float16":
-		import numpy as np
-		# IEEE 754 half precision: 1 sign, 5 exponent, 10 mantissa bits
-		f = np.float16(value)
-		b = np.binary_repr(np.frombuffer(f.tobytes(), dtype=np.uint16)[0], width=16)
-		return b, 1, 5, 10
-	elif dtype == "bfloat16":
-		import numpy as np
-		# bfloat16: 1 sign, 8 exponent, 7 mantissa bits
-		# Extract upper 16 bits from float32 representation with proper rounding
-		f = np.float32(value)
-		as_int = np.frombuffer(f.tobytes(), dtype=np.uint32)[0]
-		
-		# Apply "Round to nearest, ties to even" rounding rule
-		upper_16_bits = int((as_int >> 16) & 0xFFFF)  # Convert to Python int
-		lower_16_bits = int(as_int & 0xFFFF)         # Convert to Python int
-		rounding_bit = (lower_16_bits >> 15) & 1
-		
-		if rounding_bit == 1:
-			remaining_bits = lower_16_bits & 0x7FFF
-			is_tie = (remaining_bits == 0)
-			
-			if not is_tie:
-				upper_16_bits += 1
-			elif is_tie and (upper_16_bits & 1) == 1:
-				upper_16_bits += 1
-		
-		bfloat_int = upper_16_bits & 0xFFFF
-		b = np.binary_repr(bfloat_int, width=16)
-		return b, 1, 8, 7
-	elif dtype == "float32":
-		# IEEE 754 single precision: 1 sign, 8 exponent, 23 mantissa bits
-		packed = struct.pack('>f', value)
-		as_int = struct.unpack('>I', packed)[0]
-		b = f"{as_int:032b}"
-		return b, 1, 8, 23
-	else:
-		return None, None, None, None
-
-
-types = ["float16", "bfloat16", "float32"]
+types = available_formats()
 selected_types = st.multiselect("Select float types to compare", types, default=["float16", "bfloat16", "float32"])
 value = st.number_input("⭐ Enter a number to explore ⭐", value=0.1, format="%f", key="main_value")
 
-rows = []
-for dtype in selected_types:
-	# Use the same value for all types, but assign a unique key for each input if you want per-type input
-	bits, sign_len, exp_len, mant_len, dec_value = float_to_bin_and_decimal(value, dtype)
-	if bits:
-		sign = bits[:sign_len]
-		exponent = bits[sign_len:sign_len+exp_len]
-		mantissa = bits[sign_len+exp_len:]
-		
-		# Format decimal with appropriate precision for each type
-		if dtype == "float32":
-			# Show up to 27 significant digits for float32 (sufficient for exact representation)
-			decimal_str = f"{dec_value:.27g}"
-		elif dtype == "float16":
-			# Show up to 13 significant digits for float16
-			decimal_str = f"{dec_value:.13g}"
-		elif dtype == "bfloat16":
-			# Show up to 11 significant digits for bfloat16
-			decimal_str = f"{dec_value:.11g}"
-		else:
-			decimal_str = f"{dec_value}"
-		
-		rows.append({
-			"Type": dtype,
-			"Decimal": decimal_str,
-			"Sign": format_bits(sign),
-			"Exponent": format_bits(exponent),
-			"Mantissa": format_bits(mantissa),
-			"Raw bits": format_bits(bits, 4)
-		})
-	else:
-		rows.append({
-			"Type": dtype,
-			"Decimal": "Error",
-			"Sign": "-",
-			"Exponent": "-",
-			"Mantissa": "-",
-			"Raw bits": "-"
-		})
+rows = [comparison_row(value, dtype) for dtype in selected_types]
 
 if rows:
 	st.subheader("Binary Representation Comparison")
-	st.table(rows)
+	with timing.stage("table"):
+		st.table(rows)
+
+
+def _jump_main_value(dtype, n):
+	# Runs before the rerun, so the input widget can still be updated.
+	target = float(decode(jump([st.session_state.main_value], dtype, n), dtype)[0])
+	if np.isfinite(target):
+		st.session_state.main_value = target
+
+
+with st.expander("🧭 Neighbors and ULPs"):
+	st.markdown("""
+The closest representable values below and above the input in each selected type, the ULP (the gap between adjacent values in that binade)
+and the exact distance from the input to each neighbor. Move the input N ULPs at a time in one of the types to walk through its values.
+""")
+	if selected_types:
+		with timing.stage("table"):
+			st.table(neighbor_rows(value, selected_types))
+		col_type, col_steps, col_prev, col_next = st.columns([2, 2, 1, 1], vertical_alignment="bottom")
+		step_type = col_type.selectbox("Step in", selected_types, key="neighbor_dtype")
+		steps = int(col_steps.number_input("N (ULPs)", min_value=1, value=1, step=1, key="neighbor_steps"))
+		col_prev.button("◀ Previous", key="neighbor_prev", on_click=_jump_main_value, args=(step_type, -steps))
+		col_next.button("Next ▶", key="neighbor_next", on_click=_jump_main_value, args=(step_type, steps))
+		st.caption("The input box shows six decimals; the tables above show the exact values.")
+
+with st.expander("📋 Compare many values"):
+	st.markdown("""
+Paste numbers (separated by spaces, commas or new lines) or upload a text or `.npy` file to compare thousands of values at once.
+Every value is converted to each selected type; only the rows of the current page are formatted.
+""")
+	pasted = st.text_area("Values", key="many_values", placeholder="0.1, 1e-8, 65520, -3.5, nan")
+	uploaded = st.file_uploader("...or upload a file", type=["txt", "csv", "npy"], key="many_values_file")
+	try:
+		many_values = parse_values(uploaded.getvalue() if uploaded is not None else pasted)
+	except ValueError as exc:
+		st.error(f"Could not read the values: {exc}")
+		many_values = np.empty(0)
+	if many_values.size and selected_types:
+		table = comparison_table(many_values, selected_types)
+		counts = table.counts()
+		col_sort, col_order, col_filter = st.columns([2, 1, 3])
+		sort_by = col_sort.selectbox("Sort by", SORT_KEYS, key="many_sort")
+		descending = col_order.checkbox("Descending", value=sort_by in ("abs error", "rel error"), key="many_descending")
+		categories = col_filter.multiselect(
+			"Only show", CATEGORIES, key="many_filter",
+			format_func=lambda c: f"{c} ({counts[c]:,})",
+		)
+		page_size = st.select_slider("Rows per page", options=[10, 25, 50, 100], value=25, key="many_page_size")
+		selected = table.select(categories, sort_by, descending)
+		total = len(selected)
+		pages = max(1, -(-total // page_size))
+		page_number = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, value=1, step=1, key="many_page")
+		first = (int(page_number) - 1) * page_size
+		page_rows = table.format_rows(selected[first:first + page_size])
+		st.caption(f"Rows {min(first + 1, total):,}–{first + len(page_rows):,} of {total:,} "
+		           f"({many_values.size:,} values × {len(selected_types)} types)")
+		if page_rows:
+			with timing.stage("table"):
+				st.table(page_rows)
+
+if local_files_allowed():
+	with st.expander("📂 Analyze a tensor file"):
+		st.markdown("""
+Stream a `.npy` or raw binary weight file from the server's data directory and see how its values would fare when cast to float16 and bfloat16.
+The file is memory-mapped and read in fixed-size chunks, so it can be much larger than the available RAM.
+""")
+		tensor_path = st.text_input("Path to a .npy or raw binary file", key="tensor_path")
+		raw_dtype = st.selectbox("Raw file dtype (ignored for .npy)", RAW_DTYPES, key="tensor_dtype")
+		raw_offset = st.number_input("Header bytes to skip (raw files only)", min_value=0, value=0, step=1, key="tensor_offset")
+		workers = st.number_input("Worker processes", min_value=1, max_value=os.cpu_count() or 1, value=1, step=1, key="tensor_workers")
+		if st.button("Analyze", key="tensor_analyze") and tensor_path:
+			try:
+				stats = parallel_analyze(resolve_data_path(tensor_path), int(workers), dtype=raw_dtype, offset=int(raw_offset),
+				                         mp_context=multiprocessing.get_context("spawn"))
+			except (OSError, ValueError) as exc:
+				st.error(f"Could not analyze `{tensor_path}`: {exc}")
+			else:
+				st.write(f"**{stats.count:,}** values scanned, **{stats.nan:,}** NaN.")
+				st.table(stats.summary())
+				for dtype, fmt_stats in stats.formats.items():
+					used = np.flatnonzero(fmt_stats.exponent_hist)
+					if used.size == 0:
+						continue
+					bias = (1 << (LAYOUTS[dtype][1] - 1)) - 1
+					span = np.arange(used[0], used[-1] + 1)
+					st.markdown(f"Exponent histogram after casting to **{dtype}** (stored exponent minus bias {bias})")
+					st.bar_chart({"exponent": span - bias, "count": fmt_stats.exponent_hist[span]}, x="exponent", y="count")
 st.markdown("---")
 
 
@@ -183,15 +138,19 @@ st.latex(r"""
 \text{Value} = (-1)^{\text{sign}} \times 2^{(\text{exponent} - \text{bias})} \times (1 + \text{mantissa})
 """)
 
-st.markdown("""
+# Bias of every registered format, e.g. "float16: 15 (2^(5-1) - 1)"
+bias_lines = "\n".join(
+	f"  - {fmt.name}: {fmt.bias} (2^({fmt.exp_bits}-1) - 1)" if fmt.bias == (1 << (fmt.exp_bits - 1)) - 1
+	else f"  - {fmt.name}: {fmt.bias}"
+	for fmt in map(get_format, types)
+)
+st.markdown(f"""
 Where:
 - **Sign bit**: 0 = positive, 1 = negative
 - **Exponent**: Binary representation, biased by a constant
 - **Mantissa** (Significand): Fractional part, with implicit leading 1
 - **Bias values**: 
-  - float16: 15 (2^(5-1) - 1)
-  - bfloat16: 127 (2^(8-1) - 1)  
-  - float32: 127 (2^(8-1) - 1)
+{bias_lines}
 
 **Example**: For a positive number with exponent bits `10000010` and mantissa `01000000000000000000000` in float32:
 - Sign = 0 (positive)
@@ -286,65 +245,12 @@ IEEE 754 defines special bit patterns for representing infinity, NaN (Not a Numb
 These special cases are determined by the exponent and mantissa bit patterns:
 """)
 
-import math
-
-# Define special values for each type
-special_cases = {
-    "Positive Zero": (0.0, "All exponent bits = 0, all mantissa bits = 0"),
-    "Negative Zero": (-0.0, "Sign = 1, all exponent bits = 0, all mantissa bits = 0"),
-    "Positive Infinity": (float('inf'), "All exponent bits = 1, all mantissa bits = 0"),
-    "Negative Infinity": (float('-inf'), "Sign = 1, all exponent bits = 1, all mantissa bits = 0"),
-    "NaN (Not a Number)": (float('nan'), "All exponent bits = 1, any mantissa bits ≠ 0")
-}
-
-special_rows = []
-for case_name, (value, description) in special_cases.items():
-    for dtype in ["float32"]:
-        try:
-            bits, sign_len, exp_len, mant_len, dec_value = float_to_bin_and_decimal(value, dtype)
-            if bits:
-                sign = bits[:sign_len]
-                exponent = bits[sign_len:sign_len+exp_len]
-                mantissa = bits[sign_len+exp_len:]
-                
-                # Special formatting for special values
-                if math.isnan(dec_value):
-                    decimal_str = "NaN"
-                elif math.isinf(dec_value):
-                    decimal_str = "+∞" if dec_value > 0 else "-∞"
-                elif dec_value == 0.0:
-                    # Distinguish positive and negative zero
-                    if math.copysign(1.0, dec_value) == 1.0:
-                        decimal_str = "+0.0"
-                    else:
-                        decimal_str = "-0.0"
-                else:
-                    decimal_str = f"{dec_value:.17g}"
-                
-                special_rows.append({
-                    "Case": case_name,
-                    "Type": dtype,
-                    "Decimal": decimal_str,
-                    "Sign": sign,
-                    "Exponent": format_bits(exponent),
-                    "Mantissa": format_bits(mantissa),
-                    "Raw bits": format_bits(bits, 4)
-                })
-        except:
-            # Some special values might not be supported in all formats
-            special_rows.append({
-                "Case": case_name,
-                "Type": dtype,
-                "Decimal": "Unsupported",
-                "Sign": "-",
-                "Exponent": "-", 
-                "Mantissa": "-",
-                "Raw bits": "-"
-            })
+special_rows = special_value_rows()
 
 if special_rows:
     st.subheader("Special Values Representation")
-    st.table(special_rows)
+    with timing.stage("table"):
+        st.table(special_rows)
 
 st.markdown("""
 **Key Observations:**
@@ -367,4 +273,10 @@ st.markdown("""
 - [Floating-Point Arithmetic: Issues and Limitations (Python Docs)](https://docs.python.org/3/tutorial/floatingpoint.html)
 - [IEEE754 Tutorial: Creating the Bitstring for a Floating-Point Number](https://class.ece.iastate.edu/arun/Cpre305/ieee754/ie3.html#:~:text=For%20single%2Dprecision%20floating%2Dpoint,into%20the%20IEEE%20754%20string.)
 - [IEEE 754 (Wikipedia)](https://en.wikipedia.org/wiki/IEEE_754#:~:text=%22Round%20to%20nearest%2C%20ties%20to,only%20required%20for%20decimal%20implementations.)
-""")
\ No newline at end of file
+""")
+
+run = timing.end_run()
+if run is not None:
+	with st.expander("⏱️ Stage timings (debug)"):
+		st.caption("Time spent in each instrumented stage during this rerun. Cached conversions do not appear.")
+		st.table(timing.run_rows(run))
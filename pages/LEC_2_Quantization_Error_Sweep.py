@@ -0,0 +1,74 @@
+import streamlit as st
+
+import numpy as np
+
+from cs336_helper.floating_point.formats import available_formats
+from cs336_helper.floating_point.sweep import error_sweep
+
+# Points per format sent to the browser; sweeps are thinned to this before charting.
+CHART_POINTS = 2000
+
+st.title("📉 Quantization Error Sweep")
+st.write("How large is the rounding error of each format across its whole dynamic range?")
+st.markdown("""
+Every number stored in a floating-point format is rounded to the nearest representable value.
+The sweep below measures that rounding error from the smallest subnormal up to the overflow threshold,
+together with the ULP (unit in the last place: the gap between neighbouring representable values).
+""")
+st.markdown("---")
+
+selected_types = st.multiselect("Select float types to sweep", available_formats(), default=["float16", "bfloat16", "float32"])
+mode = st.radio(
+	"Sample points",
+	["Every representable value (formats up to 16 bits)", "Log-spaced samples"],
+	help="The exhaustive sweep evaluates the midpoint between every pair of neighbouring values, where the rounding error peaks.",
+)
+samples = None
+if mode == "Log-spaced samples":
+	samples = st.select_slider("Number of samples", options=[1_000, 10_000, 100_000, 1_000_000], value=100_000)
+
+sweeps = [error_sweep(dtype, samples) for dtype in selected_types]
+
+if sweeps:
+	error_chart = {"log10 |x|": [], "log10 relative error": [], "Type": []}
+	ulp_chart = {"log10 |x|": [], "log10 ULP": [], "Type": []}
+	for sweep in sweeps:
+		keep = np.unique(np.linspace(0, len(sweep.x) - 1, CHART_POINTS).astype(int))
+		finite = np.isfinite(sweep.rel_error[keep]) & (sweep.rel_error[keep] > 0)
+		shown = keep[finite]
+		error_chart["log10 |x|"].extend(np.log10(sweep.x[shown]).tolist())
+		error_chart["log10 relative error"].extend(np.log10(sweep.rel_error[shown]).tolist())
+		error_chart["Type"].extend([sweep.dtype] * len(shown))
+		ulp_chart["log10 |x|"].extend(np.log10(sweep.x[keep]).tolist())
+		ulp_chart["log10 ULP"].extend(np.log10(sweep.ulp[keep]).tolist())
+		ulp_chart["Type"].extend([sweep.dtype] * len(keep))
+
+	st.subheader("Relative Rounding Error vs Magnitude")
+	st.line_chart(error_chart, x="log10 |x|", y="log10 relative error", color="Type")
+	st.markdown("""
+In the normal range the relative error stays below half an ULP relative to the value, i.e. $2^{-(\\text{mantissa bits} + 1)}$,
+so each format shows a flat saw-tooth band. Below the smallest normal number the ULP stops shrinking,
+and the relative error grows until values flush to zero.
+""")
+
+	st.subheader("ULP Size vs Magnitude")
+	st.line_chart(ulp_chart, x="log10 |x|", y="log10 ULP", color="Type")
+
+	st.subheader("Range Boundaries")
+	rows = []
+	for sweep in sweeps:
+		normal = (sweep.x >= sweep.min_normal) & (sweep.x <= sweep.max_finite)
+		rows.append({
+			"Type": sweep.dtype,
+			"Smallest subnormal": f"{sweep.min_subnormal:.6g}",
+			"Smallest normal": f"{sweep.min_normal:.6g}",
+			"Largest finite": f"{sweep.max_finite:.6g}",
+			"Overflow threshold": f"{sweep.overflow_threshold:.6g}",
+			"Max rel. error (normal range)": f"{sweep.rel_error[normal].max():.3g}" if normal.any() else "-",
+			"Samples": f"{len(sweep.x):,}",
+		})
+	st.table(rows)
+	st.markdown("""
+- **Smallest subnormal / normal**: below the smallest normal number precision degrades gradually; below half the smallest subnormal everything rounds to zero.
+- **Overflow threshold**: inputs from half an ULP past the largest finite value round to infinity (or NaN / saturate, depending on the format).
+""")
@@ -0,0 +1,38 @@
+"""Start the Streamlit app in a warmed-up process.
+
+``streamlit run app.py`` starts a fresh interpreter, so the first session
+after a restart pays for every import and table build. This script first
+runs :func:`cs336_helper.floating_point.warmup.warm_up` and then starts the
+same Streamlit server in this process, so the caches are ready when the
+first user connects. When ``CS336_METRICS_PORT`` is set, it also starts the
+stage-timing endpoint here, once. Arguments are passed on to
+``streamlit run``::
+
+    python serve.py --server.port=7860 --server.address=0.0.0.0
+"""
+
+import os
+import sys
+
+from cs336_helper.floating_point.timing import start_metrics_server
+from cs336_helper.floating_point.warmup import warm_up
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+
+def main(argv=None):
+    from streamlit.web import cli
+
+    warm_up()
+    port = os.environ.get("CS336_METRICS_PORT")
+    if port:
+        try:
+            start_metrics_server(int(port))
+        except OSError as exc:
+            print(f"Not exporting stage timings on port {port}: {exc}", file=sys.stderr)
+    argv = sys.argv[1:] if argv is None else list(argv)
+    return cli.main(["run", APP] + argv, prog_name="streamlit")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point.analyzer import PrecisionStats, analyze_array, analyze_file
+from cs336_helper.floating_point.bfloat16 import float32_to_bfloat16
+
+
+def _weights():
+    rng = np.random.default_rng(0)
+    values = (rng.standard_normal(10_000) * 10.0 ** rng.uniform(-9, 6, 10_000)).astype(np.float32)
+    values[:4] = [0.0, np.inf, np.nan, 1e5]  # zero, infinity, NaN and a float16 overflow
+    return values
+
+
+def test_counts_match_direct_computation():
+    values = _weights()
+    stats = analyze_array(values, chunk_size=999)
+    source = values.astype(np.float64)
+    finite_nonzero = np.isfinite(source) & (source != 0)
+    with np.errstate(over="ignore"):
+        half = values.astype(np.float16)
+    half_bits = half.view(np.uint16)
+
+    f16 = stats.formats["float16"]
+    assert stats.count == values.size
+    assert stats.nan == 1
+    assert f16.overflow == np.count_nonzero(finite_nonzero & np.isinf(half))
+    assert f16.underflow == np.count_nonzero(finite_nonzero & (half == 0))
+    assert f16.subnormal == np.count_nonzero(((half_bits & 0x7C00) == 0) & ((half_bits & 0x03FF) != 0))
+    assert f16.exponent_hist.sum() == values.size
+    assert np.array_equal(f16.exponent_hist, np.bincount((half_bits >> 10) & 0x1F, minlength=32))
+
+    measured = finite_nonzero & ~np.isinf(half)
+    rel = np.abs(source[measured] - half[measured]) / np.abs(source[measured])
+    assert f16.max_rel_error == rel.max()
+    assert f16.inexact == np.count_nonzero(rel)
+    assert np.isclose(f16.mean_rel_error, rel.mean(), rtol=1e-12)
+    assert stats.formats["float32"].max_rel_error == 0.0
+
+
+def test_merge_is_exact_and_order_independent():
+    values = _weights()
+    chunks = np.array_split(values, 7)
+    forward = PrecisionStats()
+    for chunk in chunks:
+        forward.merge(PrecisionStats().update(chunk))
+    backward = PrecisionStats()
+    for chunk in reversed(chunks):
+        backward.merge(PrecisionStats().update(chunk))
+    for dtype in forward.formats:
+        a, b = forward.formats[dtype], backward.formats[dtype]
+        assert np.array_equal(a.exponent_hist, b.exponent_hist)
+        assert (a.subnormal, a.overflow, a.underflow) == (b.subnormal, b.overflow, b.underflow)
+        assert a.max_rel_error == b.max_rel_error
+        assert a.mean_rel_error == b.mean_rel_error
+
+
+@pytest.mark.parametrize("raw_dtype", ["float32", "float64", "float16"])
+def test_raw_and_npy_files(tmp_path, raw_dtype):
+    with np.errstate(over="ignore"):
+        values = _weights().astype(raw_dtype)
+    expected = analyze_array(values, chunk_size=4096)
+
+    npy = tmp_path / "weights.npy"
+    np.save(npy, values.reshape(100, 100))
+    raw = tmp_path / "weights.bin"
+    with open(raw, "wb") as f:
+        f.write(b"HDR!")
+        f.write(values.tobytes())
+
+    for stats in (analyze_file(npy, chunk_size=1234), analyze_file(raw, raw_dtype, offset=4, chunk_size=1234)):
+        assert stats.count == expected.count
+        for dtype, fmt in stats.formats.items():
+            assert np.array_equal(fmt.exponent_hist, expected.formats[dtype].exponent_hist)
+            assert fmt.max_rel_error == expected.formats[dtype].max_rel_error
+
+
+def test_bfloat16_raw_file(tmp_path):
+    values = _weights()
+    path = tmp_path / "weights.bf16"
+    float32_to_bfloat16(values).tofile(path)
+    stats = analyze_file(path, "bfloat16")
+    assert stats.count == values.size
+    # bfloat16 data is already representable in bfloat16 (and float32).
+    assert stats.formats["bfloat16"].max_rel_error == 0.0
+    assert stats.formats["float32"].max_rel_error == 0.0
+
+
+def test_unknown_raw_dtype(tmp_path):
+    path = tmp_path / "weights.bin"
+    path.write_bytes(b"\0" * 8)
+    with pytest.raises(ValueError):
+        analyze_file(path, "int8")
@@ -0,0 +1,124 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point.arith import (
+    REDUCTIONS,
+    round_to,
+    simulate_dot,
+    simulate_matmul,
+    simulate_sum,
+)
+from cs336_helper.floating_point.convert import float_to_bin_and_decimal
+from cs336_helper.floating_point.formats import decode, encode
+
+
+def _values(n, seed=0):
+    return np.random.default_rng(seed).standard_normal(n)
+
+
+def _scalar_round(value, dtype):
+    return float_to_bin_and_decimal(value, dtype)[4]
+
+
+@pytest.mark.parametrize("dtype", ["float16", "bfloat16"])
+def test_round_to_matches_scalar_converter(dtype):
+    values = _values(1000) * 100
+    assert round_to(values, dtype).tolist() == [_scalar_round(v, dtype) for v in values]
+
+
+def _single_rounding(values, dtype):
+    # The registry codec rounds float64 straight to the target format.
+    return decode(encode(values, dtype), dtype)
+
+
+def test_bfloat16_rounds_float64_once():
+    rng = np.random.default_rng(3)
+    values = rng.standard_normal(200_000) * 10.0 ** rng.uniform(-45, 39, 200_000)
+    values = np.concatenate([values, [1 + 2**-8 + 2**-30, 3.4e38, -1e-46, 0.0, -0.0, np.inf]])
+    rounded = round_to(values, "bfloat16").astype(np.float64)
+    expected = _single_rounding(values, "bfloat16")
+    assert np.array_equal(rounded, expected)
+    assert np.array_equal(np.signbit(rounded), np.signbit(expected))
+    assert simulate_sum([[1 + 2**-8 + 2**-30]], "bfloat16", "float64").result[0] == 1.0078125
+
+
+def test_float32_products_round_once_to_bfloat16():
+    rng = np.random.default_rng(4)
+    x = rng.standard_normal(200_000).astype(np.float32)
+    y = rng.standard_normal(200_000).astype(np.float32)
+    result = simulate_dot(x[:, None], y[:, None], "float32", "bfloat16").result
+    assert np.array_equal(result, _single_rounding(x.astype(np.float64) * y, "bfloat16"))
+    assert simulate_dot([1.48432565], [1.36320317], "float32", "bfloat16").result == 2.015625
+
+
+@pytest.mark.parametrize("accumulator", ["float16", "bfloat16"])
+def test_sequential_sum_rounds_every_addition(accumulator):
+    values = _values(300)
+    total = None
+    for v in values:
+        v = _scalar_round(_scalar_round(v, "bfloat16"), accumulator)
+        total = v if total is None else _scalar_round(total + v, accumulator)
+    sim = simulate_sum(values, input_dtype="bfloat16", accumulator=accumulator)
+    assert float(sim.result) == total
+
+
+def test_kahan_and_pairwise_beat_sequential_in_low_precision():
+    values = np.abs(_values(4096)) + 1.0
+    errors = {order: simulate_sum(values, "float32", "float16", order).rel_error for order in REDUCTIONS}
+    assert errors["kahan"] < errors["sequential"] / 10
+    assert errors["pairwise"] < errors["sequential"]
+    assert errors["blocked"] < errors["sequential"]
+
+
+def test_float64_accumulator_isolates_input_error():
+    x, y = _values(1000, 1), _values(1000, 2)
+    sim = simulate_dot(x, y, input_dtype="float64", accumulator="float64", order="pairwise")
+    assert np.isclose(sim.result, sim.reference, rtol=1e-13)
+    sim = simulate_dot(x, y, input_dtype="bfloat16", accumulator="float64")
+    assert np.isclose(sim.result, sim.input_reference, rtol=1e-13)
+    assert sim.abs_error > 0
+
+
+@pytest.mark.parametrize("order", REDUCTIONS)
+def test_matmul_matches_dot_per_element(order, monkeypatch):
+    from cs336_helper.floating_point import arith
+
+    monkeypatch.setattr(arith, "MATMUL_TILE_ELEMENTS", 200)  # force several row tiles
+    rng = np.random.default_rng(3)
+    a, b = rng.standard_normal((7, 37)), rng.standard_normal((37, 5))
+    sim = simulate_matmul(a, b, "bfloat16", "bfloat16", order, block_size=8)
+    dots = simulate_dot(a[:, None, :], b.T[None, :, :], "bfloat16", "bfloat16", order, block_size=8)
+    assert np.array_equal(sim.result, dots.result)
+    assert np.allclose(sim.reference, a @ b)
+    assert sim.result.shape == (7, 5)
+
+
+def test_blocked_with_one_block_is_sequential():
+    values = _values(100)
+    blocked = simulate_sum(values, "bfloat16", "bfloat16", "blocked", block_size=100)
+    sequential = simulate_sum(values, "bfloat16", "bfloat16", "sequential")
+    assert blocked.result == sequential.result
+
+
+def test_sum_over_axis_and_overflow():
+    values = np.full((3, 10), 10000.0)
+    sim = simulate_sum(values, "float16", "float16", axis=1)
+    assert sim.result.shape == (3,)
+    assert np.all(np.isinf(sim.result))
+    assert simulate_sum(values, "float16", "float32", axis=0).result.tolist() == [30000.0] * 10
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        simulate_sum([1.0], accumulator="float8")
+    with pytest.raises(ValueError):
+        simulate_sum([1.0], order="random")
+    with pytest.raises(ValueError):
+        simulate_sum([1.0], order="blocked", block_size=0)
+    with pytest.raises(ValueError):
+        simulate_matmul(np.ones((2, 3)), np.ones((2, 3)))
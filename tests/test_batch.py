@@ -0,0 +1,64 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point.convert import float_to_bin_and_decimal
+from cs336_helper.floating_point import float_to_bin_and_decimal_batch
+
+DTYPES = ["float16", "bfloat16", "float32"]
+
+
+def _sample_values():
+    rng = np.random.default_rng(0)
+    # Random float32 bit patterns cover normals, subnormals, infinities and NaNs.
+    patterns = rng.integers(0, 2**32, size=2000, dtype=np.uint64).astype(np.uint32)
+    specials = np.array([0.0, -0.0, 1.0, -2.5, 0.1, 65504, 65520, 1e-8, 3.4e38,
+                         float('inf'), float('-inf'), float('nan')])
+    with np.errstate(invalid='ignore'):
+        return np.concatenate([patterns.view(np.float32).astype(np.float64), specials])
+
+
+@pytest.mark.parametrize("dtype", DTYPES)
+def test_batch_matches_scalar(dtype):
+    values = _sample_values()
+    fields = float_to_bin_and_decimal_batch(values, dtype)
+    for i, value in enumerate(values.tolist()):
+        b, s, e, m, dec = float_to_bin_and_decimal(value, dtype)
+        assert int(fields.bits[i]) == int(b, 2)
+        assert int(fields.sign[i]) == int(b[:s], 2)
+        assert int(fields.exponent[i]) == int(b[s:s + e], 2)
+        assert int(fields.mantissa[i]) == int(b[s + e:], 2)
+        assert (fields.sign_len, fields.exp_len, fields.mant_len) == (s, e, m)
+        got = float(fields.decimal[i])
+        assert got == dec or (np.isnan(got) and np.isnan(dec))
+
+
+@pytest.mark.parametrize("dtype, bits_dtype", [
+    ("float16", np.uint16),
+    ("bfloat16", np.uint16),
+    ("float32", np.uint32),
+])
+def test_batch_preserves_shape(dtype, bits_dtype):
+    values = np.linspace(-4, 4, 24, dtype=np.float32).reshape(2, 3, 4)
+    fields = float_to_bin_and_decimal_batch(values, dtype)
+    assert fields.bits.dtype == bits_dtype
+    for array in (fields.bits, fields.sign, fields.exponent, fields.mantissa, fields.decimal):
+        assert array.shape == (2, 3, 4)
+
+
+def test_batch_unknown_dtype():
+    with pytest.raises(ValueError):
+        float_to_bin_and_decimal_batch([1.0], "float8")
+
+
+def test_batch_falls_back_to_format_registry():
+    fields = float_to_bin_and_decimal_batch([1.0, -0.1015625, 500.0], "float8_e4m3fn")
+    assert fields.bits.tolist() == [0x38, 0x9D, 0x7F]
+    assert fields.exponent.tolist() == [7, 3, 15]
+    assert fields.mantissa.tolist() == [0, 5, 7]
+    assert fields.decimal[:2].tolist() == [1.0, -0.1015625] and np.isnan(fields.decimal[2])
+    assert (fields.sign_len, fields.exp_len, fields.mant_len) == (1, 4, 3)
@@ -0,0 +1,40 @@
+import sys
+import os
+import json
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.conversions import append_history, compare_runs, load_history, main, run_benchmarks
+
+
+def _entry(**results):
+    return {"timestamp": "2026-01-01T00:00:00+00:00", "commit": "abc1234", "results": results}
+
+
+def test_compare_flags_regressions_past_threshold():
+    baseline = _entry(fast=1.0, same=1.0, slow=1.0, gone=1.0)
+    candidate = _entry(fast=0.5, same=1.05, slow=1.2, new=1.0)
+    rows = compare_runs(baseline, candidate, threshold=0.10)
+    assert [(name, status) for name, *_, status in rows] == [
+        ("fast", "improvement"), ("same", "ok"), ("slow", "regression"),
+    ]
+    assert rows[2][3] == 1.2
+
+
+def test_compare_command_exit_status(tmp_path):
+    history = str(tmp_path / "history.json")
+    append_history(history, _entry(bench=1.0))
+    append_history(history, _entry(bench=1.5))
+    assert main(["--history", history, "compare"]) == 1
+    assert main(["--history", history, "compare", "--threshold", "0.6"]) == 0
+    assert len(load_history(history)) == 2
+
+
+def test_run_records_every_benchmark(tmp_path):
+    entry = run_benchmarks(sizes=[100], dtypes=["float16", "bfloat16"], repeat=1, page=False, imports=False)
+    json.dumps(entry)
+    assert entry["results"]["scalar/float_to_bin/float16"] > 0
+    assert "scalar/format_bits/bfloat16" in entry["results"]
+    assert "batch/float_to_bin_and_decimal/bfloat16/100" in entry["results"]
+    assert "batch/bit_strings/float16/100" in entry["results"]
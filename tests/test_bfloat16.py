@@ -0,0 +1,96 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point import bfloat16
+from cs336_helper.floating_point.bfloat16 import bfloat16_to_float32, float32_to_bfloat16
+
+
+def _random_float32(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 2**32, size=n, dtype=np.uint64).astype(np.uint32).view(np.float32)
+
+
+def _is_nan_bits(bits):
+    return ((bits & 0x7F80) == 0x7F80) & ((bits & 0x007F) != 0)
+
+
+@pytest.mark.parametrize("value, expected", [
+    (1.0, 0x3F80),
+    (0.1, 0x3DCD),
+    (-2.5, 0xC020),
+    (float('inf'), 0x7F80),
+    (float('-inf'), 0xFF80),
+    (0.0, 0x0000),
+    (-0.0, 0x8000),
+])
+def test_nearest_known_values(value, expected):
+    assert int(float32_to_bfloat16(np.float32(value))) == expected
+
+
+@pytest.mark.parametrize("as_int, expected", [
+    (0x3F808000, 0x3F80),  # tie, kept part even -> stays
+    (0x3F818000, 0x3F82),  # tie, kept part odd -> rounds up to even
+    (0x3F808001, 0x3F81),  # just above the tie -> rounds up
+    (0x3F807FFF, 0x3F80),  # just below the tie -> rounds down
+    (0x7F7FFFFF, 0x7F80),  # largest float32 rounds up to infinity
+])
+def test_nearest_ties_to_even(as_int, expected):
+    f = np.array([as_int], dtype=np.uint32).view(np.float32)
+    assert int(float32_to_bfloat16(f)[0]) == expected
+
+
+def test_truncate_drops_lower_bits():
+    values = _random_float32(10_000)
+    bits = values.view(np.uint32)
+    finite = (bits & 0x7FFFFFFF) <= 0x7F800000
+    got = float32_to_bfloat16(values, rounding="truncate")
+    assert np.array_equal(got[finite], (bits[finite] >> 16).astype(np.uint16))
+
+
+@pytest.mark.parametrize("rounding", bfloat16.ROUNDING_MODES)
+@pytest.mark.parametrize("as_int", [0x7F800001, 0x7FFFFFFF, 0xFFFFFFFF, 0xFF80FFFF, 0x7FC00000])
+def test_nan_stays_nan(rounding, as_int):
+    f = np.array([as_int], dtype=np.uint32).view(np.float32)
+    got = float32_to_bfloat16(f, rounding=rounding, rng=0)
+    assert _is_nan_bits(int(got[0]))
+    assert int(got[0]) >> 15 == as_int >> 31
+    assert np.isnan(bfloat16_to_float32(got)[0])
+
+
+def test_stochastic_is_seeded_and_unbiased():
+    values = np.full(200_000, 1.0 + 2.0**-9, dtype=np.float32)  # 1/4 of a bf16 ULP above 1
+    first = float32_to_bfloat16(values, rounding="stochastic", rng=123)
+    second = float32_to_bfloat16(values, rounding="stochastic", rng=123)
+    assert np.array_equal(first, second)
+    assert set(np.unique(first).tolist()) == {0x3F80, 0x3F81}
+    mean = bfloat16_to_float32(first).astype(np.float64).mean()
+    assert abs(mean - (1.0 + 2.0**-9)) < 2.0**-13
+
+
+def test_out_buffer_and_chunking(monkeypatch):
+    monkeypatch.setattr(bfloat16, "CHUNK_SIZE", 1000)
+    values = _random_float32(12_345).reshape(5, 2469)
+    out = np.empty(values.shape, dtype=np.uint16)
+    result = float32_to_bfloat16(values, out=out)
+    assert result is out
+    monkeypatch.setattr(bfloat16, "CHUNK_SIZE", 1 << 20)
+    assert np.array_equal(out, float32_to_bfloat16(values))
+
+    decoded = np.empty(values.shape, dtype=np.float32)
+    assert bfloat16_to_float32(out, out=decoded) is decoded
+    assert np.array_equal(decoded.view(np.uint32), out.astype(np.uint32) << 16)
+
+
+def test_rejects_bad_arguments():
+    values = np.ones(4, dtype=np.float32)
+    with pytest.raises(ValueError):
+        float32_to_bfloat16(values, rounding="up")
+    with pytest.raises(ValueError):
+        float32_to_bfloat16(values, out=np.empty(3, dtype=np.uint16))
+    with pytest.raises(ValueError):
+        float32_to_bfloat16(values, out=np.empty(4, dtype=np.int32))
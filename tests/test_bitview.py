@@ -0,0 +1,58 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point.bitview import BitFieldView, group_bit_strings
+from cs336_helper.floating_point.convert import float_to_bin_and_decimal, format_bits
+
+
+def _values():
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal(500) * 10.0 ** rng.uniform(-10, 10, 500)
+    return np.concatenate([values, [0.0, -0.0, np.inf, -np.inf, np.nan, 65504.0, 1e-40]])
+
+
+@pytest.mark.parametrize("dtype", ["float16", "bfloat16", "float32", "float8_e4m3fn"])
+def test_rows_match_scalar_formatting(dtype):
+    values = _values()
+    view = BitFieldView.from_values(values, dtype)
+    for value, row in zip(values.tolist(), view.rows()):
+        with np.errstate(over="ignore"):
+            bits, sign_len, exp_len, _, _ = float_to_bin_and_decimal(value, dtype)
+        assert row == (
+            format_bits(bits[:sign_len]),
+            format_bits(bits[sign_len:sign_len + exp_len]),
+            format_bits(bits[sign_len + exp_len:]),
+            format_bits(bits),
+        )
+
+
+def test_view_shares_the_input_buffer():
+    values = np.array([1.0, -2.0, 0.5], dtype=np.float32)
+    view = BitFieldView.from_values(values, "float32")
+    assert np.shares_memory(view.bits, values)
+    assert np.shares_memory(view[1:].bits, values)
+    assert view.sign.tolist() == [0, 1, 0]
+    assert view.exponent.tolist() == [127, 128, 126]
+    assert view.mantissa.tolist() == [0, 0, 0]
+    values[0] = 3.0
+    assert view.exponent[0] == 128
+
+
+def test_rows_render_only_the_requested_slice():
+    view = BitFieldView.from_values(np.arange(1_000_000, dtype=np.float32), "float32")
+    rows = view.rows(10, 13)
+    assert len(rows) == 3
+    assert rows[0][3] == format_bits(float_to_bin_and_decimal(10.0, "float32")[0])
+    assert view[2:4].decimal.tolist() == [2.0, 3.0]
+
+
+def test_group_bit_strings():
+    assert group_bit_strings(np.array([0b1011001]), 7).tolist() == ["1011 001"]
+    assert group_bit_strings(np.array([[5, 6]]), 3, group=None).tolist() == [["101", "110"]]
+    with pytest.raises(ValueError):
+        BitFieldView.from_values([1.0], "float16").render("payload")
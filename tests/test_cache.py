@@ -0,0 +1,76 @@
+import sys
+import os
+import pytest
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point import cache
+from cs336_helper.floating_point.cache import (
+    cache_info,
+    comparison_row,
+    configure_cache,
+    special_value_rows,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    configure_cache(cache.DEFAULT_CACHE_SIZE)
+    yield
+    configure_cache(cache.DEFAULT_CACHE_SIZE)
+
+
+def test_comparison_row_contents():
+    assert comparison_row(0.1, "bfloat16") == {
+        "Type": "bfloat16",
+        "Decimal": "0.10009765625",
+        "Sign": "0",
+        "Exponent": "0111 1011",
+        "Mantissa": "1001 101",
+        "Raw bits": "0011 1101 1100 1101",
+    }
+    assert comparison_row(0.1, "float32")["Decimal"] == "0.100000001490116119384765625"
+    assert comparison_row(0.1, "float8")["Decimal"] == "Error"
+
+
+def test_repeated_rows_hit_the_cache():
+    comparison_row(1.5, "float16")
+    comparison_row(1.5, "float16")
+    comparison_row(1.5, "float32")
+    info = cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_signed_zero_and_nan_are_distinct_keys():
+    assert comparison_row(-0.0, "float16")["Sign"] == "1"
+    assert comparison_row(0.0, "float16")["Sign"] == "0"
+    assert comparison_row(float("nan"), "float32")["Exponent"] == "1111 1111"
+    assert comparison_row(float("nan"), "float32")["Exponent"] == "1111 1111"
+    assert cache_info().misses == 3
+
+
+def test_lru_eviction():
+    configure_cache(2)
+    comparison_row(1.0, "float16")
+    comparison_row(2.0, "float16")
+    comparison_row(1.0, "float16")  # 1.0 is now the most recently used
+    comparison_row(3.0, "float16")  # evicts 2.0
+    comparison_row(1.0, "float16")
+    assert cache_info().hits == 2
+    comparison_row(2.0, "float16")
+    info = cache_info()
+    assert (info.hits, info.misses, info.currsize, info.maxsize) == (2, 4, 2, 2)
+
+
+def test_special_rows_are_built_once(monkeypatch):
+    calls = []
+    original = cache.BitFieldView.from_values
+    monkeypatch.setattr(cache.BitFieldView, "from_values", lambda v, d: calls.append(d) or original(v, d))
+    cache._special_rows.cache_clear()
+    first = special_value_rows()
+    second = special_value_rows()
+    assert first == second and first is not second
+    assert calls == ["float32"]  # one batch conversion per dtype
+    assert [row["Decimal"] for row in first] == ["+0.0", "-0.0", "+∞", "-∞", "NaN"]
+    assert first[3]["Raw bits"] == "1111 1111 1000 0000 0000 0000 0000 0000"
@@ -0,0 +1,90 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point.cache import comparison_row
+from cs336_helper.floating_point.comparison import (
+    CATEGORIES,
+    ComparisonTable,
+    comparison_table,
+    parse_values,
+)
+
+VALUES = [0.1, 1e-6, 70000.0, 1e-9, float("nan"), -2.5, 0.0, 3e38]
+DTYPES = ("float16", "bfloat16", "float32")
+
+
+def test_parse_values():
+    assert parse_values("0.1, 2\n-3;nan  inf").tolist()[:3] == [0.1, 2.0, -3.0]
+    assert np.isnan(parse_values(b"nan")[0])
+    with pytest.raises(ValueError, match="abc"):
+        parse_values("1 abc 2")
+
+
+def test_parse_npy_upload(tmp_path):
+    path = tmp_path / "values.npy"
+    np.save(path, np.array([[1.5, 2.5]], dtype=np.float32))
+    assert parse_values(path.read_bytes()).tolist() == [1.5, 2.5]
+    np.save(path, np.arange(3, dtype=np.uint8))
+    assert parse_values(path.read_bytes()).tolist() == [0.0, 1.0, 2.0]
+    for array in (np.zeros(2, dtype=[("x", "f4"), ("y", "i4")]), np.array([1 + 2j]), np.array(["1.5"])):
+        np.save(path, array)
+        with pytest.raises(ValueError, match="real numbers"):
+            parse_values(path.read_bytes())
+
+
+def test_rows_match_single_value_table():
+    table = ComparisonTable(VALUES, DTYPES)
+    rows, total = table.page(size=100)
+    assert total == len(VALUES) * len(DTYPES)
+    for row in rows:
+        expected = comparison_row(VALUES[row["#"]], row["Type"])
+        assert {k: row[k] for k in expected} == expected
+
+
+def test_categories():
+    table = ComparisonTable(VALUES, DTYPES)
+    counts = table.counts()
+    assert set(counts) == set(CATEGORIES)
+    assert sum(counts[c] for c in CATEGORIES[:5]) == len(table)
+    overflow = [(int(table.index[r]), table.dtypes[table.format_index[r]]) for r in table.select(["overflow"])]
+    assert overflow == [(2, "float16"), (7, "float16")]
+    underflow = {int(table.index[r]) for r in table.select(["underflow"])}
+    assert underflow == {3}
+    subnormal = [(int(table.index[r]), table.dtypes[table.format_index[r]]) for r in table.select(["subnormal"])]
+    assert subnormal == [(1, "float16")]
+    assert len(table.select(["nan", "zero"])) == 2 * len(DTYPES) + 1  # 1e-9 flushes to zero in float16
+    with pytest.raises(ValueError):
+        table.select(["tiny"])
+
+
+def test_sorting_puts_nan_last():
+    table = ComparisonTable(VALUES, DTYPES)
+    order = table.select(sort_by="rel error", descending=True)
+    errors = table.rel_error[order]
+    finite = errors[~np.isnan(errors)]
+    assert np.all(finite[:-1] >= finite[1:])
+    assert np.all(np.isnan(errors[len(finite):]))
+    exponents = table.exponent[table.select(sort_by="exponent")]
+    assert np.all(np.diff(exponents) >= 0)
+    assert table.select(descending=True).tolist() == list(range(len(table)))[::-1]
+
+
+def test_only_the_page_is_formatted(monkeypatch):
+    from cs336_helper.floating_point import comparison
+
+    values = np.random.default_rng(0).standard_normal(20_000)
+    table = comparison_table(values, DTYPES)
+    assert comparison_table(values, DTYPES) is table
+    rendered = []
+    original = comparison.BitFieldView.rows
+    monkeypatch.setattr(comparison.BitFieldView, "rows", lambda self, *a: rendered.append(len(self)) or original(self, *a))
+    rows, total = table.page(number=3, size=25, sort_by="abs error", descending=True)
+    assert total == 60_000 and len(rows) == 25
+    assert sum(rendered) == 25
+    assert [row["Rel. error"] for row in rows] == [f"{table.rel_error[r]:.3g}" for r in table.select(
+        sort_by="abs error", descending=True)[75:100]]
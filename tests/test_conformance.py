@@ -0,0 +1,127 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point.batch import float_to_bin_and_decimal_batch
+from cs336_helper.floating_point.bfloat16 import bfloat16_to_float32, float32_to_bfloat16
+from cs336_helper.floating_point.formats import decode, encode
+from cs336_helper.floating_point.tables import lookup_table
+
+# Bit-exact conformance of the encoders/decoders: every float16 and bfloat16
+# pattern, stratified float32 samples and every rounding tie, checked against
+# NumPy's float16 cast and an independent bfloat16 reference. Everything runs
+# on whole arrays so the suite finishes in seconds.
+ALL_16 = np.arange(1 << 16, dtype=np.uint32).astype(np.uint16)
+
+
+def reference_bfloat16(f32):
+    """Round-to-nearest-even float32 -> bfloat16 payloads, spelled out case by case."""
+    bits = f32.view(np.uint32).astype(np.uint64)
+    upper = bits >> np.uint64(16)
+    lower = bits & np.uint64(0xFFFF)
+    round_up = (lower > 0x8000) | ((lower == 0x8000) & ((upper & np.uint64(1)) == 1))
+    result = upper + round_up.astype(np.uint64)
+    nan = (bits & np.uint64(0x7FFFFFFF)) > 0x7F800000
+    result[nan] = upper[nan] | np.uint64(0x0040)
+    return result.astype(np.uint16)
+
+
+def stratified_float32(per_exponent=4096, seed=0):
+    """Random mantissas and signs for every one of the 256 float32 exponents."""
+    rng = np.random.default_rng(seed)
+    exponent = np.repeat(np.arange(256, dtype=np.uint32), per_exponent)
+    mantissa = rng.integers(0, 1 << 23, size=exponent.size, dtype=np.uint32)
+    sign = rng.integers(0, 2, size=exponent.size, dtype=np.uint32)
+    return ((sign << 31) | (exponent << 23) | mantissa).view(np.float32)
+
+
+def assert_same_values(actual, expected):
+    with np.errstate(invalid="ignore"):  # signalling NaNs are quieted by the cast
+        actual = np.asarray(actual, dtype=np.float64)
+        expected = np.asarray(expected, dtype=np.float64)
+    nan = np.isnan(expected)
+    assert np.array_equal(np.isnan(actual), nan)
+    assert np.array_equal(actual[~nan], expected[~nan])
+    assert np.array_equal(np.signbit(actual[~nan]), np.signbit(expected[~nan]))
+
+
+# --- Every 16-bit pattern ---
+
+def test_float16_decoders_on_every_pattern():
+    expected = ALL_16.view(np.float16)
+    assert_same_values(lookup_table("float16").value, expected)
+    assert_same_values(decode(ALL_16, "float16"), expected)
+
+
+def test_bfloat16_decoders_on_every_pattern():
+    expected = (ALL_16.astype(np.uint32) << 16).view(np.float32)
+    assert_same_values(lookup_table("bfloat16").value, expected)
+    assert_same_values(decode(ALL_16, "bfloat16"), expected)
+    assert np.array_equal(bfloat16_to_float32(ALL_16).view(np.uint32), expected.view(np.uint32))
+
+
+@pytest.mark.parametrize("dtype", ["float16", "bfloat16"])
+def test_every_pattern_re_encodes_to_itself(dtype):
+    values = lookup_table(dtype).value
+    nan = np.isnan(values.astype(np.float32))
+    batch = float_to_bin_and_decimal_batch(values, dtype)
+    generic = encode(values, dtype)
+    assert np.array_equal(batch.bits[~nan], ALL_16[~nan])
+    assert np.array_equal(generic[~nan], ALL_16[~nan])
+    # NaNs stay NaN with their sign, though the payload may be canonicalised.
+    for bits in (batch.bits[nan], generic[nan]):
+        assert np.all((bits & 0x7FFF) > (0x7C00 if dtype == "float16" else 0x7F80))
+        assert np.array_equal(bits >> 15, ALL_16[nan] >> 15)
+
+
+# --- float32 inputs ---
+
+def test_bfloat16_kernel_on_stratified_float32():
+    values = stratified_float32()
+    expected = reference_bfloat16(values)
+    assert np.array_equal(float32_to_bfloat16(values), expected)
+    assert np.array_equal(float_to_bin_and_decimal_batch(values, "bfloat16").bits, expected)
+
+
+def test_bfloat16_kernel_on_every_tie():
+    # For every bfloat16 pattern: exactly halfway to the next one, and one ulp either side.
+    upper = ALL_16.astype(np.uint32) << 16
+    inputs = np.concatenate([upper | 0x7FFF, upper | 0x8000, upper | 0x8001]).view(np.float32)
+    expected = reference_bfloat16(inputs)
+    assert np.array_equal(float32_to_bfloat16(inputs), expected)
+    finite = np.isfinite(inputs)
+    assert np.array_equal(encode(inputs[finite], "bfloat16"), expected[finite])
+
+
+def test_bfloat16_nan_payloads_never_become_inf():
+    payloads = np.arange(1, 1 << 23, 997, dtype=np.uint32)
+    inputs = np.concatenate([0x7F800000 | payloads, 0xFF800000 | payloads]).view(np.float32)
+    result = float32_to_bfloat16(inputs)
+    assert np.all((result & 0x7FFF) > 0x7F80)
+
+
+def test_float16_encoders_on_stratified_float32():
+    values = stratified_float32()
+    with np.errstate(over="ignore"):
+        expected = values.astype(np.float16).view(np.uint16)
+    finite = np.isfinite(values)
+    assert np.array_equal(float_to_bin_and_decimal_batch(values, "float16").bits, expected)
+    assert np.array_equal(encode(values[finite], "float16"), expected[finite])
+
+
+def test_float16_encoders_on_every_tie():
+    # Midpoints between consecutive float16 values are exact in float32.
+    values = ALL_16.view(np.float16).astype(np.float32)
+    finite = np.isfinite(values)
+    lo, hi = values[finite][:-1], values[finite][1:]
+    same_sign = np.signbit(lo) == np.signbit(hi)
+    midpoints = ((lo[same_sign].astype(np.float64) + hi[same_sign]) / 2).astype(np.float32)
+    nudged = np.concatenate([midpoints, np.nextafter(midpoints, np.inf), np.nextafter(midpoints, -np.inf)])
+    with np.errstate(over="ignore"):
+        expected = nudged.astype(np.float16).view(np.uint16)
+    assert np.array_equal(encode(nudged, "float16"), expected)
+    assert np.array_equal(float_to_bin_and_decimal_batch(nudged, "float16").bits, expected)
@@ -6,7 +6,7 @@ import numpy as np
 # Add the parent directory to the path so we can import the app
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from pages.LEC_2_Floating_Point_Explorer import float_to_bin_and_decimal, float_to_bin, format_bits
+from cs336_helper.floating_point.convert import float_to_bin_and_decimal, float_to_bin, format_bits
 
 def test_format_bits():
     assert format_bits("1111000011110000", 4) == "1111 0000 1111 0000"
@@ -0,0 +1,138 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point import formats
+from cs336_helper.floating_point.bfloat16 import float32_to_bfloat16
+from cs336_helper.floating_point.convert import float_to_bin, float_to_bin_and_decimal
+from cs336_helper.floating_point.formats import (
+    CLASSES,
+    available_formats,
+    classify,
+    code_ulp,
+    decode,
+    encode,
+    get_format,
+    register_format,
+    ulp,
+)
+
+
+def _random_float64(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal(n) * 10.0 ** rng.uniform(-50, 50, n)
+
+
+def test_builtin_formats_registered():
+    for name in ["float16", "bfloat16", "float32", "tfloat32", "float8_e4m3fn", "float8_e5m2", "float4_e2m1fn"]:
+        assert name in available_formats()
+    with pytest.raises(KeyError):
+        get_format("float7")
+
+
+@pytest.mark.parametrize("name, numpy_dtype, bits_dtype", [
+    ("float16", np.float16, np.uint16),
+    ("float32", np.float32, np.uint32),
+])
+def test_matches_numpy_casts(name, numpy_dtype, bits_dtype):
+    values = np.concatenate([_random_float64(100_000), [0.0, -0.0, np.inf, -np.inf, 65520.0, 65519.99]])
+    with np.errstate(over="ignore"):
+        expected = values.astype(numpy_dtype)
+    assert np.array_equal(encode(values, name), expected.view(bits_dtype))
+    assert np.array_equal(decode(encode(values, name), name), expected.astype(np.float64))
+
+
+def test_bfloat16_matches_kernel_for_float32_inputs():
+    values = _random_float64(100_000).astype(np.float32)
+    assert np.array_equal(encode(values, "bfloat16"), float32_to_bfloat16(values))
+
+
+@pytest.mark.parametrize("name", ["float16", "bfloat16", "tfloat32", "float8_e4m3fn", "float8_e5m2", "float4_e2m1fn"])
+def test_every_encoding_round_trips(name):
+    fmt = get_format(name)
+    codes = np.arange(1 << fmt.width, dtype=np.uint32)
+    values = decode(codes, fmt)
+    finite = ~np.isnan(values)
+    assert np.array_equal(encode(values[finite], fmt), codes[finite].astype(fmt.code_dtype))
+    assert np.all(np.isnan(decode(encode(values[~finite], fmt), fmt)))
+
+
+@pytest.mark.parametrize("name, value, code", [
+    ("float8_e4m3fn", 448.0, 0x7E),
+    ("float8_e4m3fn", 464.0, 0x7E),   # tie between 448 and the NaN slot rounds to even
+    ("float8_e4m3fn", 480.0, 0x7F),   # overflow is NaN, there is no infinity
+    ("float8_e4m3fn", np.inf, 0x7F),
+    ("float8_e4m3fn", -2.0**-9, 0x81),
+    ("float8_e5m2", 57344.0, 0x7B),
+    ("float8_e5m2", 61440.0, 0x7C),   # rounds up past the maximum to infinity
+    ("float8_e5m2", np.nan, 0x7E),
+    ("float4_e2m1fn", 2.5, 0x4),      # tie between 2 and 3 rounds to even
+    ("float4_e2m1fn", 100.0, 0x7),    # no infinity: clamps to 6
+    ("float4_e2m1fn", np.nan, 0x0),
+])
+def test_small_format_codes(name, value, code):
+    assert int(encode(value, name)) == code
+
+
+def test_saturation():
+    assert int(encode(1e6, "float8_e4m3fn", saturate=True)) == 0x7E
+    assert int(encode(-1e6, "float8_e5m2", saturate=True)) == 0xFB
+    assert int(encode(-np.inf, "float16", saturate=True)) == 0xFBFF
+
+
+def test_limits():
+    fp8 = get_format("float8_e4m3fn")
+    assert (fp8.max_finite, fp8.min_normal, fp8.min_subnormal) == (448.0, 2.0**-6, 2.0**-9)
+    assert get_format("float16").max_finite == 65504.0
+    assert get_format("float4_e2m1fn").max_finite == 6.0
+
+
+def test_custom_format_plugs_into_converters():
+    register_format("test_e3m2", 3, 2, bias=2)
+    try:
+        assert decode(encode([1.0, 0.25, 28.0], "test_e3m2"), "test_e3m2").tolist() == [1.0, 0.25, 28.0]
+        b, s, e, m, dec = float_to_bin_and_decimal(1.0, "test_e3m2")
+        assert (b, s, e, m, dec) == ("001000", 1, 3, 2, 1.0)
+        assert float_to_bin(1.0, "test_e3m2") == ("001000", 1, 3, 2)
+    finally:
+        del formats._REGISTRY["test_e3m2"]
+
+
+def test_invalid_formats():
+    with pytest.raises(ValueError):
+        register_format("bad", 4, 3, specials="saturating")
+    with pytest.raises(ValueError):
+        register_format("bad", 0, 3)
+    with pytest.raises(ValueError):
+        register_format("bad", 4, 0)
+
+
+@pytest.mark.parametrize("name", ["float16", "bfloat16", "float8_e4m3fn", "float8_e5m2", "float4_e2m1fn"])
+def test_classify_matches_decoded_values(name):
+    fmt = get_format(name)
+    codes = np.arange(1 << fmt.width)
+    values = decode(codes, fmt)
+    kind = np.array(CLASSES)[classify(codes, fmt)]
+    assert np.array_equal(kind == "nan", np.isnan(values))
+    assert np.array_equal(kind == "inf", np.isinf(values))
+    assert np.array_equal(kind == "zero", values == 0)
+    magnitude = np.abs(values)
+    assert np.all((magnitude[kind == "subnormal"] > 0) & (magnitude[kind == "subnormal"] < fmt.min_normal))
+    assert np.all(magnitude[kind == "normal"] >= fmt.min_normal)
+
+
+def test_code_ulp_matches_spacing_and_value_ulp():
+    payload = np.arange(1 << 16, dtype=np.uint32).astype(np.uint16)
+    values = payload.view(np.float16)
+    positive = (values > 0) & (values < np.float16(65504))
+    spacing = code_ulp(payload[positive], "float16")
+    assert np.array_equal(spacing, np.spacing(values[positive]).astype(np.float64))
+    assert np.array_equal(spacing, ulp(values[positive], "float16"))
+    assert np.isnan(code_ulp(np.float16([np.inf, np.nan]).view(np.uint16), "float16")).all()
+    e4m3 = get_format("float8_e4m3fn")
+    assert code_ulp(encode([0.0], e4m3), e4m3)[0] == 2.0 ** -9
+    assert np.isnan(code_ulp([e4m3.nan_code], e4m3)[0])
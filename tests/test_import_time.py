@@ -0,0 +1,56 @@
+import sys
+import os
+import json
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Budget for importing the converters in a fresh interpreter. The import
+# itself takes about a millisecond; the margin absorbs slow CI machines.
+IMPORT_BUDGET_SECONDS = 0.1
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import cs336_helper.floating_point
+from cs336_helper.floating_point.convert import float_to_bin, float_to_bin_and_decimal, format_bits
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "numpy": "numpy" in sys.modules,
+    "streamlit": "streamlit" in sys.modules,
+}))
+"""
+
+
+def _probe():
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def test_import_pulls_in_neither_numpy_nor_streamlit():
+    report = _probe()
+    assert not report["numpy"]
+    assert not report["streamlit"]
+
+
+def test_import_time_budget():
+    # Best of three to keep the benchmark robust against a cold disk cache.
+    elapsed = min(_probe()["elapsed"] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_SECONDS, f"import took {elapsed * 1000:.1f} ms"
+
+
+def test_lazy_attributes_resolve():
+    sys.path.insert(0, ROOT)
+    import cs336_helper.floating_point as fp
+
+    assert fp.float_to_bin(0.1, "float32")[0] == "00111101110011001100110011001101"
+    assert "float_to_bin_and_decimal_batch" in dir(fp)
+    try:
+        fp.not_a_name
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("unknown attribute should raise AttributeError")
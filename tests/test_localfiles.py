@@ -0,0 +1,43 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point.localfiles import ALLOW_ENV, DATA_DIR_ENV, local_files_allowed, resolve_data_path
+
+
+@pytest.mark.parametrize("value, allowed", [(None, False), ("", False), ("0", False), ("1", True), ("yes", True)])
+def test_local_files_are_off_by_default(monkeypatch, value, allowed):
+    if value is None:
+        monkeypatch.delenv(ALLOW_ENV, raising=False)
+    else:
+        monkeypatch.setenv(ALLOW_ENV, value)
+    assert local_files_allowed() is allowed
+
+
+def test_paths_stay_inside_the_data_directory(tmp_path, monkeypatch):
+    data = tmp_path / "data"
+    (data / "sub").mkdir(parents=True)
+    np.save(data / "sub" / "w.npy", np.ones(3))
+    (tmp_path / "secret.npy").write_bytes(b"")
+    (data / "escape.npy").symlink_to(tmp_path / "secret.npy")
+    monkeypatch.setenv(DATA_DIR_ENV, str(data))
+
+    expected = os.path.realpath(data / "sub" / "w.npy")
+    assert resolve_data_path("sub/w.npy") == expected
+    assert resolve_data_path(data / "sub" / "w.npy") == expected
+    assert resolve_data_path("sub/../sub/w.npy") == expected
+    for path in ["../secret.npy", str(tmp_path / "secret.npy"), "escape.npy", "/etc/passwd", "../data2/w.npy"]:
+        with pytest.raises(ValueError, match="outside the data directory"):
+            resolve_data_path(path)
+
+
+def test_data_directory_defaults_to_the_working_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv(DATA_DIR_ENV, raising=False)
+    monkeypatch.chdir(tmp_path)
+    assert resolve_data_path("w.npy") == os.path.join(os.path.realpath(tmp_path), "w.npy")
+    with pytest.raises(ValueError):
+        resolve_data_path("..")
@@ -0,0 +1,165 @@
+import sys
+import os
+import decimal
+import fractions
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point.formats import decode, encode, get_format
+from cs336_helper.floating_point.neighbors import (
+    NEIGHBOR_COLUMNS,
+    exact_difference,
+    jump,
+    neighbor_rows,
+    neighbors,
+    ordinals,
+    rounding_distance,
+    step,
+    ulp_distance,
+)
+
+ALL_FLOAT16 = np.arange(1 << 16, dtype=np.uint32).astype(np.uint16)
+
+
+def test_ordinals_follow_value_order():
+    values = ALL_FLOAT16.view(np.float16).astype(np.float64)
+    order = ordinals(ALL_FLOAT16, "float16")
+    assert np.array_equal(np.isnan(order), np.isnan(values))
+    finite = ~np.isnan(values)
+    by_ordinal = values[finite][np.argsort(order[finite], kind="stable")]
+    assert np.all(by_ordinal[:-1] <= by_ordinal[1:])
+    # Only the two zeros share an ordinal.
+    assert len(np.unique(order[finite])) == np.count_nonzero(finite) - 1
+
+
+def test_step_matches_nextafter():
+    values = ALL_FLOAT16.view(np.float16)
+    ok = np.isfinite(values)
+    codes = ALL_FLOAT16[ok]
+    with np.errstate(over="ignore"):
+        up = np.nextafter(values[ok], np.float16(np.inf))
+        down = np.nextafter(values[ok], np.float16(-np.inf))
+    assert np.array_equal(step(codes, "float16", 1).view(np.float16), up)
+    assert np.array_equal(step(codes, "float16", -1).view(np.float16), down)
+
+
+def test_step_saturates_and_keeps_nan():
+    inf, nan = np.float16(np.inf).view(np.uint16), np.float16(np.nan).view(np.uint16)
+    assert step([inf], "float16", 5)[0] == inf
+    assert step([nan], "float16", 5)[0] == nan
+    assert np.float16(-np.inf).view(np.uint16) == step([inf], "float16", -10**9)[0]
+
+    e4m3 = get_format("float8_e4m3fn")
+    top = encode([448.0], e4m3)
+    assert step(top, e4m3, 1)[0] == top[0]
+    assert decode(step(top, e4m3, -1), e4m3)[0] == 416.0
+    assert np.isnan(decode(step([e4m3.nan_code], e4m3, -1), e4m3)[0])
+
+
+@pytest.mark.parametrize("dtype, numpy_dtype", [("float16", np.float16), ("float32", np.float32)])
+def test_neighbors_bracket_the_input(dtype, numpy_dtype):
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.standard_normal(10_000) * 10.0 ** rng.uniform(-9, 4, 10_000), [0.0, 1.0, -2.5]])
+    found = neighbors(values, dtype)
+    below, nearest, above = found.values()
+    assert np.all(below <= values) and np.all(values <= above)
+    representable = nearest == values
+    assert np.all(below[representable] < values[representable])
+    assert np.all(above[representable] > values[representable])
+    # Non-representable inputs fall between two adjacent values.
+    gap = ~representable
+    adjacent = np.nextafter(below[gap].astype(numpy_dtype), numpy_dtype(np.inf))
+    assert np.array_equal(adjacent.astype(np.float64), above[gap])
+    assert np.all((nearest[gap] == below[gap]) | (nearest[gap] == above[gap]))
+
+
+@pytest.mark.parametrize("dtype", ["float8_e4m3fn", "float4_e2m1fn"])
+def test_neighbors_bracket_the_input_without_inf(dtype):
+    fmt = get_format(dtype)
+    top = fmt.max_finite
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.uniform(-2 * top, 2 * top, 10_000), [0.0, 1.0, -2.5, top, -top, 500.0, -1000.0]])
+    found = neighbors(values, dtype)
+    below, nearest, above = found.values()
+    inside = np.abs(values) < top
+    assert np.all(below[inside] <= values[inside]) and np.all(values[inside] <= above[inside])
+    representable = inside & (nearest == values)
+    assert np.all(below[representable] < values[representable])
+    assert np.all(above[representable] > values[representable])
+    gap = inside & ~representable
+    assert np.array_equal(decode(step(found.below[gap], dtype, 1), fmt), above[gap])
+    # Beyond the range both neighbours saturate at the largest finite value, even where it rounds to NaN.
+    beyond = np.abs(values) > top
+    assert np.array_equal(below[beyond], np.copysign(top, values[beyond]))
+    assert np.array_equal(above[beyond], below[beyond])
+    second = decode(step(encode([top], fmt), fmt, -1), fmt)[0]
+    assert decode(jump([500.0, -1000.0], dtype, [-2, 2]), fmt).tolist() == [second, -second]
+
+
+def test_neighbors_of_specials():
+    below, nearest, above = neighbors([0.0, -0.0, 1e5, np.inf, np.nan], "float16").values()
+    tiny = 2.0 ** -24
+    assert below[:2].tolist() == [-tiny, -tiny] and above[:2].tolist() == [tiny, tiny]
+    assert (below[2], nearest[2], above[2]) == (65504.0, np.inf, np.inf)
+    assert (below[3], above[3]) == (65504.0, np.inf)
+    assert np.isnan([below[4], nearest[4], above[4]]).all()
+
+
+def test_jump():
+    codes = jump([0.1, 0.1, 0.1, 1.0, 1.0], "float16", [1, -1, 0, 3, -2])
+    expected = [np.float16(0.1).astype(np.float64) + 2.0 ** -14, np.float16(0.1), np.float16(0.1),
+                1.0 + 3 * 2.0 ** -10, 1.0 - 2 * 2.0 ** -11]
+    assert decode(codes, "float16").tolist() == [float(v) for v in expected]
+
+
+def test_ulp_distance():
+    one = np.float32(1.0)
+    further = np.nextafter(np.nextafter(one, np.float32(2)), np.float32(2))
+    assert ulp_distance([1.0, float(further)], [float(further), 1.0], "float32").tolist() == [2.0, -2.0]
+    assert ulp_distance([-0.0], [0.0], "float16")[0] == 0
+    assert ulp_distance([-(2.0 ** -24)], [2.0 ** -24], "float16")[0] == 2
+    assert np.isnan(ulp_distance([np.nan, 1.0], [1.0, np.nan], "bfloat16")).all()
+
+
+def test_rounding_distance_matches_float32_bit_arithmetic():
+    rng = np.random.default_rng(1)
+    values = rng.standard_normal(200_000) * 10.0 ** rng.uniform(-6, 4, 200_000)
+    distance = rounding_distance(values, "float16", "bfloat16", unit="float32")
+
+    def float32_ordinal(x):
+        bits = np.asarray(x, dtype=np.float32).view(np.int32).astype(np.int64)
+        return np.where(bits < 0, -(bits & 0x7FFFFFFF), bits)
+
+    from cs336_helper.floating_point.bfloat16 import bfloat16_to_float32, float32_to_bfloat16
+    f16 = values.astype(np.float16).astype(np.float32)
+    bf16 = bfloat16_to_float32(float32_to_bfloat16(values))
+    assert np.array_equal(distance, (float32_ordinal(bf16) - float32_ordinal(f16)).astype(np.float64))
+    # In float16's normal range a bfloat16 rounding is at most half a bfloat16 ULP (4 float16 ULPs) away.
+    normal = (np.abs(values) > 2.0 ** -14) & (np.abs(values) < 60000)
+    assert np.abs(rounding_distance(values[normal], "float16", "bfloat16")).max() <= 4
+
+
+def test_exact_difference():
+    difference = exact_difference(float(np.float16(0.1)), 0.1)
+    # 0.1 is 0.1000000000000000055511151231257827021181583404541015625 in float64.
+    assert difference == decimal.Decimal("0.0000244140625000055511151231257827021181583404541015625")
+    assert exact_difference(np.inf, np.inf).is_nan()
+    for a, b in [(5e-324, 1.7976931348623157e308), (-1.7976931348623157e308, 2.2250738585072014e-308)]:
+        assert fractions.Fraction(exact_difference(a, b)) == fractions.Fraction(b) - fractions.Fraction(a)
+
+
+def test_neighbor_rows():
+    rows = neighbor_rows(0.1, ["float16", "float4_e2m1fn"])
+    assert [tuple(row) for row in rows] == [NEIGHBOR_COLUMNS] * 2
+    assert rows[0]["Previous"] == rows[0]["Nearest"] == "0.0999755859375"
+    assert rows[0]["ULP"] == repr(2.0 ** -14)
+    assert rows[1]["Next"] == "0.5"
+    assert neighbor_rows(np.inf, ["float16"])[0]["Distance to next"] == "-"
+    # Nothing lies above 500 in either format; float8_e4m3fn rounds it to NaN.
+    e4m3, fp4 = neighbor_rows(500.0, ["float8_e4m3fn", "float4_e2m1fn"])
+    assert (e4m3["Previous"], e4m3["Nearest"], e4m3["Next"]) == ("448.0", "nan", "-")
+    assert (fp4["Previous"], fp4["Nearest"], fp4["Next"], fp4["Distance to next"]) == ("6.0", "6.0", "-", "-")
+    assert fp4["Distance to previous"] == "4.94e+2"
@@ -0,0 +1,62 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point.analyzer import analyze_array
+from cs336_helper.floating_point.parallel import _shard_bounds, parallel_analyze
+
+
+def _weights(n=50_000):
+    rng = np.random.default_rng(1)
+    values = (rng.standard_normal(n) * 10.0 ** rng.uniform(-9, 6, n)).astype(np.float32)
+    values[:3] = [np.nan, np.inf, 1e5]
+    return values
+
+
+def _assert_identical(a, b):
+    assert (a.count, a.nan) == (b.count, b.nan)
+    for dtype in a.formats:
+        x, y = a.formats[dtype], b.formats[dtype]
+        assert np.array_equal(x.exponent_hist, y.exponent_hist)
+        assert (x.subnormal, x.overflow, x.underflow) == (y.subnormal, y.overflow, y.underflow)
+        assert x.inexact == y.inexact
+        assert x.max_rel_error == y.max_rel_error
+        assert x.mean_rel_error == y.mean_rel_error
+        assert x.rel_error_count == y.rel_error_count
+
+
+def test_shard_bounds_follow_chunks():
+    bounds = _shard_bounds(10_500, 1000, 4)
+    assert bounds[0][0] == 0 and bounds[-1][1] == 10_500
+    assert all(start % 1000 == 0 for start, _ in bounds)
+    assert all(a[1] == b[0] for a, b in zip(bounds, bounds[1:]))
+
+
+def test_shared_memory_array_matches_serial():
+    values = _weights().reshape(500, 100)
+    serial = analyze_array(values, chunk_size=4096)
+    _assert_identical(parallel_analyze(values, workers=2, chunk_size=4096), serial)
+
+
+@pytest.mark.parametrize("open_as", ["path", "memmap", "npy"])
+def test_file_sources_match_serial(tmp_path, open_as):
+    values = _weights()
+    serial = analyze_array(values, chunk_size=4096)
+    if open_as == "npy":
+        path = tmp_path / "weights.npy"
+        np.save(path, values)
+        source = np.load(path, mmap_mode="r")
+    else:
+        path = tmp_path / "weights.bin"
+        values.tofile(path)
+        source = path if open_as == "path" else np.memmap(path, dtype=np.float32, mode="r")
+    _assert_identical(parallel_analyze(source, workers=3, chunk_size=4096), serial)
+
+
+def test_single_worker_runs_in_process():
+    values = _weights(5000)
+    _assert_identical(parallel_analyze(values, workers=1, chunk_size=512), analyze_array(values, chunk_size=512))
@@ -0,0 +1,152 @@
+import sys
+import os
+import json
+import struct
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point import profiler
+from cs336_helper.floating_point.analyzer import analyze_array
+from cs336_helper.floating_point.bfloat16 import float32_to_bfloat16
+from cs336_helper.floating_point.profiler import (
+    cached_profile,
+    clear_profile_cache,
+    profile_file,
+    profile_rows,
+    read_index,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_profile_cache()
+    yield
+    clear_profile_cache()
+
+
+def _tensors():
+    rng = np.random.default_rng(0)
+    return {
+        "embed.weight": (rng.standard_normal((64, 32)) * 1e3).astype(np.float32),
+        "norm.scale": (rng.standard_normal(100) * 1e-6).astype(np.float16),
+        "big": np.array([1e5, -7e4, 1.0], dtype=np.float64),
+    }
+
+
+def _write_safetensors(path, tensors, extra=None):
+    codes = {"float32": "F32", "float16": "F16", "float64": "F64", "int64": "I64"}
+    header, blobs, offset = {"__metadata__": {"format": "pt"}}, [], 0
+    for name, array in {**tensors, **(extra or {})}.items():
+        dtype = "BF16" if name.endswith(".bf16") else codes[array.dtype.name]
+        data = array.astype(array.dtype.newbyteorder("<")).tobytes()
+        header[name] = {"dtype": dtype, "shape": list(array.shape), "data_offsets": [offset, offset + len(data)]}
+        blobs.append(data)
+        offset += len(data)
+    encoded = json.dumps(header).encode()
+    with open(path, "wb") as f:
+        f.write(struct.pack("<Q", len(encoded)) + encoded + b"".join(blobs))
+
+
+def _assert_matches(profile, tensors):
+    assert [t.name for t in profile.tensors] == list(tensors)
+    for tensor, array in zip(profile.tensors, tensors.values()):
+        expected = analyze_array(array, targets=profiler.PROFILE_TARGETS)
+        assert tensor.shape == array.shape
+        assert tensor.stats.count == expected.count
+        for dtype in profiler.PROFILE_TARGETS:
+            got, want = tensor.stats.formats[dtype], expected.formats[dtype]
+            assert np.array_equal(got.exponent_hist, want.exponent_hist)
+            assert (got.overflow, got.underflow, got.subnormal, got.inexact) == \
+                (want.overflow, want.underflow, want.subnormal, want.inexact)
+            assert got.mean_rel_error == want.mean_rel_error
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_npz(tmp_path, compressed):
+    tensors = _tensors()
+    path = tmp_path / "model.npz"
+    (np.savez_compressed if compressed else np.savez)(path, **tensors, steps=np.arange(3))
+    entries, skipped = read_index(path)
+    assert skipped == ["steps"]
+    assert entries[0].location[0] == ("npz" if compressed else "raw")
+    profile = profile_file(path)
+    _assert_matches(profile, tensors)
+    assert profile.tensors[2].stats.formats["float16"].overflow == 2
+
+
+def test_safetensors_with_bfloat16(tmp_path):
+    tensors = _tensors()
+    bf16 = float32_to_bfloat16(np.array([1.0, 3e38, -2.5e-39], dtype=np.float32))
+    path = tmp_path / "model.safetensors"
+    _write_safetensors(path, tensors, {"w.bf16": bf16, "ids": np.arange(4)})
+    profile = profile_file(path)
+    assert profile.skipped == ["ids"]
+    _assert_matches(profile, {**tensors, "w.bf16": bf16})
+    assert profile.tensors[3].dtype == "bfloat16"
+    assert profile.tensors[3].stats.formats["float16"].overflow == 1
+    assert profile.total.count == sum(a.size for a in tensors.values()) + 3
+    rows = profile_rows(profile)
+    assert rows[-1]["Tensor"] == "(all tensors)"
+    assert rows[2]["fp16 overflow"] == "66.7%"
+
+
+def test_profiles_are_cached_until_the_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "model.safetensors"
+    _write_safetensors(path, _tensors())
+    assert cached_profile(path) is None
+    first = profile_file(path)
+    calls = []
+    monkeypatch.setattr(profiler, "parallel_analyze", lambda *a, **k: calls.append(a) or analyze_array(a[0]))
+    assert profile_file(path, workers=2) is first
+    assert cached_profile(path) is first
+    assert calls == []
+
+    _write_safetensors(path, {"only": np.ones(3, dtype=np.float32)})
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+    assert cached_profile(path) is None
+
+
+def test_parallel_profile_matches_serial(tmp_path):
+    import multiprocessing
+
+    tensors = {"w": np.random.default_rng(1).standard_normal(50_000).astype(np.float32)}
+    path = tmp_path / "model.npz"
+    np.savez(path, **tensors)
+    profile = profile_file(path, workers=2, chunk_size=4096, mp_context=multiprocessing.get_context("spawn"))
+    serial = analyze_array(tensors["w"], chunk_size=4096, targets=profiler.PROFILE_TARGETS)
+    assert profile.tensors[0].stats.formats["bfloat16"].mean_rel_error == serial.formats["bfloat16"].mean_rel_error
+
+
+def test_rejects_files_that_are_not_checkpoints(tmp_path):
+    npy = tmp_path / "x.npy"
+    np.save(npy, np.ones(3))
+    text = tmp_path / "x.txt"
+    text.write_text("hello world, this is not a checkpoint\n")
+    tiny = tmp_path / "tiny"
+    tiny.write_bytes(b"abc")
+    for path in (npy, text, tiny):
+        with pytest.raises(ValueError):
+            profile_file(path)
+
+    not_object = tmp_path / "list.safetensors"
+    header = b"[1, 2]"
+    not_object.write_bytes(struct.pack("<Q", len(header)) + header)
+    with pytest.raises(ValueError, match="header"):
+        read_index(not_object)
+
+
+def test_rejects_tensors_outside_the_file(tmp_path):
+    path = tmp_path / "model.safetensors"
+    _write_safetensors(path, {"w": np.ones(100, dtype=np.float32)})
+    data = path.read_bytes()
+    path.write_bytes(data[:-8])  # truncated
+    with pytest.raises(ValueError, match="outside the file"):
+        read_index(path)
+
+    header = json.dumps({"w": {"dtype": "F32", "shape": [1000], "data_offsets": [0, 400]}}).encode()
+    path.write_bytes(struct.pack("<Q", len(header)) + header + b"\0" * 400)
+    with pytest.raises(ValueError, match="does not match"):
+        read_index(path)
@@ -0,0 +1,175 @@
+import sys
+import os
+import io
+import json
+import socket
+import threading
+import http.client
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point.convert import float_to_bin_and_decimal
+from cs336_helper.floating_point.service import convert_stream, iter_value_chunks, make_server
+
+
+def _convert(data, **kwargs):
+    out = io.BytesIO()
+    count = convert_stream(io.BytesIO(data), out, **kwargs)
+    rows = [json.loads(line) for line in out.getvalue().decode().splitlines()]
+    assert count == len(rows)
+    return rows
+
+
+def test_text_input_matches_scalar_converter():
+    rows = _convert(b"0.1 -2.5\n1e-7\n\n65519\n", dtypes=["float16", "bfloat16", "float32"])
+    assert [row["value"] for row in rows] == [0.1, -2.5, 1e-7, 65519.0]
+    for row in rows:
+        for dtype in ["float16", "bfloat16", "float32"]:
+            bits, _, exp_len, mant_len, decimal = float_to_bin_and_decimal(row["value"], dtype)
+            field = row[dtype]
+            assert field["bits"] == bits
+            assert field["sign"] == int(bits[0])
+            assert field["exponent"] == int(bits[1:1 + exp_len], 2)
+            assert field["mantissa"] == int(bits[1 + exp_len:], 2)
+            assert field["decimal"] == (decimal if np.isfinite(decimal) else str(decimal))
+
+
+def test_ndjson_and_special_values():
+    rows = _convert(b'1.5\n[2, "nan"]\n"-inf"\n', dtypes=["float16"], input_format="ndjson")
+    assert [row["value"] for row in rows] == [1.5, 2.0, "nan", "-inf"]
+    assert rows[1]["float16"]["bits"] == "0100000000000000"
+    assert rows[2]["float16"]["decimal"] == "nan"
+
+
+def test_text_on_one_line_is_chunked(monkeypatch):
+    from cs336_helper.floating_point import service
+
+    monkeypatch.setattr(service, "TEXT_BLOCK_SIZE", 7)  # cuts numbers across blocks
+    values = np.random.default_rng(0).standard_normal(20_000)
+    text = " ".join(map(repr, values.tolist())).encode()
+    chunks = list(iter_value_chunks(io.BytesIO(text), "text", 1000))
+    assert [len(chunk) for chunk in chunks] == [1000] * 20
+    assert np.array_equal(np.concatenate(chunks), values)
+    with pytest.raises(ValueError, match="Not a number"):
+        list(iter_value_chunks(io.BytesIO(b"1.0 abc 2.0"), "text", 1000))
+
+
+@pytest.mark.parametrize("input_format, dtype", [("f32", "<f4"), ("f64", "<f8")])
+def test_binary_input_in_small_chunks(input_format, dtype):
+    values = np.random.default_rng(0).standard_normal(1000).astype(dtype)
+    chunks = list(iter_value_chunks(io.BufferedReader(io.BytesIO(values.tobytes()), 7), input_format, 64))
+    assert max(len(chunk) for chunk in chunks) == 64
+    assert np.array_equal(np.concatenate(chunks), values.astype(np.float64))
+    rows = _convert(values.tobytes(), dtypes=["bfloat16"], input_format=input_format, chunk_size=64)
+    assert len(rows) == 1000
+
+
+def test_bad_input():
+    with pytest.raises(ValueError):
+        _convert(b"\x00" * 5, input_format="f32")
+    with pytest.raises(ValueError):
+        _convert(b"1.0", dtypes=["float7"])
+    with pytest.raises(ValueError):
+        _convert(b"1.0", input_format="csv")
+    for line in (b"null", b'{"value": 1}', b"[1, [2]]", b"true", b'"abc"', b"1" * 400):
+        with pytest.raises(ValueError, match="Not a number"):
+            _convert(b"1.5\n" + line + b"\n", input_format="ndjson")
+
+
+@pytest.fixture
+def server():
+    server = make_server(port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_keep_alive_and_concurrency(server):
+    port = server.server_port
+
+    def post(conn, body, query="dtype=float16&format=text"):
+        conn.request("POST", f"/convert?{query}", body=body)
+        response = conn.getresponse()
+        return response.status, response.read().decode()
+
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    status, text = post(conn, b"1.0 2.0")
+    assert status == 200
+    assert [json.loads(line)["float16"]["decimal"] for line in text.splitlines()] == [1.0, 2.0]
+    status, text = post(conn, np.array([0.5], "<f4").tobytes(), "dtype=bfloat16&format=f32")
+    assert json.loads(text)["bfloat16"]["bits"] == "0011111100000000"
+    assert post(conn, b"1", "dtype=float7")[0] == 400
+    conn.request("GET", "/health")
+    assert conn.getresponse().read() == b"ok\n"
+    conn.close()
+
+    results = [None] * 8
+
+    def worker(i):
+        c = http.client.HTTPConnection("127.0.0.1", port)
+        results[i] = post(c, " ".join(str(x) for x in range(i * 100, i * 100 + 100)).encode())
+        c.close()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for i, (status, text) in enumerate(results):
+        assert status == 200
+        assert json.loads(text.splitlines()[0])["value"] == i * 100
+
+
+def _read_chunked_response(stream):
+    assert stream.readline().startswith(b"HTTP/1.1 200")
+    while stream.readline() != b"\r\n":
+        pass
+    body = b""
+    while True:
+        size = int(stream.readline(), 16)
+        body += stream.read(size + 2)[:size]
+        if size == 0:
+            return body.decode()
+
+
+def test_http_pipelined_chunked_requests(server):
+    request = (
+        b"POST /convert?dtype=float32 HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"3\r\n1.5\r\n2\r\n 3\r\n0\r\n\r\n"
+    )
+    with socket.create_connection(("127.0.0.1", server.server_port)) as sock:
+        sock.sendall(request * 2)  # second request sent before the first response is read
+        stream = sock.makefile("rb")
+        for _ in range(2):
+            lines = _read_chunked_response(stream).splitlines()
+            assert [json.loads(line)["float32"]["decimal"] for line in lines] == [1.5, 3.0]
+
+
+def test_http_malformed_chunked_body(server):
+    request = (
+        b"POST /convert?dtype=float32 HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"3\r\n1.5\r\nzz\r\n 3\r\n0\r\n\r\n"
+    )
+    with socket.create_connection(("127.0.0.1", server.server_port)) as sock:
+        sock.settimeout(10)
+        sock.sendall(request)
+        stream = sock.makefile("rb")
+        lines = _read_chunked_response(stream).splitlines()
+        assert "Malformed chunk size" in json.loads(lines[-1])["error"]
+        assert stream.read() == b""  # the server closed the connection
+
+
+@pytest.mark.parametrize("length", [b"abc", b"-5", b"+5", b"1_0"])
+def test_http_invalid_content_length(server, length):
+    request = b"POST /convert?dtype=float32 HTTP/1.1\r\nHost: x\r\nContent-Length: " + length + b"\r\n\r\n1.5"
+    with socket.create_connection(("127.0.0.1", server.server_port)) as sock:
+        sock.settimeout(10)
+        sock.sendall(request)
+        response = sock.makefile("rb").read()  # the server closes the connection
+    assert response.startswith(b"HTTP/1.1 400")
+    assert b"Invalid Content-Length" in response
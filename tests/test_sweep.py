@@ -0,0 +1,47 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point.sweep import error_sweep, ulp
+
+
+@pytest.mark.parametrize("dtype, mant_bits", [("float16", 10), ("bfloat16", 7), ("float8_e4m3fn", 3)])
+def test_exhaustive_sweep_worst_case_error(dtype, mant_bits):
+    sweep = error_sweep(dtype)
+    normal = (sweep.x >= sweep.min_normal) & (sweep.x <= sweep.max_finite)
+    half_ulp = 2.0 ** -(mant_bits + 1)
+    # The worst case sits just above a power of two: half an ULP relative to 1 + half an ULP.
+    assert sweep.rel_error[normal].max() == pytest.approx(half_ulp / (1 + half_ulp))
+    # Every sample is a midpoint, so every error is exactly half an ULP.
+    assert np.array_equal(sweep.abs_error, sweep.ulp / 2)
+
+
+def test_sweep_boundaries():
+    sweep = error_sweep("float16")
+    assert (sweep.min_subnormal, sweep.min_normal, sweep.max_finite) == (2.0**-24, 2.0**-14, 65504.0)
+    assert sweep.overflow_threshold == 65520.0
+    assert len(sweep.x) == 0x7BFF - 1
+
+
+def test_log_spaced_sweep_covers_underflow_and_overflow():
+    sweep = error_sweep("float16", 10_000)
+    assert len(sweep.x) == 10_000
+    assert sweep.x[0] < sweep.min_subnormal and sweep.x[-1] > sweep.overflow_threshold
+    assert np.all(np.isinf(sweep.rel_error[sweep.x > sweep.overflow_threshold]))
+    assert np.all(sweep.rel_error[sweep.x < sweep.min_subnormal / 2] == 1.0)
+    assert len(error_sweep("float32").x) == 1 << 16
+
+
+def test_sweeps_are_cached_and_read_only():
+    sweep = error_sweep("bfloat16")
+    assert error_sweep("bfloat16") is sweep
+    with pytest.raises(ValueError):
+        sweep.rel_error[0] = 0
+
+
+def test_ulp():
+    assert ulp([1.0, 1.5, 2.0, 65504.0, 1e-6], "float16").tolist() == [2.0**-10, 2.0**-10, 2.0**-9, 32.0, 2.0**-24]
@@ -0,0 +1,66 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point.batch import bit_strings
+from cs336_helper.floating_point.tables import (
+    CLASSES,
+    classify_payloads,
+    decode_payloads,
+    lookup_table,
+)
+
+
+def test_bit_strings():
+    assert bit_strings(np.array([5, 0xFFFF], dtype=np.uint16), 16).tolist() == [
+        "0000000000000101",
+        "1111111111111111",
+    ]
+    assert bit_strings(np.uint32(0x3DCCCCCD), 32) == "00111101110011001100110011001101"
+
+
+@pytest.mark.parametrize("dtype", ["float16", "bfloat16"])
+def test_table_is_cached_and_read_only(dtype):
+    table = lookup_table(dtype)
+    assert lookup_table(dtype) is table
+    assert len(table.value) == 65536
+    with pytest.raises(ValueError):
+        table.value[0] = 1
+
+
+@pytest.mark.parametrize("dtype, payload, value, kind, ulp, fields", [
+    ("float16", 0x3C00, 1.0, "normal", 2.0**-10, ("0", "01111", "0000000000")),
+    ("float16", 0x0001, 2.0**-24, "subnormal", 2.0**-24, ("0", "00000", "0000000001")),
+    ("float16", 0x7BFF, 65504.0, "normal", 32.0, ("0", "11110", "1111111111")),
+    ("float16", 0x8000, -0.0, "zero", 2.0**-24, ("1", "00000", "0000000000")),
+    ("float16", 0xFC00, float("-inf"), "inf", float("nan"), ("1", "11111", "0000000000")),
+    ("bfloat16", 0x3F80, 1.0, "normal", 2.0**-7, ("0", "01111111", "0000000")),
+    ("bfloat16", 0x3DCD, 0.10009765625, "normal", 2.0**-11, ("0", "01111011", "1001101")),
+    ("bfloat16", 0x0001, 2.0**-133, "subnormal", 2.0**-133, ("0", "00000000", "0000001")),
+    ("bfloat16", 0x7F80, float("inf"), "inf", float("nan"), ("0", "11111111", "0000000")),
+])
+def test_table_entries(dtype, payload, value, kind, ulp, fields):
+    table = lookup_table(dtype)
+    assert float(table.value[payload]) == value
+    assert np.signbit(table.value[payload]) == np.signbit(value)
+    assert CLASSES[table.kind[payload]] == kind
+    assert table.ulp[payload] == ulp or (np.isnan(ulp) and np.isnan(table.ulp[payload]))
+    assert (table.sign[payload], table.exponent[payload], table.mantissa[payload]) == fields
+    assert table.bits[payload] == "".join(fields)
+
+
+def test_nan_payloads():
+    for dtype in ("float16", "bfloat16"):
+        nan = np.isnan(lookup_table(dtype).value.astype(np.float32))
+        assert np.array_equal(nan, classify_payloads(np.arange(65536), dtype) == CLASSES.index("nan"))
+
+
+def test_decode_payloads_gathers():
+    payload = np.array([[0x3C00, 0xC100], [0x0000, 0x7BFF]], dtype=np.uint16)
+    assert np.array_equal(decode_payloads(payload, "float16"), payload.view(np.float16))
+    with pytest.raises(ValueError):
+        lookup_table("float32")
@@ -0,0 +1,146 @@
+import sys
+import os
+import json
+import threading
+import urllib.request
+import pytest
+import numpy as np
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cs336_helper.floating_point import cache, comparison, timing
+
+
+@pytest.fixture
+def timed():
+    was = timing.enabled()
+    timing.enable()
+    timing.reset()
+    yield
+    timing.enable(was)
+    timing.reset()
+
+
+def test_disabled_stage_is_a_shared_noop():
+    was = timing.enabled()
+    timing.enable(False)
+    try:
+        timing.reset()
+        assert timing.stage("conversion") is timing.stage("formatting")
+        timing.begin_run("explorer")
+        with timing.stage("conversion"):
+            pass
+        assert timing.end_run() is None
+        assert timing.snapshot()["stages"] == {}
+    finally:
+        timing.enable(was)
+
+
+def test_stages_are_recorded_per_run_and_in_totals(timed):
+    timing.begin_run("explorer")
+    for _ in range(3):
+        with timing.stage("conversion"):
+            pass
+    with timing.stage("table"):
+        pass
+    run = timing.end_run()
+    assert run["page"] == "explorer"
+    assert run["stages"]["conversion"]["calls"] == 3
+    assert run["stages"]["table"]["calls"] == 1
+    assert run["seconds"] >= run["stages"]["conversion"]["seconds"]
+
+    # Outside a run, stages still count towards the totals only.
+    with timing.stage("conversion"):
+        pass
+    data = timing.snapshot()
+    assert data["stages"]["conversion"]["calls"] == 4
+    assert data["reruns"]["explorer"]["count"] == 1
+    assert data["recent"] == [run]
+    rows = timing.run_rows(run)
+    assert rows[-1]["Stage"] == "(whole rerun)"
+    assert {row["Stage"] for row in rows[:-1]} == {"conversion", "table"}
+
+
+def test_runs_are_tracked_per_thread(timed):
+    def other_session():
+        with timing.stage("formatting"):
+            pass
+
+    timing.begin_run("main")
+    worker = threading.Thread(target=other_session)
+    worker.start()
+    worker.join()
+    run = timing.end_run()
+    assert run["stages"] == {}
+    assert timing.snapshot()["stages"]["formatting"]["calls"] == 1
+
+
+def test_library_stages(timed):
+    cache.configure_cache(16)
+    cache._special_rows.cache_clear()
+    timing.begin_run("explorer")
+    cache.comparison_row(0.1, "float16")
+    cache.comparison_row(0.1, "float16")  # cached: no new conversion
+    cache.special_value_rows(("float16",))
+    table = comparison.ComparisonTable(np.array([1.0, 2.0]), ("bfloat16",))
+    table.page(0, 10)
+    stages = timing.end_run()["stages"]
+    assert stages["conversion"]["calls"] == 2
+    assert stages["formatting"]["calls"] == 2
+    assert stages["special values"]["calls"] == 1
+    cache.configure_cache(cache.DEFAULT_CACHE_SIZE)
+
+
+def test_prometheus_text(timed):
+    with timing.stage('odd "name"'):
+        pass
+    text = timing.prometheus_text()
+    assert "# TYPE cs336_stage_seconds_total counter" in text
+    assert 'cs336_stage_calls_total{stage="odd \\"name\\""} 1' in text
+
+
+def test_metrics_server(timed):
+    with timing.stage("table"):
+        pass
+    server = timing.make_metrics_server(port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        base = f"http://127.0.0.1:{server.server_port}"
+        with urllib.request.urlopen(base + "/metrics.json") as response:
+            assert json.load(response)["stages"]["table"]["calls"] == 1
+        with urllib.request.urlopen(base + "/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert b'cs336_stage_calls_total{stage="table"} 1' in response.read()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_start_metrics_server_on_a_busy_port(monkeypatch):
+    monkeypatch.setattr(timing, "_server", None)
+    monkeypatch.setattr(timing, "_server_error", None)
+    busy = timing.make_metrics_server(port=0)
+    attempts = []
+    real = timing.make_metrics_server
+    monkeypatch.setattr(timing, "make_metrics_server", lambda *a: attempts.append(a) or real(*a))
+    try:
+        for _ in range(3):
+            with pytest.raises(OSError):
+                timing.start_metrics_server(busy.server_port)
+        assert len(attempts) == 1
+    finally:
+        busy.server_close()
+
+
+def test_start_metrics_server_once(monkeypatch):
+    monkeypatch.setattr(timing, "_server", None)
+    monkeypatch.setattr(timing, "_server_error", None)
+    server = timing.start_metrics_server(0)
+    try:
+        assert timing.start_metrics_server(0) is server
+        assert server.allow_reuse_address
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,52 @@
+import sys
+import os
+
+# Add the parent directory to the path so we can import the app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.conversions import startup_benchmark
+from cs336_helper.floating_point import cache, formats, tables, timing, warmup
+
+
+def test_warm_up_fills_the_process_caches(monkeypatch):
+    monkeypatch.setattr(warmup, "_timings", None)
+    cache.configure_cache(cache.DEFAULT_CACHE_SIZE)
+    cache._special_rows.cache_clear()
+    tables.lookup_table.cache_clear()
+    formats._decode_table.cache_clear()
+
+    timings = warmup.warm_up()
+    assert [name for name, _ in warmup.STEPS] == list(timings)
+    assert tables.lookup_table.cache_info().currsize == len(tables.TABLE_DTYPES)
+    assert cache.cache_info().currsize == len(warmup.WARM_DTYPES)
+    small = [name for name in formats.available_formats() if formats.get_format(name).width <= 16]
+    assert formats._decode_table.cache_info().currsize == len(small)
+    assert "pandas" in sys.modules
+
+    # The explorer's first rerun now converts nothing.
+    was = timing.enabled()
+    timing.enable()
+    try:
+        timing.begin_run("explorer")
+        for dtype in warmup.WARM_DTYPES:
+            cache.comparison_row(warmup.WARM_VALUE, dtype)
+        cache.special_value_rows()
+        assert timing.end_run()["stages"] == {}
+    finally:
+        timing.enable(was)
+        timing.reset()
+
+
+def test_warm_up_runs_once(monkeypatch):
+    warmup.warm_up()
+    calls = []
+    monkeypatch.setattr(warmup, "STEPS", (("probe", lambda: calls.append(1)),))
+    assert "probe" not in warmup.warm_up()
+    assert calls == []
+
+
+def test_cold_vs_warm_start():
+    """First explorer run in a fresh interpreter, with and without the warm-up."""
+    results = startup_benchmark(repeat=2)
+    cold, warm = results["startup/explorer/cold"], results["startup/explorer/warm"]
+    assert warm < cold, f"explorer first run: cold {cold * 1e3:.0f} ms, warm {warm * 1e3:.0f} ms"